@@ -6,47 +6,60 @@
 # -------------------- Import Required Libraries ---------------------
 import numpy as np                  # For numerical calculations and arrays
 import matplotlib.pyplot as plt     # For plotting graphs
+from cst305.matexp import MatrixExponential  # x(t) = e^(At) C for whole time grids
+from cst305.render import showOrSave  # plt.show() or save when headless
 # --------------------------------------------------------------------
 
 
-# ------------------------ Create Time Values -------------------------
-# Generate 1000 evenly spaced values from -0.5 to 1.5
-t = np.linspace(-0.5, 1.5, 1000)
-# --------------------------------------------------------------------
+# ------------------------- Plot Program -----------------------------
+# Computes both curves and plots them (run as a script)
+def main():
+    # ------------------------ Create Time Values -------------------------
+    # Generate 1000 evenly spaced values from -0.5 to 1.5
+    t = np.linspace(-0.5, 1.5, 1000)
+    # --------------------------------------------------------------------
 
 
-# ---------------------- Calculate Function Values -------------------
-# e^(-5t) decays quickly as t increases
-ans1 = np.exp(-5 * t)
+    # ---------------------- Calculate Function Values -------------------
+    # x(t) = e^(At) C with A = [-5]: one column of C per curve, C = 1 gives
+    # e^(-5t), which decays quickly as t increases, and C = -1 gives
+    # -e^(-5t), the flipped version across the x-axis. The same call takes
+    # any n x n matrix A and many initial vectors at once.
+    A = np.array([[-5.0]])
+    C = np.array([[1.0, -1.0]])
+    x = MatrixExponential(A).apply(t, C)
+    ans1 = x[:, 0, 0]
+    ans2 = x[:, 0, 1]
+    # --------------------------------------------------------------------
 
-# -e^(-5t) is just the flipped version across the x-axis
-ans2 = -ans1
-# --------------------------------------------------------------------
 
+    # -------------------------- Plot the Graphs --------------------------
+    plt.figure(figsize=(10, 6))  # Set figure size
 
-# -------------------------- Plot the Graphs --------------------------
-plt.figure(figsize=(10, 6))  # Set figure size
+    # Plot e^(-5t) in blue
+    plt.plot(t, ans1, label='e^(-5t)', color='blue')
 
-# Plot e^(-5t) in blue
-plt.plot(t, ans1, label='e^(-5t)', color='blue')
+    # Plot -e^(-5t) in orange
+    plt.plot(t, ans2, label='-e^(-5t)', color='orange')
 
-# Plot -e^(-5t) in orange
-plt.plot(t, ans2, label='-e^(-5t)', color='orange')
+    # Add labels and title
+    plt.xlabel('t')
+    plt.ylabel('Function Value')
+    plt.title('x(t) = e^(At) * C')
 
-# Add labels and title
-plt.xlabel('t')
-plt.ylabel('Function Value')
-plt.title('x(t) = e^(At) * C')
+    # Add legend to distinguish curves
+    plt.legend()
 
-# Add legend to distinguish curves
-plt.legend()
+    # Set vertical limits of the y-axis
+    plt.ylim(-3, 3)
 
-# Set vertical limits of the y-axis
-plt.ylim(-3, 3)
+    # Show gridlines for better visibility
+    plt.grid()
 
-# Show gridlines for better visibility
-plt.grid()
+    # Show the final graph
+    showOrSave('exponential_decay')
+    # --------------------------------------------------------------------
 
-# Show the final graph
-plt.show()
-# --------------------------------------------------------------------
+
+if __name__ == "__main__":
+    main()
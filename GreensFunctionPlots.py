@@ -2,11 +2,15 @@
 # CST 305 – Project 3: Green's Function and Homogeneous ODE Visualization
 # This script compares homogeneous solutions (zero due to constants) and
 # particular solutions using analytical expressions (Green's function style).
+# ODE 1: y'' + 4y = t      ODE 2: y'' + y = 4
+# Both are solved numerically by convolving the forcing with each system's
+# impulse response (cst305/greens.py) and checked against b1 and b2.
 
 # ------------------- Import Required Libraries -------------------
 import numpy as np                  # For numerical operations and time values
 import matplotlib.pyplot as plt     # For plotting graphs
-from scipy.integrate import odeint  # For solving ODEs numerically (not heavily used here)
+from cst305.greens import GreensSolver  # Green's function (FFT convolution) solver
+from cst305.render import showOrSave  # plt.show() or save when headless
 # -----------------------------------------------------------------
 
 
@@ -26,10 +30,10 @@ a = b = c = d = 0
 # These return solutions to the homogeneous ODEs.
 # With a, b, c, d = 0, the result will be zero across all time.
 
-def a1(x, t):
+def a1(t):
     return a * np.cos(2 * t) + b * np.sin(2 * t)
 
-def a2(x, t):
+def a2(t):
     return c * np.cos(t) + d * np.sin(t)
 # -----------------------------------------------------------------
 
@@ -46,61 +50,73 @@ def b2(t):
 # -----------------------------------------------------------------
 
 
-# --------------- Solve Homogeneous with odeint -------------------
-# Technically not necessary since the solution is 0, but done for completeness.
-
-h1 = odeint(a1, 0, t)  # Homogeneous solution for ODE 1 (should be zeros)
-h2 = odeint(a2, 0, t)  # Homogeneous solution for ODE 2 (should be zeros)
-# -----------------------------------------------------------------
-
-
-# ---------------- Evaluate Particular Solutions ------------------
-g1 = b1(t)  # Particular solution for ODE 1
-g2 = b2(t)  # Particular solution for ODE 2
-# -----------------------------------------------------------------
-
-
-# ------------------- Create Subplots -----------------------------
-# Create a 2x2 grid of plots with size 12x6
-fig, axs = plt.subplots(2, 2, figsize=(12, 6))
-# -----------------------------------------------------------------
-
-
-# -------------------- Plot Homogeneous Solutions -----------------
-axs[0][0].plot(t, h1, label="c1*cos(2t) + c2*sin(2t)", color='blue')
-axs[0][0].set_title("Homogeneous Solution for First ODE")
-axs[0][0].set_xlabel("t")
-axs[0][0].set_ylabel("y(t)")
-axs[0][0].grid(True)
-axs[0][0].legend()
-
-axs[0][1].plot(t, h2, label="c1*cos(t) + c2*sin(t)", color='magenta')
-axs[0][1].set_title("Homogeneous Solution for Second ODE")
-axs[0][1].set_xlabel("t")
-axs[0][1].set_ylabel("y(t)")
-axs[0][1].grid(True)
-axs[0][1].legend()
-# -----------------------------------------------------------------
-
-
-# ------------------ Plot Particular Solutions --------------------
-axs[1][0].plot(t, g1, label="t/4 - sin(2t)/8", color='red')
-axs[1][0].set_title("Particular Solution: t/4 - sin(2t)/8")
-axs[1][0].set_xlabel("t")
-axs[1][0].set_ylabel("y(t)")
-axs[1][0].grid(True)
-axs[1][0].legend()
-
-axs[1][1].plot(t, g2, label="4(1 - cos(t))", color='green')
-axs[1][1].set_title("Particular Solution: 4(1 - cos(t))")
-axs[1][1].set_xlabel("t")
-axs[1][1].set_ylabel("y(t)")
-axs[1][1].grid(True)
-axs[1][1].legend()
-# -----------------------------------------------------------------
-
-
-# -------------------- Display Final Layout -----------------------
-plt.tight_layout()  # Makes sure plots don’t overlap
-plt.show()          # Display the 4 graphs
-# -----------------------------------------------------------------
+# ------------------------- Plot Program --------------------------
+# Solves and plots all four solutions (run as a script)
+def main():
+    # ------------- Solve with the Green's Function Solver ------------
+    # Coefficients are (a_2, a_1, a_0) of a_2 y'' + a_1 y' + a_0 y = f(t)
+    ode1 = GreensSolver((1, 0, 4), t[1] - t[0], len(t))
+    ode2 = GreensSolver((1, 0, 1), t[1] - t[0], len(t))
+
+    # Homogeneous solutions from y(0), y'(0) (zeros with a, b, c, d = 0)
+    h1 = ode1.homogeneous((a, 2 * b))
+    h2 = ode2.homogeneous((c, d))
+
+    # Particular solutions (zero initial conditions) for the forcing terms
+    g1 = ode1.solve(t)
+    g2 = ode2.solve(np.full_like(t, 4))
+
+    print("Max difference from the exact solutions:")
+    print("  homogeneous 1:", np.max(np.abs(h1 - a1(t))), "  homogeneous 2:", np.max(np.abs(h2 - a2(t))))
+    print("  particular 1: ", np.max(np.abs(g1 - b1(t))), "  particular 2: ", np.max(np.abs(g2 - b2(t))))
+    # -----------------------------------------------------------------
+
+
+    # ------------------- Create Subplots -----------------------------
+    # Create a 2x2 grid of plots with size 12x6
+    fig, axs = plt.subplots(2, 2, figsize=(12, 6))
+    # -----------------------------------------------------------------
+
+
+    # -------------------- Plot Homogeneous Solutions -----------------
+    axs[0][0].plot(t, h1, label="c1*cos(2t) + c2*sin(2t)", color='blue')
+    axs[0][0].set_title("Homogeneous Solution for First ODE")
+    axs[0][0].set_xlabel("t")
+    axs[0][0].set_ylabel("y(t)")
+    axs[0][0].grid(True)
+    axs[0][0].legend()
+
+    axs[0][1].plot(t, h2, label="c1*cos(t) + c2*sin(t)", color='magenta')
+    axs[0][1].set_title("Homogeneous Solution for Second ODE")
+    axs[0][1].set_xlabel("t")
+    axs[0][1].set_ylabel("y(t)")
+    axs[0][1].grid(True)
+    axs[0][1].legend()
+    # -----------------------------------------------------------------
+
+
+    # ------------------ Plot Particular Solutions --------------------
+    axs[1][0].plot(t, g1, label="t/4 - sin(2t)/8", color='red')
+    axs[1][0].set_title("Particular Solution: t/4 - sin(2t)/8")
+    axs[1][0].set_xlabel("t")
+    axs[1][0].set_ylabel("y(t)")
+    axs[1][0].grid(True)
+    axs[1][0].legend()
+
+    axs[1][1].plot(t, g2, label="4(1 - cos(t))", color='green')
+    axs[1][1].set_title("Particular Solution: 4(1 - cos(t))")
+    axs[1][1].set_xlabel("t")
+    axs[1][1].set_ylabel("y(t)")
+    axs[1][1].grid(True)
+    axs[1][1].legend()
+    # -----------------------------------------------------------------
+
+
+    # -------------------- Display Final Layout -----------------------
+    plt.tight_layout()  # Makes sure plots don’t overlap
+    showOrSave('greens_function')  # Display (or save) the 4 graphs
+    # -----------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    main()
@@ -4,91 +4,97 @@
 # It shows chaotic motion in 3D space and time series plots for each variable.
 
 # ---------------------- Import Required Libraries ----------------------
+import argparse                     # For the non-interactive sweep mode
 import numpy as np                  # For numerical arrays and calculations
-import matplotlib.pyplot as plt     # For plotting graphs (2D & 3D)
+from cst305.render import configureOutput, lorenzRunFigures, showOrSave  # Headless output, shared plots
 # -----------------------------------------------------------------------
 
 
 # ------------------------ Lorenz Function ------------------------------
-# Calculates the derivatives for the Lorenz system at each step
-def lorenz(x, y, z, r, s=10, b=2.667):
-    x_dot = s * (y - x)
-    y_dot = r * x - y - x * z
-    z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+# Calculates the derivatives for the Lorenz system at each step.
+# Shared with Project 7 (see cst305/lorenz.py for the batched engine).
+from cst305.lorenz import lorenz  # noqa: F401
 # -----------------------------------------------------------------------
 
 
 # ------------------------ Run Simulation -------------------------------
-# Solves and plots the Lorenz attractor for a given r value
-def runCode(r):
-    dt = 0.01         # Time step size
-    num_steps = 10000 # Number of time steps (total simulation time = 100s)
-
-    # Initialize arrays to store x, y, z values
-    xs = np.empty(num_steps + 1)
-    ys = np.empty(num_steps + 1)
-    zs = np.empty(num_steps + 1)
-
-    # Initial conditions
-    xs[0], ys[0], zs[0] = 7.5, 22.5, 35
-
-    # Compute values using Euler’s method
-    for i in range(num_steps):
-        x_dot, y_dot, z_dot = lorenz(xs[i], ys[i], zs[i], r)
-        xs[i + 1] = xs[i] + x_dot * dt
-        ys[i + 1] = ys[i] + y_dot * dt
-        zs[i + 1] = zs[i] + z_dot * dt
-
-    # ---------------------- Plot 3D Graph -----------------------
-    fig = plt.figure()
-    ax = fig.add_subplot(111, projection='3d')
-    ax.plot(xs, ys, zs, lw=0.5)
-    ax.set_title(f"Lorenz Attractor: r = {r}")
-    ax.set_xlabel("X Axis")
-    ax.set_ylabel("Y Axis")
-    ax.set_zlabel("Z Axis")
-
-    # ------------------ Plot Time Series Graphs ----------------
-    fig, (ax_x, ax_y, ax_z) = plt.subplots(3, 1, figsize=(8, 12))
-    time = np.arange(0, num_steps + 1) * dt
-
-    ax_x.plot(time, xs, color='blue')
-    ax_x.set_ylabel("X: txt")
-    ax_x.set_title(f"Lorenz Time Series: r = {r}")
-    ax_x.set_xlim(-1, 100)
-
-    ax_y.plot(time, ys, color='orange')
-    ax_y.set_ylabel("Y: rtf")
-    ax_y.set_xlim(-1, 100)
-
-    ax_z.plot(time, zs, color='green')
-    ax_z.set_xlabel("t - Time")
-    ax_z.set_ylabel("Z: docx")
-    ax_z.set_xlim(-1, 100)
-
-    # Layout and show both figures
-    plt.tight_layout()
-    plt.show()
+# Solves and plots the Lorenz attractor for a given r value: a 3D graph and
+# the x, y, z time series over 100 s (dt = 0.01, start (7.5, 22.5, 35)).
+# method: "euler" (default), "rk4" or adaptive "rk45" with rtol/atol
+# (cst305/ode.py)
+def runCode(r, method="euler", rtol=1e-6, atol=1e-9):
+    lorenzRunFigures(r, method, rtol, atol, title="Lorenz Time Series",
+                     colors=('blue', 'orange', 'green'))
+
+    # Show (or save) both figures
+    showOrSave(f"lorenz_r{r}")
 # -----------------------------------------------------------------------
 
 
 # ---------------------- Input and Program Start ------------------------
 def start():
-    try:
-        r = int(input("Enter a value for 'r' (enter 0 to stop): "))
-    except ValueError:
-        print("Invalid input. Please enter an integer.")
-        start()
-    except KeyboardInterrupt:
-        print()  # Graceful exit if user presses Ctrl+C
-    else:
-        if r != 0:
-            runCode(r)
-            start()  # Loop again for new input
+    while True:  # Loop for new input until 0 or Ctrl+C
+        try:
+            r = int(input("Enter a value for 'r' (enter 0 to stop): "))
+        except ValueError:
+            print("Invalid input. Please enter an integer.")
+            continue
+        except KeyboardInterrupt:
+            print()  # Graceful exit if user presses Ctrl+C
+            return
+        if r == 0:
+            return
+        runCode(r)
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Sweep Mode ----------------------------------
+# Non-interactive parameter study: spreads a range of r values over a
+# process pool and saves the bifurcation diagram with Lyapunov exponents.
+# Example: python LorenzAttractor.py --sweep 0 200 --count 400 --out sweep.png
+# With --figures DIR the attractor for each r is also rendered to DIR, one
+# worker process per figure.
+def runSweep(args):
+    import os
+    from cst305.bifurcation import plotBifurcation, sweep
+    from cst305.render import lorenzFigure, renderParallel
+
+    r_values = np.linspace(args.sweep[0], args.sweep[1], args.count)
+    result = sweep(r_values, processes=args.processes, num_steps=args.steps,
+                   transient_steps=args.transient)
+    for r, lyap in zip(result["r"], result["lyapunov"]):
+        print(f"r = {r:8.3f}   largest Lyapunov exponent = {lyap: .4f}")
+    plotBifurcation(result, args.out)
+
+    if args.figures:
+        tasks = [(lorenzFigure, (r,), os.path.join(args.figures, f"lorenz_r{r:g}.png"))
+                 for r in r_values]
+        renderParallel(tasks, processes=args.processes)
+
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description="Lorenz attractor simulation")
+    parser.add_argument("--sweep", nargs=2, type=float, metavar=("R_MIN", "R_MAX"),
+                        help="run a non-interactive r sweep instead of prompting")
+    parser.add_argument("--count", type=int, default=200, help="number of r values in the sweep")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--steps", type=int, default=20000, help="measured steps per r")
+    parser.add_argument("--transient", type=int, default=5000, help="discarded transient steps per r")
+    parser.add_argument("--out", default=None, help="save the bifurcation diagram to this file")
+    parser.add_argument("--figures", default=None, help="render each r of the sweep into this directory")
+    parser.add_argument("--save", default=None, metavar="DIR",
+                        help="headless mode: write figures to DIR instead of showing them")
+    return parser.parse_args()
 # -----------------------------------------------------------------------
 
 
 # ---------------------------- Run Program ------------------------------
-start()
+if __name__ == "__main__":
+    args = parseArgs()
+    if args.save:
+        configureOutput(args.save)
+    if args.sweep:
+        runSweep(args)
+    else:
+        start()
 # -----------------------------------------------------------------------
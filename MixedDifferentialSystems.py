@@ -9,8 +9,9 @@
 # ------------------ Import Required Libraries ------------------
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import odeint
-from fractions import Fraction
+from cst305.cooling import coolingCurves, model
+from cst305.series import ExactSeries, evaluateSeries
+from cst305.render import showOrSave
 # ---------------------------------------------------------------
 
 
@@ -19,26 +20,28 @@ from fractions import Fraction
 def part1a(x):
     return 1 - x - (1/3) * x**3 - (1/12) * x**4
 
-# Create x values from 0 to 5
-x_values = np.linspace(0, 5, 100)
-y_values = part1a(x_values)
-
-# Plot the function
-plt.plot(x_values, y_values, label='y\" - 2xy\' + x^2y')
-plt.title('Part 1a')
-
-# Plot a vertical line at x = 3.5
-plt.plot([3.5, 3.5], [-100, part1a(3.5)], 'r--', label='x = 3.5')
-# Plot a horizontal line at y(3.5)
-plt.plot([0, 3.5], [part1a(3.5), part1a(3.5)], 'g--', label='y = -29.297')
-
-plt.xlabel('x')
-plt.ylabel('y')
-plt.xlim(0, 5)
-plt.ylim(-100, 10)
-plt.grid(True)
-plt.legend()
-plt.show()
+# Plot the solution with its value at x = 3.5 marked
+def plotPart1a():
+    # Create x values from 0 to 5
+    x_values = np.linspace(0, 5, 100)
+    y_values = part1a(x_values)
+
+    # Plot the function
+    plt.plot(x_values, y_values, label='y\" - 2xy\' + x^2y')
+    plt.title('Part 1a')
+
+    # Plot a vertical line at x = 3.5
+    plt.plot([3.5, 3.5], [-100, part1a(3.5)], 'r--', label='x = 3.5')
+    # Plot a horizontal line at y(3.5)
+    plt.plot([0, 3.5], [part1a(3.5), part1a(3.5)], 'g--', label='y = -29.297')
+
+    plt.xlabel('x')
+    plt.ylabel('y')
+    plt.xlim(0, 5)
+    plt.ylim(-100, 10)
+    plt.grid(True)
+    plt.legend()
+    showOrSave('part1a')
 # ---------------------------------------------------------------
 
 
@@ -46,78 +49,99 @@ plt.show()
 def part1b(x):
     return 6 + (x - 3) - (11/2) * ((x - 3)**2)
 
-x_values = np.linspace(0, 5, 100)
-y_values = part1b(x_values)
-
-plt.plot(x_values, y_values, label='y\" - (x - 2)y\' + 2y')
-plt.title('Part 1b')
-
-# Plot vertical line at x = 3, horizontal line at y = 6
-plt.plot([3, 3], [-50, part1b(3)], 'r--', label='x = 3')
-plt.plot([0, 3], [part1b(3), part1b(3)], 'g--', label='y = 6')
-
-plt.xlabel('x')
-plt.ylabel('y')
-plt.xlim(0, 5)
-plt.ylim(-50, 10)
-plt.grid(True)
-plt.legend()
-plt.show()
+# Plot the solution with its value at x = 3 marked
+def plotPart1b():
+    x_values = np.linspace(0, 5, 100)
+    y_values = part1b(x_values)
+
+    plt.plot(x_values, y_values, label='y\" - (x - 2)y\' + 2y')
+    plt.title('Part 1b')
+
+    # Plot vertical line at x = 3, horizontal line at y = 6
+    plt.plot([3, 3], [-50, part1b(3)], 'r--', label='x = 3')
+    plt.plot([0, 3], [part1b(3), part1b(3)], 'g--', label='y = 6')
+
+    plt.xlabel('x')
+    plt.ylabel('y')
+    plt.xlim(0, 5)
+    plt.ylim(-50, 10)
+    plt.grid(True)
+    plt.legend()
+    showOrSave('part1b')
 # ---------------------------------------------------------------
 
 
 # ---------------- Part 2: Series Coefficient Generator ----------
+# Exact coefficients a_2 .. a_(n+1): a lazy sequence of Fractions, each
+# reduced only when it is read (cst305/series.py also has float and
+# log-scale modes for very large n)
 def part2(n):
-    a_values = [Fraction(0) for _ in range(n + 2)]
-    a_values[0] = Fraction(1)
-    a_values[1] = Fraction(1)
-
-    for i in range(2, n + 2):
-        factor = -((i - 2) * (i - 3) + 1) * Fraction(1, 4 * i * (i - 1))
-        a_values[i] = factor * a_values[i - 2]
-
-    return a_values[2:]
-
-# Calculate the coefficients for n=8
-a_values = part2(8)
+    return ExactSeries(n, first=2)
 
 # Print the results
-def printAVals():
+def printAVals(a_values):
     for i, a in enumerate(a_values, start=2):
         tag = 'a0' if i % 2 == 0 else 'a1'
         print(f'a_{i} = {a} {tag}')
 
-printAVals()
+# Print and plot the coefficients for n = 8
+def showPart2():
+    # Calculate the coefficients for n=8
+    a_values = part2(8)
 
-# Plot coefficients vs. index
-plt.plot(range(len(a_values)), [float(a) for a in a_values], marker='o')
-plt.title('Series Coefficients a(n+2)')
-plt.xlabel('n')
-plt.ylabel('a(n+2)')
-plt.grid(True)
-plt.show()
+    printAVals(a_values)
+
+    # Plot coefficients vs. index
+    plt.plot(range(len(a_values)), [float(a) for a in a_values], marker='o')
+    plt.title('Series Coefficients a(n+2)')
+    plt.xlabel('n')
+    plt.ylabel('a(n+2)')
+    plt.grid(True)
+    showOrSave('part2_coefficients')
+
+    # Value of the series solution (a0 = a1 = 1) at x = 1 using 10^5 terms
+    print(f'y(1) = {evaluateSeries(np.array([1.0]), 10**5)[0]}')
 # ---------------------------------------------------------------
 
 
 # ---------------- Part 3: Newton’s Law of Cooling ---------------
-def part3(T, t, k, s):
-    return -k * (T - s)
-
-# Parameters
-k = 0.5         # Cooling rate constant
-T = 80          # Initial temperature
-s = [50, 60, 70, 80, 90]  # Different ambient temperatures
-t = np.linspace(0, 10)    # Time array from 0 to 10
-
-# Solve and plot for each surrounding temp
-for temp in s:
-    solution = odeint(part3, T, t, args=(k, temp))
-    plt.plot(t, solution, label=f"Surrounding Temp: {temp}")
-
-plt.xlabel('Time (Seconds)')
-plt.ylabel('Temperature (Celsius)')
-plt.title("Computer Cooling (Newton's Law)")
-plt.legend()
-plt.grid(True)
-plt.show()
+# Newton's law of cooling dT/dt = -k(T - s) (odeint argument order),
+# the shared model from cst305/cooling.py
+part3 = model
+
+# Exact solution T(t) = s + (T - s)e^(-kt), broadcast over every s at once
+def part3Exact(t, k, s, T):
+    return coolingCurves(t, k, np.asarray(s)[:, None], T)
+
+# Plot the cooling curves for several surrounding temperatures
+def plotPart3():
+    # Parameters
+    k = 0.5         # Cooling rate constant
+    T = 80          # Initial temperature
+    s = [50, 60, 70, 80, 90]  # Different ambient temperatures
+    t = np.linspace(0, 10)    # Time array from 0 to 10
+
+    # Solve all surrounding temps together, then plot each one
+    solutions = part3Exact(t, k, s, T)
+    for temp, solution in zip(s, solutions):
+        plt.plot(t, solution, label=f"Surrounding Temp: {temp}")
+
+    plt.xlabel('Time (Seconds)')
+    plt.ylabel('Temperature (Celsius)')
+    plt.title("Computer Cooling (Newton's Law)")
+    plt.legend()
+    plt.grid(True)
+    showOrSave('part3_cooling')
+# ---------------------------------------------------------------
+
+
+# ---------------------------- Run Program ----------------------
+def main():
+    plotPart1a()
+    plotPart1b()
+    showPart2()
+    plotPart3()
+
+if __name__ == "__main__":
+    main()
 # ---------------------------------------------------------------
@@ -10,11 +10,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import sympy as sp
-from scipy.interpolate import interp1d
+from cst305.rates import StreamIntegrator
+from cst305.riemann import riemannSum
+from cst305.symbolic import riemannSumFunction, symbolicRiemann
+from cst305.render import (drawRiemannRectangles, outputDirectory, outputPath, plotDecimated,
+                           renderParallel, showOrSave)
 # -------------------------------------------------
 
 # -------------------- Part 1A --------------------
 # Plotting Left, Midpoint, and Right Riemann rectangles
+# (each panel draws all of its rectangles as a single PolyCollection)
 
 def function(x):
     return np.sin(x) + 1
@@ -26,89 +31,106 @@ x_end = np.pi
 n_rectangles = 4
 rectangle_width = (x_end - x_start) / n_rectangles
 
-# LEFT
-plt.plot(t, y, label='f(x) = sin(x) + 1')
-plt.axvline(x=x_start, color='r', linestyle='--', label=f'x={x_start}')
-plt.axvline(x=x_end, color='r', linestyle='--', label=f'x={x_end}')
-for i in range(n_rectangles):
-    x_rect = x_start + i * rectangle_width
-    y_rect = function(x_rect)
-    plt.fill_between([x_rect, x_rect + rectangle_width], 0, [y_rect, y_rect], alpha=0.2, color='purple')
-plt.title(f'Left Endpoint Approximation')
-plt.xlabel('x'); plt.ylabel('f(x)'); plt.legend(); plt.grid(); plt.show()
-
-# MIDPOINT
-plt.plot(t, y, label='f(x) = sin(x) + 1')
-plt.axvline(x=x_start, color='r', linestyle='--', label=f'x={x_start}')
-plt.axvline(x=x_end, color='r', linestyle='--', label=f'x={x_end}')
-for i in range(n_rectangles):
-    x_rect = x_start + i * rectangle_width
-    y_rect = function(x_rect + rectangle_width/2)
-    plt.fill_between([x_rect, x_rect + rectangle_width], 0, [y_rect, y_rect], alpha=0.2, color='purple')
-plt.title(f'Midpoint Approximation')
-plt.xlabel('x'); plt.ylabel('f(x)'); plt.legend(); plt.grid(); plt.show()
-
-# RIGHT
-plt.plot(t, y, label='f(x) = sin(x) + 1')
-plt.axvline(x=x_start, color='r', linestyle='--', label=f'x={x_start}')
-plt.axvline(x=x_end, color='r', linestyle='--', label=f'x={x_end}')
-for i in range(n_rectangles):
-    x_rect = x_start + i * rectangle_width
-    y_rect = function(x_rect + rectangle_width)
-    plt.fill_between([x_rect, x_rect + rectangle_width], 0, [y_rect, y_rect], alpha=0.2, color='purple')
-plt.title(f'Right Endpoint Approximation')
-plt.xlabel('x'); plt.ylabel('f(x)'); plt.legend(); plt.grid(); plt.show()
+panel_titles = {
+    'left': 'Left Endpoint Approximation',
+    'mid': 'Midpoint Approximation',
+    'right': 'Right Endpoint Approximation',
+}
+
+def riemannPanel(rule):
+    fig = plt.figure()
+    plotDecimated(plt.gca(), t, y, label='f(x) = sin(x) + 1')
+    plt.axvline(x=x_start, color='r', linestyle='--', label=f'x={x_start}')
+    plt.axvline(x=x_end, color='r', linestyle='--', label=f'x={x_end}')
+    drawRiemannRectangles(plt.gca(), function, x_start, x_end, n_rectangles, rule)
+    plt.title(panel_titles[rule])
+    plt.xlabel('x'); plt.ylabel('f(x)'); plt.legend(); plt.grid()
+    return fig
+
+def part1a():
+    if outputDirectory():
+        # Headless: the three panels are independent, so render them in parallel
+        renderParallel([(riemannPanel, (rule,), outputPath(f'riemann_{rule}')) for rule in panel_titles])
+    else:
+        # LEFT, MIDPOINT, RIGHT
+        for rule in panel_titles:
+            riemannPanel(rule)
+            showOrSave(f'riemann_{rule}')
+
+    # Values of the sums above and their error against the exact integral (2*pi)
+    print("\n--- Part 1A ---")
+    for rule in ('left', 'mid', 'right', 'trapezoid', 'simpson'):
+        value, error = riemannSum(function, x_start, x_end, n_rectangles, rule, reference=2 * np.pi)
+        print(f"{rule:>9} sum with n = {n_rectangles}: {value:.6f} (error {error:.2e})")
 
 # -------------------- Part 1B --------------------
+# Sums with c_k = a + k*delta_x; sp.summation / sp.limit results are cached
+# on disk (cst305/symbolic.py), so repeated runs skip the symbolic work
 x = sp.symbols('x')
-f = 3*x + 2*x**2
-a, b = 0, 1
-n, k = sp.symbols('n k')
-delta_x = (b - a) / n
-c_k = a + (k * delta_x)
-riemann_sum = sp.summation(f.subs(x, c_k) * delta_x, (k, 1, n))
-limit_riemann_sum = sp.limit(riemann_sum, n, sp.oo)
-print("\n--- Part 1B ---")
-print(f"Riemann Sum Formula: {riemann_sum}")
-print(f"Limit as n -> infinity: {limit_riemann_sum}")
+n_values = np.array([10, 1000, 10**6])
+
+def part1b():
+    f = 3*x + 2*x**2
+    a, b = 0, 1
+    riemann_sum, limit_riemann_sum = symbolicRiemann(f, x, a, b)
+    print("\n--- Part 1B ---")
+    print(f"Riemann Sum Formula: {riemann_sum}")
+    print(f"Limit as n -> infinity: {limit_riemann_sum}")
+    print(f"Sum for n = {n_values}: {riemannSumFunction(f, x, a, b)(n_values)}")
 
 # ------------------ Part 1C-1 ---------------------
-f = sp.log(x)
-a = 1
-b = sp.E
-delta_x = (b - a) / n
-c_k = a + (k * delta_x)
-riemann_sum = sp.summation(f.subs(x, c_k) * delta_x, (k, 1, n))
-print("\n--- Part 1C-1 ---")
-print(f"Riemann Sum Formula: {riemann_sum}")
+def part1c1():
+    f = sp.log(x)
+    a = 1
+    b = sp.E
+    riemann_sum, _ = symbolicRiemann(f, x, a, b, with_limit=False)
+    print("\n--- Part 1C-1 ---")
+    print(f"Riemann Sum Formula: {riemann_sum}")
+    print(f"Sum for n = {n_values}: {riemannSumFunction(f, x, a, b)(n_values)}")
 
 # ------------------ Part 1C-2 ---------------------
-f = x**2 - x**3
-a = -1
-b = 0
-delta_x = (b - a) / n
-c_k = a + (k * delta_x)
-riemann_sum = sp.summation(f.subs(x, c_k) * delta_x, (k, 1, n))
-limit_riemann_sum = sp.limit(riemann_sum, n, sp.oo)
-print("\n--- Part 1C-2 ---")
-print(f"Riemann Sum Formula: {riemann_sum}")
-print(f"Limit as n -> infinity: {limit_riemann_sum}")
+def part1c2():
+    f = x**2 - x**3
+    a = -1
+    b = 0
+    riemann_sum, limit_riemann_sum = symbolicRiemann(f, x, a, b)
+    print("\n--- Part 1C-2 ---")
+    print(f"Riemann Sum Formula: {riemann_sum}")
+    print(f"Limit as n -> infinity: {limit_riemann_sum}")
+    print(f"Sum for n = {n_values}: {riemannSumFunction(f, x, a, b)(n_values)}")
 
 # -------------------- Part 2 ----------------------
-time_data = np.arange(1, 31)
-download_rate_data = np.array([
-    0.509, 0.324, 0.745, 0.420, 0.419,
-    0.420, 0.420, 0.419, 0.420, 0.419,
-    0.420, 0.417, 0.694, 0.833, 0.405,
-    0.416, 0.420, 0.710, 0.870, 0.418,
-    0.452, 0.372, 0.822, 0.806, 0.670,
-    0.840, 0.694, 0.773, 0.758, 0.747
-])
-
-interpolation_function = interp1d(time_data, download_rate_data, kind='linear', fill_value='extrapolate')
-time_values = np.linspace(0, 30, 1000)
-download_rate_values = interpolation_function(time_values)
-
-riemann_sum = np.trapezoid(download_rate_values, time_values)
-print("\n--- Part 2 ---")
-print(f"Riemann Sum (Trapezoidal Rule on Interpolated Data): {riemann_sum}")
+def part2():
+    time_data = np.arange(1, 31)
+    download_rate_data = np.array([
+        0.509, 0.324, 0.745, 0.420, 0.419,
+        0.420, 0.420, 0.419, 0.420, 0.419,
+        0.420, 0.417, 0.694, 0.833, 0.405,
+        0.416, 0.420, 0.710, 0.870, 0.418,
+        0.452, 0.372, 0.822, 0.806, 0.670,
+        0.840, 0.694, 0.773, 0.758, 0.747
+    ])
+
+    # The samples are joined by straight lines (what interp1d(kind='linear')
+    # did) and integrated exactly as they stream in, ten at a time here; the
+    # first and last segments are extended to cover t = 0 (cst305/rates.py)
+    integrator = StreamIntegrator()
+    for start in range(0, len(time_data), 10):
+        integrator.update(time_data[start:start + 10], download_rate_data[start:start + 10])
+
+    riemann_sum = integrator.between(0, 30, extrapolate=True)
+    print("\n--- Part 2 ---")
+    print(f"Riemann Sum (Trapezoidal Rule on Interpolated Data): {riemann_sum}")
+    print(f"Total over the samples (t = 1 to 30): {integrator.total()}")
+    print(f"Total over t = 10 to 20: {integrator.between(10, 20)}")
+
+# -------------------- Run All Parts --------------------
+def main():
+    part1a()
+    part1b()
+    part1c1()
+    part1c2()
+    part2()
+
+if __name__ == "__main__":
+    main()
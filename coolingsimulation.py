@@ -2,8 +2,9 @@
 #Newtons law of cooling to model computer temperature
 
 import numpy as np
-from scipy.integrate import odeint
 import matplotlib.pyplot as plt
+from cst305.cooling import coolingCurves, timeToThreshold
+from cst305.render import showOrSave
 
 #Newtons Law of Cooling
 #T = current temperature
@@ -11,25 +12,33 @@ import matplotlib.pyplot as plt
 #k = cooling constant
 #s = surrounding temperature
 #It returns how fast the temperature is changing (dTdt).
-#Defining ODE
-def model (T,t,k,s):
-    dTdt = -k*(T-s)
-    return dTdt
-
-#perameters
-k = 0.5 #This sets k, the cooling rate. Higher k = faster cooling.
-T = 80 #This is the starting temperature of the computer's liquid cooling system.
-s = [50, 60, 70, 80, 90] #This is a list of surrounding temperatures you want to test against — like simulating different room temps.
-
-t = np.linspace(0, 10)#This creates an array of time values from 0 to 10 seconds. These will be used to see how the temp changes over time.
-
-for x in s: #this is a loop, goes through each value of list(s)
-    solution = odeint(model, T, t, args=(k, x))
-    plt.plot(t, solution, label="Surrounding Temp: " + str(x))
-
-plt.xlabel('Time (Seconds)')
-plt.ylabel('Temperature (Celsius)')
-plt.title('Computer Cooling Over Time')
-plt.legend()
-plt.grid(True)
-plt.show()
\ No newline at end of file
+#The ODE (model) lives in cst305/cooling.py; its exact solution
+#T(t) = s + (T0 - s)e^(-kt) is used so every surrounding temp is done at once.
+
+#Runs the simulation and plots it (run as a script)
+def main():
+    #perameters
+    k = 0.5 #This sets k, the cooling rate. Higher k = faster cooling.
+    T = 80 #This is the starting temperature of the computer's liquid cooling system.
+    s = [50, 60, 70, 80, 90] #This is a list of surrounding temperatures you want to test against — like simulating different room temps.
+
+    t = np.linspace(0, 10)#This creates an array of time values from 0 to 10 seconds. These will be used to see how the temp changes over time.
+
+    solutions = coolingCurves(t, k, np.array(s)[:, None], T) #one row of temperatures per value of list(s)
+    for x, solution in zip(s, solutions): #this is a loop, goes through each value of list(s)
+        plt.plot(t, solution, label="Surrounding Temp: " + str(x))
+
+    #How long each surrounding temp takes to bring the computer to 75 degrees (inf = never)
+    for x, seconds in zip(s, timeToThreshold(k, np.array(s), T, 75)):
+        print("Surrounding Temp: " + str(x) + " -> 75C after " + str(round(seconds, 3)) + " seconds")
+
+    plt.xlabel('Time (Seconds)')
+    plt.ylabel('Temperature (Celsius)')
+    plt.title('Computer Cooling Over Time')
+    plt.legend()
+    plt.grid(True)
+    showOrSave('cooling')
+
+
+if __name__ == "__main__":
+    main()
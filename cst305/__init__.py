@@ -0,0 +1,21 @@
+# CST 305 – Shared numerical engines
+# The project scripts in the repository root import their solvers from here
+# so the same code can be reused without running any of the plots.
+#
+# Submodules are loaded on first attribute access (cst305.mmc, cst305.lorenz,
+# ...), and matplotlib, scipy and sympy are only imported inside the functions
+# that need them, so `import cst305` costs no more than NumPy. The command
+# line entry point is `python -m cst305` (see cst305/cli.py).
+
+import importlib
+
+SUBMODULES = ("bench", "bifurcation", "cache", "checkpoint", "cli", "cooling", "decimate",
+              "greens", "instrument", "lorenz", "matexp", "mmc", "ode", "queueing", "queuestats",
+              "rates", "render", "replications", "riemann", "rk4", "runge", "series", "symbolic",
+              "workprecision")
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"cst305.{name}")
+    raise AttributeError(f"module 'cst305' has no attribute {name!r}")
@@ -0,0 +1,7 @@
+# Allows `python -m cst305 <command> ...` (see cst305/cli.py)
+
+import sys
+
+from cst305.cli import main
+
+sys.exit(main())
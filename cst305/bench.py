@@ -0,0 +1,154 @@
+# CST 305 – Benchmark Suite: RK4 vs odeint for dy/dx = -y + ln(x)
+# Times each solver with perf_counter over repeated trials (after warmup)
+# across a grid of step sizes h and step counts, checks accuracy against the
+# closed-form solution and writes everything to JSON for regression tracking.
+#
+# Usage: python -m cst305.bench --h 0.3 0.03 --runs 1000 10000 --out bench.json
+
+# ---------------------- Import Required Libraries ----------------------
+import argparse
+import json
+import platform
+import time
+
+import numpy as np
+
+from cst305 import instrument
+from cst305.rk4 import diffEq, exactSolution, rungeKuttaBatch
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+X0 = 2.0
+Y0 = 1.0
+H_VALUES = (0.3, 0.03, 0.003)
+RUNS_VALUES = (1000, 10000)
+REPEATS = 7
+WARMUP = 1
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Solvers ----------------------------------
+# Each solver takes (x0, y0, h, runs) and returns (x_values, y_values,
+# rhs_evals) with y_values a 1-D array of the solution on the x grid.
+
+def solveRK4Loop(x0, y0, h, runs):
+    from cst305.runge import Runge
+
+    x_values = [x0]
+    y_values = [y0]
+    Runge.runCode(x_values, y_values, h, runs)
+    return np.array(x_values), np.array(y_values), 4 * runs
+
+
+def solveRK4(x0, y0, h, runs):
+    x_values, y_values = rungeKuttaBatch(x0, y0, h, runs)
+    return x_values, y_values[:, 0], 4 * runs
+
+
+def solveOdeint(x0, y0, h, runs):
+    from scipy.integrate import odeint
+
+    x_values = np.linspace(x0, x0 + h * runs, runs + 1)
+    y_values, info = odeint(diffEq, y0, x_values, full_output=True)
+    instrument.count("odeint", rhs_evals=info["nfe"][-1], accepted=info["nst"][-1],
+                     jac_evals=info["nje"][-1])
+    return x_values, y_values[:, 0], int(info["nfe"][-1])
+
+
+SOLVERS = {"rk4_loop": solveRK4Loop, "rk4_vec": solveRK4, "odeint": solveOdeint}
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Timing Helpers ----------------------------
+# Calls func() `warmup` times untimed, then `repeats` times under
+# perf_counter. Returns (list of durations in seconds, last result).
+def timeRepeated(func, repeats=REPEATS, warmup=WARMUP):
+    result = None
+    for _ in range(warmup):
+        result = func()
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+# Median and interquartile range of a list of durations
+def summarize(durations):
+    q1, median, q3 = np.percentile(durations, [25, 50, 75])
+    return {"median_s": median, "iqr_s": q3 - q1,
+            "min_s": min(durations), "max_s": max(durations)}
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Benchmark --------------------------------
+# Runs every solver over the grid of h and runs values.
+# Returns a list of result dicts (one per solver, h, runs).
+def runBenchmarks(h_values=H_VALUES, runs_values=RUNS_VALUES, solvers=None,
+                  repeats=REPEATS, warmup=WARMUP, x0=X0, y0=Y0):
+    solvers = solvers or SOLVERS
+    results = []
+    for h in h_values:
+        for runs in runs_values:
+            for name, solver in solvers.items():
+                durations, (x_values, y_values, rhs_evals) = timeRepeated(
+                    lambda: solver(x0, y0, h, runs), repeats, warmup)
+                timing = summarize(durations)
+                exact = exactSolution(x_values, x0, y0)
+                results.append({
+                    "solver": name,
+                    "h": h,
+                    "runs": runs,
+                    "repeats": repeats,
+                    **timing,
+                    "steps_per_s": runs / timing["median_s"],
+                    "rhs_evals": rhs_evals,
+                    "rhs_evals_per_s": rhs_evals / timing["median_s"],
+                    "max_error": float(np.max(np.abs(y_values - exact))),
+                })
+    return results
+
+
+# Version and machine details stored with the results so runs can be
+# compared between versions
+def environment():
+    import scipy
+
+    return {"python": platform.python_version(), "numpy": np.__version__,
+            "scipy": scipy.__version__, "machine": platform.machine(),
+            "processor": platform.processor(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+# Prints one line per result
+def printResults(results):
+    print(f"{'solver':>8} {'h':>8} {'runs':>8} {'median s':>11} {'IQR s':>10} "
+          f"{'steps/s':>11} {'RHS/s':>11} {'max error':>10}")
+    for res in results:
+        print(f"{res['solver']:>8} {res['h']:>8g} {res['runs']:>8} {res['median_s']:>11.3e} "
+              f"{res['iqr_s']:>10.2e} {res['steps_per_s']:>11.3e} "
+              f"{res['rhs_evals_per_s']:>11.3e} {res['max_error']:>10.2e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RK4 vs odeint benchmark for dy/dx = -y + ln(x)")
+    parser.add_argument("--h", nargs="+", type=float, default=list(H_VALUES), help="step sizes")
+    parser.add_argument("--runs", nargs="+", type=int, default=list(RUNS_VALUES), help="step counts")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--out", default=None, help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = runBenchmarks(args.h, args.runs, repeats=args.repeats, warmup=args.warmup)
+    printResults(results)
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+        print(f"\nResults written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
+# -----------------------------------------------------------------------
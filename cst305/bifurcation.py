@@ -0,0 +1,146 @@
+# CST 305 – Lorenz r-Sweep: Bifurcation Diagram and Lyapunov Exponents
+# Spreads a range of r values over a process pool. Each worker integrates its
+# share of r values as one batch and returns, for every r, the largest
+# Lyapunov exponent and the local maxima of z after a transient.
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+
+from cst305 import instrument
+from cst305.lorenz import DEFAULT_B, DEFAULT_INITIAL, DEFAULT_S, lorenzBatch, makeBatch
+from cst305.ode import RHS_PER_STEP, eulerStep, rk4Step
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+SWEEP_DT = 0.01
+SWEEP_STEPS = 20000       # Steps measured after the transient
+TRANSIENT_STEPS = 5000    # Steps discarded before measuring
+SEPARATION = 1e-8         # Initial distance of the shadow trajectory
+RENORM_EVERY = 10         # Steps between shadow trajectory renormalizations
+
+STEPPERS = {"euler": eulerStep, "rk4": rk4Step}
+# -----------------------------------------------------------------------
+
+
+# --------------------- Lyapunov Exponent and Maxima --------------------
+# Integrates one batch of r values together with a shadow trajectory for
+# each (Benettin's method). The shadow starts SEPARATION away and is pulled
+# back to that distance every RENORM_EVERY steps; the average log growth is
+# the largest Lyapunov exponent. Local maxima of z are detected on the fly,
+# so memory does not grow with the number of steps.
+# Returns (lyapunov, maxima) with maxima a list of arrays, one per r.
+def lyapunovAndMaxima(r, s=DEFAULT_S, b=DEFAULT_B, initial=DEFAULT_INITIAL,
+                      dt=SWEEP_DT, num_steps=SWEEP_STEPS, transient_steps=TRANSIENT_STEPS,
+                      method="rk4", separation=SEPARATION, renorm_every=RENORM_EVERY):
+    step = STEPPERS[method]
+    r, s, b, state = makeBatch(r, s, b, initial)
+    n = len(r)
+
+    # Base trajectories in the first half of the batch, shadows in the second
+    r2, s2, b2 = (np.concatenate([p, p]) for p in (r, s, b))
+
+    def f(states, t):
+        return lorenzBatch(states, r2, s2, b2)
+
+    def fBase(states, t):
+        return lorenzBatch(states, r, s, b)
+
+    # Let the trajectories settle onto the attractor
+    for _ in range(transient_steps):
+        state = step(fBase, 0.0, state, dt)  # autonomous: t is unused
+
+    offset = np.zeros_like(state)
+    offset[:, 0] = separation
+    states = np.concatenate([state, state + offset])
+
+    log_growth = np.zeros(n)
+    maxima = [[] for _ in range(n)]
+    z_prev = z_cur = states[:n, 2].copy()
+
+    for i in range(1, num_steps + 1):
+        states = step(f, 0.0, states, dt)
+
+        # z[i-1] is a local maximum if it rose into it and does not rise after
+        z_new = states[:n, 2]
+        for j in np.flatnonzero((z_cur > z_prev) & (z_cur >= z_new)):
+            maxima[j].append(z_cur[j])
+        z_prev, z_cur = z_cur, z_new.copy()
+
+        if i % renorm_every == 0 or i == num_steps:
+            diff = states[n:] - states[:n]
+            distance = np.sqrt((diff ** 2).sum(axis=1))
+            log_growth += np.log(distance / separation)
+            states[n:] = states[:n] + diff * (separation / distance)[:, None]
+
+    lyapunov = log_growth / (num_steps * dt)
+    instrument.count(f"bifurcation.{method}", rhs_evals=(transient_steps + num_steps) * RHS_PER_STEP[method],
+                     accepted=transient_steps + num_steps)
+    return lyapunov, [np.array(m) for m in maxima]
+
+
+# Worker entry point: unpacks one chunk of r values for the process pool
+def _sweepChunk(args):
+    r_chunk, kwargs = args
+    return lyapunovAndMaxima(r_chunk, **kwargs)
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- r Sweep ----------------------------------
+# Splits r_values into one contiguous chunk per worker process, so each
+# worker integrates its chunk as a single batch and only the results travel
+# between processes. chunks_per_process > 1 makes smaller chunks to even out
+# the load across workers. Workers are forked where the platform allows it,
+# like render.renderParallel, so they start without re-importing the caller.
+# Extra keyword arguments go to lyapunovAndMaxima.
+# Returns {"r": r_values, "lyapunov": array, "maxima": list of arrays}.
+def sweep(r_values, processes=None, chunks_per_process=1, **kwargs):
+    r_values = np.asarray(r_values, dtype=float)
+    processes = processes or os.cpu_count() or 1
+    num_chunks = max(1, min(len(r_values), processes * chunks_per_process))
+    chunks = np.array_split(r_values, num_chunks)
+
+    if processes == 1:
+        results = [_sweepChunk((chunk, kwargs)) for chunk in chunks]
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            results = list(pool.map(_sweepChunk, [(chunk, kwargs) for chunk in chunks]))
+
+    lyapunov = np.concatenate([res[0] for res in results])
+    maxima = [m for res in results for m in res[1]]
+    return {"r": r_values, "lyapunov": lyapunov, "maxima": maxima}
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Bifurcation Diagram --------------------------
+# Plots the z maxima against r (bifurcation diagram) above the largest
+# Lyapunov exponent against r. Saves to `path` when given, else shows it.
+def plotBifurcation(result, path=None):
+    import matplotlib.pyplot as plt
+
+    r_points = np.concatenate([np.full(len(m), r) for r, m in zip(result["r"], result["maxima"])])
+    z_points = np.concatenate(result["maxima"]) if len(r_points) else np.array([])
+
+    fig, (ax_z, ax_l) = plt.subplots(2, 1, figsize=(10, 8), sharex=True)
+    ax_z.plot(r_points, z_points, ',', color='black', alpha=0.5)
+    ax_z.set_title("Lorenz Bifurcation Diagram")
+    ax_z.set_ylabel("Local maxima of z")
+
+    ax_l.plot(result["r"], result["lyapunov"], color='blue', lw=0.8)
+    ax_l.axhline(0, color='red', linestyle='--', lw=0.8)
+    ax_l.set_xlabel("r")
+    ax_l.set_ylabel("Largest Lyapunov exponent")
+
+    plt.tight_layout()
+    if path:
+        fig.savefig(path)
+        plt.close(fig)
+    else:
+        plt.show()
+# -----------------------------------------------------------------------
@@ -0,0 +1,286 @@
+# CST 305 – Result Cache for Repeated Simulations
+# Simulations are pure functions of their parameters, so a run that was
+# already computed (the same r typed twice into a Lorenz prompt, the same
+# cooling cross-check) is returned from a cache instead of integrated again.
+#   memory tier  least-recently-used dict of results, limited by entry
+#                count and total bytes
+#   disk tier    one .npz file per result in a directory (the "results"
+#                directory under CST305_CACHE_DIR, or configureCache; off
+#                when not set), limited by total bytes, oldest-used files
+#                deleted first
+# Keys are a SHA-256 hash of the function, all of its arguments (defaults
+# filled in, numbers and arrays by value) and the source code of the
+# function's module and the modules it depends on, so any change to a
+# parameter or to solver code misses the old entries.
+# Results may be arrays, numbers, strings, None and tuples/lists/dicts of
+# them. Cached arrays are returned read-only and shared between hits.
+
+# ---------------------- Import Required Libraries ----------------------
+import hashlib
+import importlib
+import inspect
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_ITEMS = 32                   # Results kept in memory
+DEFAULT_MEMORY_BYTES = 256 << 20     # Array bytes kept in memory
+DEFAULT_DISK_BYTES = 2 << 30         # Bytes of .npz files kept on disk
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Hashing ---------------------------------
+# Feeds a canonical form of value into the hash. Numbers and (nested)
+# sequences of numbers are hashed as float64 arrays, so 28, 28.0, [28] and
+# np.array([28.]) give different keys only through their shapes.
+def _hashValue(digest, value):
+    if value is None or isinstance(value, str):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, dict):
+        digest.update(b"dict{")
+        for key in sorted(value, key=repr):
+            _hashValue(digest, key)
+            _hashValue(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)) and not _isNumeric(value):
+        digest.update(b"seq[")
+        for item in value:
+            _hashValue(digest, item)
+        digest.update(b"]")
+    elif _isNumeric(value):
+        array = np.ascontiguousarray(value, dtype=float)
+        digest.update(f"array{array.shape}:".encode())
+        digest.update(array.tobytes())
+    elif callable(value):
+        digest.update(f"callable:{value.__module__}.{value.__qualname__};".encode())
+        code = getattr(value, "__code__", None)
+        if code is not None:
+            digest.update(code.co_code)
+            digest.update(repr(code.co_consts).encode())
+    else:
+        raise TypeError(f"cannot build a cache key from {type(value).__name__}")
+
+
+def _isNumeric(value):
+    try:
+        return np.asarray(value).dtype.kind in "biuf"
+    except (TypeError, ValueError):
+        return False
+
+
+_source_hashes = {}
+
+
+# Hash of the source files of the named modules (computed once per process)
+def codeVersion(*modules):
+    digest = hashlib.sha256()
+    for name in sorted(set(modules)):
+        if name not in _source_hashes:
+            path = importlib.import_module(name).__file__
+            with open(path, "rb") as file:
+                _source_hashes[name] = hashlib.sha256(file.read()).hexdigest()
+        digest.update(f"{name}:{_source_hashes[name]};".encode())
+    return digest.hexdigest()
+
+
+# Cache key of function(*args, **kwargs); depends lists further modules
+# whose code the result depends on (the function's own module always counts)
+def cacheKey(function, args=(), kwargs=None, depends=()):
+    bound = inspect.signature(function).bind(*args, **(kwargs or {}))
+    bound.apply_defaults()
+    digest = hashlib.sha256()
+    digest.update(f"{function.__module__}.{function.__qualname__};".encode())
+    digest.update(codeVersion(function.__module__, *depends).encode())
+    _hashValue(digest, dict(bound.arguments))
+    return digest.hexdigest()
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Packing ----------------------------------
+# Splits a result into a JSON layout and a dict of arrays (the .npz form)
+def _pack(value, arrays):
+    if isinstance(value, np.ndarray):
+        name = f"a{len(arrays)}"
+        arrays[name] = value
+        return {"a": name}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"s": value}
+    if isinstance(value, (list, tuple)):
+        return {"t" if isinstance(value, tuple) else "l": [_pack(item, arrays) for item in value]}
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("only dicts with string keys can be cached")
+        return {"d": {key: _pack(item, arrays) for key, item in value.items()}}
+    raise TypeError(f"cannot cache a result of type {type(value).__name__}")
+
+
+def _unpack(layout, arrays):
+    if "a" in layout:
+        return arrays[layout["a"]]
+    if "s" in layout:
+        return layout["s"]
+    if "t" in layout:
+        return tuple(_unpack(item, arrays) for item in layout["t"])
+    if "l" in layout:
+        return [_unpack(item, arrays) for item in layout["l"]]
+    return {key: _unpack(item, arrays) for key, item in layout["d"].items()}
+
+
+def _readOnly(arrays):
+    for array in arrays.values():
+        array.setflags(write=False)
+    return arrays
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Result Cache ------------------------------
+# Two-tier cache. memory_items / memory_bytes = 0 turn the memory tier
+# off, directory = None the disk tier.
+class ResultCache:
+
+    def __init__(self, memory_items=DEFAULT_ITEMS, memory_bytes=DEFAULT_MEMORY_BYTES,
+                 directory=None, disk_bytes=DEFAULT_DISK_BYTES):
+        self.memory_items = memory_items
+        self.memory_bytes = memory_bytes
+        self.directory = directory
+        self.disk_bytes = disk_bytes
+        self._entries = OrderedDict()   # key -> (layout, arrays, nbytes)
+        self._bytes = 0
+        self.hits = self.disk_hits = self.misses = 0
+
+    # Result of function(*args, **kwargs), computed only on a miss
+    def call(self, function, *args, depends=(), **kwargs):
+        key = cacheKey(function, args, kwargs, depends)
+        found = self.get(key)
+        if found is not None:
+            return found[0]
+        self.misses += 1
+        instrument.count("cache", misses=1)
+        result = function(*args, **kwargs)
+        self.put(key, result)
+        return result
+
+    # (result,) for a cached key, None on a miss
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            instrument.count("cache", memory_hits=1)
+            layout, arrays, _ = self._entries[key]
+            return (_unpack(layout, arrays),)
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+
+        from cst305.checkpoint import loadCheckpoint
+
+        try:
+            saved = loadCheckpoint(path)
+        except (OSError, ValueError):
+            return None   # Partly deleted or unreadable: recompute
+        os.utime(path)    # Most recently used
+        layout = json.loads(saved.pop("__layout__"))
+        arrays = _readOnly({name: np.asarray(array) for name, array in saved.items()})
+        self._remember(key, layout, arrays)
+        self.disk_hits += 1
+        instrument.count("cache", disk_hits=1)
+        return (_unpack(layout, arrays),)
+
+    def put(self, key, result):
+        arrays = {}
+        layout = _pack(result, arrays)
+        arrays = _readOnly({name: np.array(array) for name, array in arrays.items()})
+        self._remember(key, layout, arrays)
+        path = self._path(key)
+        if path is not None:
+            from cst305.checkpoint import saveCheckpoint
+
+            os.makedirs(self.directory, exist_ok=True)
+            saveCheckpoint(path, __layout__=json.dumps(layout), **arrays)
+            self._trimDisk()
+
+    def clear(self, disk=False):
+        self._entries.clear()
+        self._bytes = 0
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _path(self, key):
+        return None if self.directory is None else os.path.join(self.directory, f"{key}.npz")
+
+    def _remember(self, key, layout, arrays):
+        nbytes = sum(array.nbytes for array in arrays.values())
+        if self.memory_items <= 0 or nbytes > self.memory_bytes:
+            return
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[2]
+        self._entries[key] = (layout, arrays, nbytes)
+        self._bytes += nbytes
+        while len(self._entries) > self.memory_items or self._bytes > self.memory_bytes:
+            self._bytes -= self._entries.popitem(last=False)[1][2]
+
+    # Deletes the least recently used files until the directory fits
+    def _trimDisk(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Shared Cache ------------------------------
+# Cache used by the scripts, set up from the environment:
+#   CST305_CACHE_DIR    cache root; the disk tier is its "results" directory
+#                       (no disk tier when unset). cst305/symbolic.py keeps
+#                       its entries in "symbolic" under the same root.
+#   CST305_CACHE_ITEMS  results kept in memory (0 disables the memory tier)
+#   CST305_CACHE_MB     memory limit in MB
+#   CST305_CACHE_DISK_MB  disk limit in MB
+_shared = {"cache": None}
+
+
+def sharedCache():
+    if _shared["cache"] is None:
+        _shared["cache"] = ResultCache(
+            memory_items=int(os.environ.get("CST305_CACHE_ITEMS", DEFAULT_ITEMS)),
+            memory_bytes=int(float(os.environ.get("CST305_CACHE_MB", DEFAULT_MEMORY_BYTES >> 20)) * (1 << 20)),
+            directory=_resultsDirectory(os.environ.get("CST305_CACHE_DIR")),
+            disk_bytes=int(float(os.environ.get("CST305_CACHE_DISK_MB", DEFAULT_DISK_BYTES >> 20)) * (1 << 20)))
+    return _shared["cache"]
+
+
+def _resultsDirectory(root):
+    return os.path.join(root, "results") if root else None
+
+
+# Replaces the shared cache (same arguments as ResultCache)
+def configureCache(**settings):
+    _shared["cache"] = ResultCache(**settings)
+    return _shared["cache"]
+
+
+# sharedCache().call(...), for one-off cached calls
+def cachedCall(function, *args, depends=(), **kwargs):
+    return sharedCache().call(function, *args, depends=depends, **kwargs)
+# -----------------------------------------------------------------------
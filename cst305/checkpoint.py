@@ -0,0 +1,65 @@
+# CST 305 – Solver Checkpoints
+# Small binary (.npz) snapshots of a solver's state, step index, parameters
+# and settings, so long integrations can be killed and restarted (or a
+# finished run extended) without recomputing what is already done. Files are
+# written to a temporary name and renamed into place, so a run killed while
+# saving still leaves the previous checkpoint intact.
+#
+# Values recorded along the way go to a separate history stream (raw float64
+# rows appended to "<checkpoint>.history"), so each save writes only the
+# rows added since the last one and the checkpoint stays a fixed size.
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Save / Load -----------------------------
+# Saves keyword arrays/scalars/strings to path (".npz" is not appended)
+@instrument.timed("checkpoint.save")
+def saveCheckpoint(path, **values):
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        np.savez(file, **values)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+# Loads a checkpoint as a dict; 0-d arrays become Python scalars/strings
+def loadCheckpoint(path):
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key].item() if data[key].ndim == 0 else data[key] for key in data.files}
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- History Stream ---------------------------
+def historyPath(path):
+    return f"{path}.history"
+
+
+# Appends rows (2-D, one float64 row per recorded point) to the history of
+# checkpoint path; start=True begins a new history instead. Call it before
+# saving the checkpoint that counts the rows.
+def appendHistory(path, rows, start=False):
+    with open(historyPath(path), "wb" if start else "ab") as file:
+        np.ascontiguousarray(rows, dtype="<f8").tofile(file)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+# First `count` rows of `width` floats from the history of checkpoint path.
+# Rows appended after the checkpoint was saved (a run killed between the
+# two writes) are cut off, so later appends continue from the checkpoint.
+def loadHistory(path, count, width):
+    with open(historyPath(path), "r+b") as file:
+        rows = np.fromfile(file, dtype="<f8", count=count * width)
+        if len(rows) < count * width:
+            raise ValueError(f"{historyPath(path)} holds fewer than the {count} rows its checkpoint needs")
+        file.truncate(count * width * rows.itemsize)
+    return rows.reshape(count, width)
+# -----------------------------------------------------------------------
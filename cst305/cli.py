@@ -0,0 +1,360 @@
+# CST 305 – Command Line Entry Point
+# `python -m cst305 <command> ...` runs one calculation without any of the
+# project scripts. Each command imports its engine (and matplotlib, scipy or
+# sympy) only when it runs, so NumPy-only commands such as `mmc` or `cooling`
+# start as fast as `import numpy`.
+#
+#   lorenz   integrate the Lorenz system, print stats, save a .npy or figure
+#   sweep    Lyapunov exponent / bifurcation sweep over r
+#   cooling  Newton cooling curves and time to a threshold temperature
+#   mmc      M/M/c (Erlang C) metrics
+#   queue    simulate a G/G/c queue and print its metrics
+#   replicate  independent G/G/c replications with confidence intervals
+#   queuelog   one-pass statistics of a queue event log (CSV or binary)
+#   rates    integral of streamed rate samples from a CSV or binary file
+#   riemann  Riemann sums of a formula in x (--symbolic for closed forms)
+#   series   power series coefficients / values
+#   bench    RK4 vs odeint benchmark (arguments as for cst305.bench)
+#   workprecision  error vs cost of Euler/RK4/RK45/odeint on the course
+#            problems (arguments as for cst305.workprecision)
+
+import argparse
+import sys
+
+import numpy as np
+
+
+# ------------------------------ Commands -------------------------------
+def runLorenz(args):
+    from cst305.lorenz import DEFAULT_STEPS, resumeToFile, runBatch, runToFile
+
+    if args.resume:
+        if not (args.npy and args.checkpoint):
+            raise SystemExit("--resume needs --npy and --checkpoint")
+        from cst305.checkpoint import loadCheckpoint
+
+        # Continue after a crash, or extend a finished run to --steps
+        stats = resumeToFile(args.npy, args.checkpoint, num_steps=args.steps)
+        print(f"Trajectory resumed in {args.npy}")
+        args.steps = len(np.load(args.npy, mmap_mode="r")) - 1
+        args.dt = loadCheckpoint(args.checkpoint)["dt"]
+    elif args.npy:
+        args.steps = args.steps or DEFAULT_STEPS
+        stats = runToFile(args.npy, args.r, dt=args.dt, num_steps=args.steps, method=args.method,
+                          rtol=args.rtol, atol=args.atol, checkpoint=args.checkpoint)
+        print(f"Trajectory written to {args.npy}")
+    else:
+        args.steps = args.steps or DEFAULT_STEPS
+        time, trajectories, stats = runBatch(args.r, dt=args.dt, num_steps=args.steps, method=args.method,
+                                          rtol=args.rtol, atol=args.atol)
+        for r, final in zip(args.r, trajectories[-1]):
+            print(f"r = {r:g}: final state x = {final[0]:.6f}, y = {final[1]:.6f}, z = {final[2]:.6f}")
+    print(f"{stats['method']}: {stats['accepted']} accepted steps, {stats['rejected']} rejected, "
+          f"{stats['rhs_evals']} derivative evaluations")
+
+    if args.figure:
+        from cst305.render import stateFigure, trajectoryFigure, useHeadless
+
+        # Figures are decimated from the run above; a streamed .npy is read
+        # back chunk by chunk
+        useHeadless()
+        for index, r in enumerate(args.r):
+            path = args.figure.format(r=r)
+            if args.npy:
+                fig = trajectoryFigure(args.npy, dt=args.dt, index=index)
+            else:
+                fig = stateFigure(time, trajectories[:, index], f"r = {r:g}")
+            fig.savefig(path)
+            print(f"Figure written to {path}")
+
+
+def runSweep(args):
+    from cst305.bifurcation import plotBifurcation, sweep
+
+    r_values = np.linspace(args.start, args.stop, args.count)
+    result = sweep(r_values, processes=args.processes, num_steps=args.steps,
+                   transient_steps=args.transient)
+    for r, lyapunov in zip(result["r"], result["lyapunov"]):
+        print(f"r = {r:10.4f}  lyapunov = {lyapunov: .5f}")
+    if args.out:
+        from cst305.render import useHeadless
+
+        useHeadless()
+        plotBifurcation(result, args.out)
+        print(f"Figure written to {args.out}")
+
+
+def runCooling(args):
+    from cst305.cooling import coolingCurves, timeToThreshold
+
+    t = np.linspace(0, args.time, args.points)
+    s = np.asarray(args.s, dtype=float)
+    curves = coolingCurves(t, args.k, s[:, None], args.T0)
+    print("t".rjust(10) + "".join(f"s = {value:g}".rjust(14) for value in s))
+    for i, ti in enumerate(t):
+        print(f"{ti:10.4f}" + "".join(f"{T:14.4f}" for T in curves[:, i]))
+    if args.threshold is not None:
+        for value, seconds in zip(s, timeToThreshold(args.k, s, args.T0, args.threshold)):
+            print(f"s = {value:g}: reaches {args.threshold:g} after {seconds:.4f} (inf = never)")
+
+
+def runMmc(args):
+    from cst305.mmc import mmcMetrics
+
+    metrics = mmcMetrics(args.lam, args.mu, args.c)
+    for name in ("utilization", "P_wait", "W_q", "T", "N_q", "N", "throughput"):
+        print(f"{name:>12}: {float(metrics[name]):.6g}")
+
+
+def runQueue(args):
+    from cst305.queueing import generateCustomers, queueMetrics, simulateQueue
+
+    arrivals, services = generateCustomers(args.customers, args.arrival_rate, args.service_rate,
+                                           arrival=args.arrival, service=args.service, seed=args.seed)
+    queue = simulateQueue(arrivals, services, servers=args.servers)
+    for name, value in queueMetrics(queue, warmup=args.warmup).items():
+        print(f"{name:>13}: {value:.6g}")
+    if args.events:
+        from cst305.queuestats import queueEvents, writeEvents
+
+        with open(args.events, "wb"):
+            pass  # Start a new log
+        for times, kinds in queueEvents(queue):
+            writeEvents(args.events, times, kinds)
+        print(f"Event log written to {args.events}")
+
+
+def runQueueLog(args):
+    from cst305.queuestats import analyzeFile
+
+    kwargs = {"skiprows": args.skiprows} if args.format == "csv" else {}
+    summary = analyzeFile(args.path, args.format, servers=args.servers,
+                          quantiles=tuple(args.quantiles), **kwargs).summary()
+    quantiles = summary.pop("W_q_quantiles")
+    for name, value in summary.items():
+        print(f"{name:>13}: {value:.6g}")
+    for p, value in quantiles.items():
+        print(f"{f'W_q p{100 * p:g}':>13}: {value:.6g}")
+
+
+def runReplicate(args):
+    from cst305.replications import TRACKED, formatReplications, replicateQueue
+
+    result = replicateQueue(args.arrival_rate, args.service_rate, servers=args.servers,
+                            customers=args.customers, warmup=args.warmup, arrival=args.arrival,
+                            service=args.service, seed=args.seed,
+                            min_replications=args.min_replications,
+                            max_replications=args.max_replications,
+                            precision=args.precision or None, confidence=args.confidence,
+                            processes=args.processes)
+    print(formatReplications(result, names=TRACKED + ("L", "W")))
+
+
+def runRates(args):
+    from cst305.rates import integrateFile
+
+    kwargs = {"skiprows": args.skiprows} if args.format == "csv" else {}
+    integrator = integrateFile(args.path, args.format, index=bool(args.window), **kwargs)
+    print(f"{integrator.count} samples, total = {integrator.total():.12g}")
+    for t1, t2 in zip(args.window[::2], args.window[1::2]):
+        print(f"total over [{t1:g}, {t2:g}] = {integrator.between(t1, t2):.12g}")
+
+
+def runRiemann(args):
+    import sympy as sp
+
+    x = sp.symbols('x')
+    f = sp.sympify(args.formula, locals={"x": x})
+    a, b = sp.sympify(args.a), sp.sympify(args.b)
+
+    if args.symbolic:
+        from cst305.symbolic import symbolicRiemann
+
+        riemann_sum, limit_riemann_sum = symbolicRiemann(f, x, a, b)
+        print(f"Riemann Sum Formula: {riemann_sum}")
+        print(f"Limit as n -> infinity: {limit_riemann_sum}")
+        return
+
+    from cst305.riemann import riemannSum
+
+    function = sp.lambdify(x, f, "numpy")
+    for rule in args.rules:
+        value, error = riemannSum(function, float(a), float(b), args.n, rule)
+        print(f"{rule:>9} sum with n = {args.n}: {value:.12g} (error {error:.2e})")
+
+
+def runSeries(args):
+    from cst305.series import evaluateSeries, seriesCoefficients
+
+    if args.x is None:
+        coefficients = seriesCoefficients(args.n, mode=args.mode)
+        if args.mode == "log":  # (signs, log|a_n|)
+            coefficients = (f"{sign:+g} * exp({log:.15g})" for sign, log in zip(*coefficients))
+        for i, value in enumerate(coefficients):
+            print(f"a_{i} = {value}")
+    else:
+        for x, value in zip(args.x, np.atleast_1d(evaluateSeries(np.asarray(args.x), args.n))):
+            print(f"y({x:g}) = {value:.15g}")
+
+
+def runBench(args):
+    from cst305.bench import main
+
+    main(args.rest)
+
+
+def runWorkPrecision(args):
+    from cst305.workprecision import main
+
+    main(args.rest)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Parser ---------------------------------
+def buildParser():
+    parser = argparse.ArgumentParser(prog="python -m cst305", description="CST 305 numerical engines")
+    parser.add_argument("--instrument", action="store_true",
+                        help="print solver work (evaluations, steps, phase times) at the end")
+    parser.add_argument("--profile", metavar="FILE", nargs="?", const="",
+                        help="run under cProfile; print the top functions (and save stats to FILE)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace allocations with tracemalloc; print the peak and top lines")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lorenz = commands.add_parser("lorenz", help="integrate the Lorenz system")
+    lorenz.add_argument("r", nargs="+", type=float)
+    lorenz.add_argument("--method", choices=("euler", "rk4", "rk45"), default="euler")
+    lorenz.add_argument("--dt", type=float, default=0.01)
+    lorenz.add_argument("--steps", type=int, default=None, help="number of steps (default 10000)")
+    lorenz.add_argument("--rtol", type=float, default=1e-6)
+    lorenz.add_argument("--atol", type=float, default=1e-9)
+    lorenz.add_argument("--npy", help="stream the trajectory to this .npy file")
+    lorenz.add_argument("--figure", help="save a figure per r, e.g. lorenz_{r}.png")
+    lorenz.add_argument("--checkpoint", help="with --npy: checkpoint file saved after every chunk")
+    lorenz.add_argument("--resume", action="store_true",
+                        help="continue --npy from --checkpoint (to --steps to extend the run)")
+    lorenz.set_defaults(run=runLorenz)
+
+    sweep = commands.add_parser("sweep", help="Lyapunov / bifurcation sweep over r")
+    sweep.add_argument("--start", type=float, default=0.0)
+    sweep.add_argument("--stop", type=float, default=200.0)
+    sweep.add_argument("--count", type=int, default=200)
+    sweep.add_argument("--steps", type=int, default=20000)
+    sweep.add_argument("--transient", type=int, default=5000)
+    sweep.add_argument("--processes", type=int, default=None)
+    sweep.add_argument("--out", help="save the bifurcation figure to this file")
+    sweep.set_defaults(run=runSweep)
+
+    cooling = commands.add_parser("cooling", help="Newton cooling curves")
+    cooling.add_argument("--k", type=float, default=0.5)
+    cooling.add_argument("--T0", type=float, default=80.0)
+    cooling.add_argument("--s", nargs="+", type=float, default=[50, 60, 70, 80, 90])
+    cooling.add_argument("--time", type=float, default=10.0)
+    cooling.add_argument("--points", type=int, default=11)
+    cooling.add_argument("--threshold", type=float, default=None)
+    cooling.set_defaults(run=runCooling)
+
+    mmc = commands.add_parser("mmc", help="M/M/c queue metrics")
+    mmc.add_argument("lam", type=float, help="arrival rate")
+    mmc.add_argument("mu", type=float, help="service rate per server")
+    mmc.add_argument("c", type=int, help="number of servers")
+    mmc.set_defaults(run=runMmc)
+
+    queue = commands.add_parser("queue", help="simulate a FIFO queue")
+    queue.add_argument("--customers", type=int, default=10**6)
+    queue.add_argument("--arrival-rate", type=float, default=1.0)
+    queue.add_argument("--service-rate", type=float, default=1.25)
+    queue.add_argument("--arrival", default="exponential")
+    queue.add_argument("--service", default="exponential")
+    queue.add_argument("--servers", type=int, default=1)
+    queue.add_argument("--warmup", type=int, default=0, help="customers dropped from the averages")
+    queue.add_argument("--seed", type=int, default=None)
+    queue.add_argument("--events", help="also write the binary event log to this file")
+    queue.set_defaults(run=runQueue)
+
+    replicate = commands.add_parser("replicate", help="queue replications with confidence intervals")
+    replicate.add_argument("--customers", type=int, default=100000, help="customers per replication")
+    replicate.add_argument("--arrival-rate", type=float, default=1.0)
+    replicate.add_argument("--service-rate", type=float, default=1.25)
+    replicate.add_argument("--arrival", default="exponential")
+    replicate.add_argument("--service", default="exponential")
+    replicate.add_argument("--servers", type=int, default=1)
+    replicate.add_argument("--warmup", type=int, default=1000, help="customers dropped per replication")
+    replicate.add_argument("--seed", type=int, default=None)
+    replicate.add_argument("--min-replications", type=int, default=10)
+    replicate.add_argument("--max-replications", type=int, default=200)
+    replicate.add_argument("--precision", type=float, default=0.05,
+                           help="stop at this relative half-width (0 runs all replications)")
+    replicate.add_argument("--confidence", type=float, default=0.95)
+    replicate.add_argument("--processes", type=int, default=None)
+    replicate.set_defaults(run=runReplicate)
+
+    queuelog = commands.add_parser("queuelog", help="one-pass statistics of a queue event log")
+    queuelog.add_argument("path")
+    queuelog.add_argument("--format", choices=("csv", "binary"), default="binary")
+    queuelog.add_argument("--skiprows", type=int, default=0, help="header lines in a CSV file")
+    queuelog.add_argument("--servers", type=int, default=1)
+    queuelog.add_argument("--quantiles", nargs="+", type=float, default=[0.5, 0.9, 0.99])
+    queuelog.set_defaults(run=runQueueLog)
+
+    rates = commands.add_parser("rates", help="integrate rate samples from a file")
+    rates.add_argument("path")
+    rates.add_argument("--format", choices=("csv", "binary"), default="csv")
+    rates.add_argument("--skiprows", type=int, default=0, help="header lines in a CSV file")
+    rates.add_argument("--window", nargs="*", type=float, default=[], metavar="T",
+                       help="pairs t1 t2 of windows to integrate")
+    rates.set_defaults(run=runRates)
+
+    riemann = commands.add_parser("riemann", help="Riemann sums of a formula in x")
+    riemann.add_argument("formula", help="e.g. 'sin(x) + 1'")
+    riemann.add_argument("a")
+    riemann.add_argument("b")
+    riemann.add_argument("--n", type=int, default=1000)
+    riemann.add_argument("--rules", nargs="+", default=["left", "mid", "right", "trapezoid", "simpson"])
+    riemann.add_argument("--symbolic", action="store_true", help="closed form and limit (sympy)")
+    riemann.set_defaults(run=runRiemann)
+
+    series = commands.add_parser("series", help="power series coefficients or values")
+    series.add_argument("--n", type=int, default=10, help="number of terms")
+    series.add_argument("--mode", choices=("float", "log", "exact"), default="float")
+    series.add_argument("--x", nargs="+", type=float, default=None, help="evaluate at these points")
+    series.set_defaults(run=runSeries)
+
+    bench = commands.add_parser("bench", help="RK4 vs odeint benchmark", add_help=False)
+    bench.set_defaults(run=runBench, rest=[])
+
+    workprecision = commands.add_parser("workprecision", help="work-precision benchmark",
+                                        add_help=False)
+    workprecision.set_defaults(run=runWorkPrecision, rest=[])
+    return parser
+
+
+def main(argv=None):
+    parser = buildParser()
+    # Options after `bench` / `workprecision` belong to those modules, not
+    # to this parser
+    args, extra = parser.parse_known_args(argv)
+    if args.command in ("bench", "workprecision"):
+        args.rest = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    import contextlib
+    from cst305 import instrument
+
+    if args.instrument:
+        instrument.enable()
+    with contextlib.ExitStack() as hooks:
+        if args.profile is not None:
+            hooks.enter_context(instrument.profile(args.profile or None))
+        if args.trace_memory:
+            hooks.enter_context(instrument.traceMemory())
+        args.run(args)
+    if instrument.enabled() or args.profile is not None or args.trace_memory:
+        print(instrument.formatReport(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# -----------------------------------------------------------------------
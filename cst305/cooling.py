@@ -0,0 +1,135 @@
+# CST 305 – Newton's Law of Cooling, Closed Form and Batched
+# dT/dt = -k (T - s) has the exact solution T(t) = s + (T0 - s) e^(-k t), so
+# whole grids of cooling rates k, surrounding temperatures s and starting
+# temperatures T0 are evaluated in one vectorized pass instead of one odeint
+# call per combination. odeint and the shared solvers in cst305/ode.py are
+# only used by the optional cross-checks; the "rosenbrock" solver stays
+# stable for any cooling constant (stiff k * dt >> 1).
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Newton's Law --------------------------------
+# T = current temperature, t = time (needed by odeint), k = cooling
+# constant, s = surrounding temperature. Returns dT/dt.
+def model(T, t, k, s):
+    return -k * (T - s)
+
+
+# Jacobian of model: diagonal, d(dT/dt)/dT = -k for every temperature
+def jacobian(T, t, k, s):
+    return np.broadcast_to(-k, np.shape(T))
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Broadcast Helpers ----------------------------
+# With grid=True every argument is treated as its own 1-D axis and the
+# result has shape (len(k), len(s), len(T0), len(t)); otherwise the arrays
+# are broadcast against each other with the usual NumPy rules.
+def _asGrid(*arrays):
+    arrays = [np.atleast_1d(np.asarray(a, dtype=float)).ravel() for a in arrays]
+    return np.ix_(*arrays)
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Closed-Form Curves ---------------------------
+# Temperatures T(t) for broadcast arrays of (k, s, T0, t).
+#   method = "exact"  closed form (default)
+#            "odeint" numerical cross-check: all combinations are solved as
+#                     one vector ODE in a single odeint call (t must be 1-D
+#                     and is used as the last axis)
+#            "euler", "rk4", "rk45", "rosenbrock"
+#                     the same check with a solver from cst305/ode.py (t
+#                     must also be evenly spaced)
+# Numerical results are kept in the result cache (cst305/cache.py), so
+# repeating a cross-check does not solve the ODE again.
+def coolingCurves(t, k, s, T0, grid=False, method="exact"):
+    if grid:
+        k, s, T0, t = _asGrid(k, s, T0, t)
+    if method == "exact":
+        return s + (T0 - s) * np.exp(-k * t)
+    from cst305.cache import cachedCall
+
+    if method == "odeint":
+        return cachedCall(_coolingOdeint, t, k, s, T0)
+    from cst305.ode import METHODS
+
+    if method in METHODS:
+        return cachedCall(_coolingSolver, t, k, s, T0, method, depends=("cst305.ode",))
+    raise ValueError(f"method must be 'exact', 'odeint' or one of {METHODS}, not {method!r}")
+
+
+# Every (k, s, T0) combination becomes one component of a vector ODE.
+# Returns the result shape, the flat times and the flat k, s and T0.
+def _vectorSystem(t, k, s, T0):
+    t = np.asarray(t, dtype=float)
+    params = [np.asarray(p, dtype=float) for p in (k, s, T0)]
+    if t.ndim == 0 or t.size != t.shape[-1] or any(p.ndim and p.shape[-1] != 1 for p in params):
+        raise ValueError("the numerical cross-check needs the times along the last axis only")
+
+    shape = np.broadcast_shapes(t.shape, *(p.shape for p in params))
+    k, s, T0 = (np.broadcast_to(p, shape)[..., 0].ravel() for p in params)
+    return shape, t.ravel(), k, s, T0
+
+
+def _coolingOdeint(t, k, s, T0):
+    from scipy.integrate import odeint
+
+    shape, t, k, s, T0 = _vectorSystem(t, k, s, T0)
+    solution, info = odeint(model, T0, t, args=(k, s), rtol=1e-10, atol=1e-10, full_output=True)
+    instrument.count("odeint", rhs_evals=info["nfe"][-1], accepted=info["nst"][-1],
+                     jac_evals=info["nje"][-1])
+    return np.moveaxis(solution, 0, -1).reshape(shape)
+
+
+def _coolingSolver(t, k, s, T0, method):
+    from cst305.ode import solve
+
+    shape, t, k, s, T0 = _vectorSystem(t, k, s, T0)
+    dt = t[1] - t[0] if len(t) > 1 else 1.0
+    if not np.allclose(np.diff(t), dt, rtol=1e-9, atol=0):
+        raise ValueError("the solver cross-check needs evenly spaced times")
+
+    _, solution = solve(lambda T, time: model(T, time, k, s), T0, dt, len(t) - 1, method,
+                        t0=t[0], jac=lambda T, time: jacobian(T, time, k, s),
+                        dfdt=lambda T, time: 0.0)
+    return np.moveaxis(solution, 0, -1).reshape(shape)
+
+
+# Largest absolute difference between the closed form and a numerical
+# method ("odeint" or a cst305/ode.py solver)
+def crossCheck(t, k, s, T0, grid=True, method="odeint"):
+    exact = coolingCurves(t, k, s, T0, grid=grid)
+    numeric = coolingCurves(t, k, s, T0, grid=grid, method=method)
+    return float(np.max(np.abs(exact - numeric)))
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Derived Quantities ---------------------------
+# Time for the temperature to reach `threshold`:
+#   t = ln((T0 - s) / (threshold - s)) / k
+# 0 where T0 already equals the threshold (including T0 == s == threshold,
+# where the ratio is 0/0), inf where the threshold is never reached: it is
+# not between T0 and s, or k == 0 and the temperature never changes.
+def timeToThreshold(k, s, T0, threshold, grid=False):
+    if grid:
+        k, s, T0, threshold = _asGrid(k, s, T0, threshold)
+    k, s, T0, threshold = np.broadcast_arrays(*(np.asarray(p, dtype=float)
+                                                for p in (k, s, T0, threshold)))
+    start = T0 - s
+    end = threshold - s
+    already = start == end
+    reachable = (start * end > 0) & (np.abs(end) <= np.abs(start)) & (k != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        times = np.log(start / end) / k
+    return np.where(already, 0.0, np.where(reachable, times, np.inf))
+
+
+# Time for the gap to the surrounding temperature to halve: ln(2) / k
+def halfLife(k):
+    return np.log(2) / np.asarray(k, dtype=float)
+# -----------------------------------------------------------------------
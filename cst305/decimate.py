@@ -0,0 +1,157 @@
+# CST 305 – Downsampling Series for Plotting
+# A plot a few thousand pixels wide cannot show more than a few thousand
+# points per series, but matplotlib still draws (and keeps in memory) every
+# point it is given. These routines cut a series to a point budget while
+# keeping its shape:
+#   "minmax"  the lowest and highest point of each bin of consecutive
+#             samples (every peak, trough and lobe switch survives); works
+#             on several columns at once and chunk by chunk, so trajectories
+#             streamed from disk never need to fit in memory
+#   "lttb"    Largest-Triangle-Three-Buckets: one point per bucket, the one
+#             forming the largest triangle with its neighbours; visually
+#             closest for a single in-memory 1-D series
+# The first and last samples are always kept and indices stay in order.
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_POINTS = 4000     # Points kept per series (about 2 per pixel)
+METHODS = ("minmax", "lttb")
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Min / Max --------------------------------
+# Indices of the min and max of each column in each bin of bin_size rows
+# of values (shape (n,) or (n, columns)), sorted and without repeats
+def _binExtremes(values, bin_size):
+    values = values.reshape(len(values), -1)
+    full = len(values) // bin_size * bin_size
+    picks = []
+    if full:
+        bins = values[:full].reshape(-1, bin_size, values.shape[1])
+        offsets = np.arange(0, full, bin_size)[:, None]
+        picks += [offsets + bins.argmin(axis=1), offsets + bins.argmax(axis=1)]
+    if full < len(values):
+        tail = values[full:]
+        picks += [full + tail.argmin(axis=0), full + tail.argmax(axis=0)]
+    return np.unique(np.concatenate([np.ravel(p) for p in picks]))
+
+
+def _binSize(num_points, target, columns=1):
+    # Each bin keeps up to 2 points per column
+    bins = max(1, (target - 2) // (2 * columns))
+    return max(1, -(-num_points // bins))
+
+
+# Indices for min/max decimation of values (n,) or (n, columns) to about
+# target rows
+def minMaxIndices(values, target=DEFAULT_POINTS):
+    values = np.asarray(values)
+    n = len(values)
+    columns = values.size // n if n else 1
+    if n <= target:
+        return np.arange(n)
+    indices = _binExtremes(values, _binSize(n, target, columns))
+    return np.union1d(indices, [0, n - 1])
+# -----------------------------------------------------------------------
+
+
+# ------------------------------- LTTB ----------------------------------
+# Indices of the Largest-Triangle-Three-Buckets selection of the 1-D series
+# (x, y) with target points
+def lttbIndices(x, y, target=DEFAULT_POINTS):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= target or target < 3:
+        return np.arange(n) if n <= target else np.array([0, n - 1])
+
+    # Buckets split the interior points 1 .. n-2; the averages of every
+    # bucket are needed as the third triangle vertex
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    mean_x = np.append(mean_x, x[-1])
+    mean_y = np.append(mean_y, y[-1])
+
+    selected = np.empty(target, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for bucket in range(target - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        cx, cy = mean_x[bucket + 1], mean_y[bucket + 1]
+        # Twice the triangle area (a, point, next bucket average)
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[bucket + 1] = a
+    return selected
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Decimate --------------------------------
+# Returns (x, y) reduced to about target points. y may have several columns
+# (shape (n, columns)) with method "minmax"; "lttb" needs a 1-D y.
+def decimate(x, y, target=DEFAULT_POINTS, method="minmax"):
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == "minmax":
+        indices = minMaxIndices(y, target)
+    elif method == "lttb":
+        if y.ndim != 1:
+            raise ValueError("lttb decimates one series at a time (1-D y)")
+        indices = lttbIndices(x, y, target)
+    else:
+        raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+    return x[indices], y[indices]
+
+
+# Min/max decimation of a series too large for memory. chunks yields
+# consecutive blocks of rows (arrays (rows,) or (rows, ...)), num_points is
+# the total number of rows. Bins are fixed from num_points, and rows of a
+# bin split across chunks are carried to the next chunk, so the result is
+# the same as minMaxIndices on the whole series.
+# Returns (indices, rows): the kept row numbers and the rows themselves.
+def streamMinMax(chunks, num_points, target=DEFAULT_POINTS):
+    bin_size = None
+    carry = None
+    start = 0
+    indices, rows = [], []
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        if not len(chunk):
+            continue
+        if bin_size is None:
+            bin_size = 1 if num_points <= target else _binSize(num_points, target, chunk[0].size)
+            indices.append(np.array([0]))      # first row, always kept
+            rows.append(chunk[:1])
+        if carry is not None:
+            chunk = np.concatenate([carry, chunk])
+
+        # Whole bins now; a partial last bin waits for more rows
+        full = len(chunk) // bin_size * bin_size
+        if full:
+            picked = _binExtremes(chunk[:full], bin_size)
+            indices.append(start + picked)
+            rows.append(chunk[picked])
+        carry = chunk[full:]
+        last = (start + len(chunk) - 1, chunk[-1:])
+        start += full
+
+    if bin_size is None:
+        return np.arange(0), np.empty(0)
+    if len(carry):
+        picked = _binExtremes(carry, bin_size)
+        indices.append(start + picked)
+        rows.append(carry[picked])
+    indices.append(np.array([last[0]]))        # last row, always kept
+    rows.append(last[1])
+
+    indices = np.concatenate(indices)
+    rows = np.concatenate(rows)
+    indices, keep = np.unique(indices, return_index=True)
+    return indices, rows[keep]
+# -----------------------------------------------------------------------
@@ -0,0 +1,146 @@
+# CST 305 – Green's Function Solver for Linear ODEs
+# Solves constant-coefficient linear ODEs
+#   a_n y^(n) + ... + a_1 y' + a_0 y = f(t)
+# on a uniform time grid for any sampled forcing f. The response is the
+# convolution of f with the impulse response (Green's function) g, so the
+# kernel is computed once per system and grid, and every forcing signal is
+# then a single FFT convolution: O(N log N) per signal, batched over any
+# number of signals at once, instead of one ODE integration per signal.
+#
+# The forcing is taken as piecewise linear between samples and the kernel
+# weights integrate g against it exactly (first-order hold), so polynomial
+# forcing of degree <= 1 (e.g. f = t or f = 4) is reproduced to rounding.
+# Initial conditions add the homogeneous solution, from powers of the exact
+# one-step matrix exp(A dt) of the companion system.
+
+# ---------------------- Import Required Libraries ----------------------
+import math
+
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Companion System ----------------------------
+# x = (y, y', ..., y^(n-1)) satisfies x' = A x + B f with B = e_n / a_n
+def companion(coefficients):
+    coefficients = np.asarray(coefficients, dtype=float)
+    if coefficients.ndim != 1 or len(coefficients) < 2 or coefficients[0] == 0:
+        raise ValueError("coefficients must be (a_n, ..., a_0) with a_n != 0 and n >= 1")
+    order = len(coefficients) - 1
+    A = np.eye(order, k=1)
+    A[-1] = -coefficients[:0:-1] / coefficients[0]
+    B = np.zeros(order)
+    B[-1] = 1 / coefficients[0]
+    return A, B
+
+
+# M^m V for m = 0 .. count - 1, shape (count,) + V.shape. Blocks of
+# sqrt(count) powers are advanced by M^block with one batched matmul each,
+# so the Python loop runs O(sqrt(count)) times.
+def _powers(M, V, count):
+    shape = V.shape
+    V = V.reshape(len(M), -1)
+    block = math.isqrt(max(count - 1, 0)) + 1
+    base = [V]
+    for _ in range(1, min(block, count)):
+        base.append(M @ base[-1])
+    current = np.stack(base)
+    jump = np.linalg.matrix_power(M, block)
+
+    out = np.empty((count,) + V.shape)
+    for start in range(0, count, block):
+        stop = min(start + block, count)
+        out[start:stop] = current[:stop - start]
+        current = jump @ current
+    return out.reshape((count,) + shape)
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Green's Solver ----------------------------
+# Solver for one system on the grid t_k = t0 + k dt, k = 0 .. num_points-1.
+#   solve(forcing, initial)  forcing: array (..., num_points) of samples, one
+#                            signal per row; initial: (y(0), y'(0), ...)
+#                            broadcast against the leading axes (default 0)
+#   homogeneous(initial)     solution with f = 0
+#   impulseResponse()        g(t_k - t0)
+class GreensSolver:
+
+    @instrument.timed("greens.kernel")
+    def __init__(self, coefficients, dt, num_points):
+        from scipy.linalg import expm
+
+        self.A, self.B = companion(coefficients)
+        self.order = len(self.B)
+        self.dt = float(dt)
+        self.num_points = int(num_points)
+
+        # Van Loan block exponential: with E = expm([[A, I, 0], [0, 0, I],
+        # [0, 0, 0]] dt), E01 = int_0^dt e^{As} ds and
+        # E02 = int_0^dt e^{As} (dt - s) ds
+        n = self.order
+        block = np.zeros((3 * n, 3 * n))
+        block[:n, :n] = self.A
+        block[:n, n:2 * n] = np.eye(n)
+        block[n:2 * n, 2 * n:] = np.eye(n)
+        E = expm(block * self.dt)
+        self.step = E[:n, :n]
+        first = E[:n, n:2 * n]                            # int e^{As} ds
+        ramp = first - E[:n, 2 * n:] / self.dt            # int e^{As} s/dt ds
+
+        # Hat function of sample j split at t_j: the half before t_j weighs
+        # g(t_k - t_j + s) (1 - s/dt), the half after g(t_k - t_j - s) (1 - s/dt)
+        #   before[m] = e1 . M^m (first - ramp) B        (samples j >= 1)
+        #   after[m]  = e1 . M^(m-1) ramp B, m >= 1      (samples j < k)
+        vectors = np.stack([(first - ramp) @ self.B, ramp @ self.B], axis=1)
+        powers = _powers(self.step, vectors, self.num_points)[:, 0]
+        self.before = powers[:, 0]
+        self.after = np.concatenate(([0.0], powers[:-1, 1]))
+        self.kernel = self.before + self.after
+
+        self._fft_size = None
+        self._kernel_fft = None
+
+    def impulseResponse(self):
+        e_n = np.zeros(self.order)
+        e_n[-1] = 1.0
+        return _powers(self.step, e_n, self.num_points)[:, 0] * self.B[-1]
+
+    def homogeneous(self, initial):
+        initial = np.asarray(initial, dtype=float)
+        if initial.shape[-1:] != (self.order,):
+            raise ValueError(f"initial must hold {self.order} values (y(0), y'(0), ...)")
+        flat = initial.reshape(-1, self.order).T               # (order, batch)
+        y = _powers(self.step, flat, self.num_points)[:, 0]     # (num_points, batch)
+        return y.T.reshape(initial.shape[:-1] + (self.num_points,))
+
+    @instrument.timed("greens.solve")
+    def solve(self, forcing, initial=None):
+        from scipy import fft
+
+        forcing = np.asarray(forcing, dtype=float)
+        if forcing.shape[-1] != self.num_points:
+            raise ValueError(f"forcing must have {self.num_points} samples along the last axis")
+        if self._kernel_fft is None:
+            self._fft_size = fft.next_fast_len(2 * self.num_points - 1, real=True)
+            self._kernel_fft = fft.rfft(self.kernel, self._fft_size)
+
+        # y_k = sum_j f_j kernel[k - j], minus the half hat before t_0
+        y = fft.irfft(fft.rfft(forcing, self._fft_size, axis=-1) * self._kernel_fft,
+                      self._fft_size, axis=-1)[..., :self.num_points]
+        y -= forcing[..., :1] * self.before
+        if initial is not None:
+            y = y + self.homogeneous(initial)
+        return y
+
+
+# Solves on the uniform grid t (1-D) for forcing sampled on it, e.g.
+#   solveLinear((1, 0, 4), t, t)   for y'' + 4y = t, y(0) = y'(0) = 0
+def solveLinear(coefficients, t, forcing, initial=None):
+    t = np.asarray(t, dtype=float)
+    dt = t[1] - t[0]
+    if not np.allclose(np.diff(t), dt, rtol=1e-9, atol=0):
+        raise ValueError("t must be evenly spaced")
+    return GreensSolver(coefficients, dt, len(t)).solve(forcing, initial)
+# -----------------------------------------------------------------------
@@ -0,0 +1,219 @@
+# CST 305 – Solver Instrumentation
+# One place every solver reports its work to: right-hand-side evaluations,
+# accepted and rejected steps, Jacobian builds and the wall time of each
+# phase (integration, file output, rendering, ...). Off by default and
+# switched at runtime with enable()/disable() or CST305_INSTRUMENT=1.
+#
+# Solvers report once per call (totals computed from their own step
+# counts), never from inside the stepping loop, and every entry point
+# returns immediately while instrumentation is off, so an uninstrumented
+# run does exactly the work it did before.
+#
+# Two standard-library hooks attribute cost to hot paths:
+#   profile()      cProfile around a block; the top functions go into the
+#                  report and optionally a .prof file (pstats/snakeviz)
+#   traceMemory()  tracemalloc around a block: peak traced memory, the top
+#                  allocating lines, and per-phase peaks while it runs
+
+# ---------------------- Import Required Libraries ----------------------
+import contextlib
+import os
+import time
+from collections import defaultdict
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ State ----------------------------------
+_state = {"enabled": os.environ.get("CST305_INSTRUMENT", "") not in ("", "0"),
+          "peak": 0}                               # Traced peak since traceMemory()
+_counters = defaultdict(lambda: defaultdict(int))   # solver -> name -> count
+_phases = defaultdict(lambda: {"calls": 0, "seconds": 0.0, "peak_bytes": 0})
+_extras = {}                                       # "profile", "memory" sections
+_open = []                                         # Phases being timed, innermost last
+_NULL = contextlib.nullcontext()
+
+
+def enable():
+    _state["enabled"] = True
+
+
+def disable():
+    _state["enabled"] = False
+
+
+def enabled():
+    return _state["enabled"]
+
+
+def reset():
+    _counters.clear()
+    _phases.clear()
+    _extras.clear()
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Counters --------------------------------
+# Adds counts for one solver, e.g.
+#   count("rk4", rhs_evals=4 * runs, accepted=runs)
+def count(solver, **counts):
+    if not _state["enabled"]:
+        return
+    totals = _counters[solver]
+    for name, value in counts.items():
+        totals[name] += int(value)
+
+
+# Adds the counts of a solver stats dict (cst305/ode.py style: accepted,
+# rejected, rhs_evals, jac_evals); other entries are ignored
+def countStats(solver, stats):
+    if not _state["enabled"]:
+        return
+    count(solver, **{name: stats[name] for name in ("accepted", "rejected", "rhs_evals", "jac_evals")
+                     if name in stats})
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Phases ---------------------------------
+# Context manager timing a phase:  with phase("lorenz.integrate"): ...
+# Calls and wall time add up over repeated phases with the same name.
+# While traceMemory() is active the traced peak inside the phase is kept.
+def phase(name):
+    if not _state["enabled"]:
+        return _NULL
+    return _Phase(name)
+
+
+class _Phase:
+
+    def __init__(self, name):
+        self.name = name
+        self.peak = 0
+
+    def __enter__(self):
+        _collectPeak()
+        _open.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        _collectPeak()
+        _open.remove(self)
+        entry = _phases[self.name]
+        entry["calls"] += 1
+        entry["seconds"] += elapsed
+        entry["peak_bytes"] = max(entry["peak_bytes"], self.peak)
+        return False
+
+
+# tracemalloc keeps a single peak, so before it is reset (at every phase
+# boundary) the peak so far is handed to all open phases and traceMemory
+def _collectPeak():
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return
+    peak = tracemalloc.get_traced_memory()[1]
+    for open_phase in _open:
+        open_phase.peak = max(open_phase.peak, peak)
+    _state["peak"] = max(_state["peak"], peak)
+    tracemalloc.reset_peak()
+
+
+# Decorator form of phase() for whole functions
+def timed(name):
+    def decorate(function):
+        import functools
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Profilers -------------------------------
+# cProfile around a block (instrumentation is switched on inside it). The
+# `limit` most expensive functions by `sort` go into report()["profile"];
+# path additionally dumps the raw stats for pstats/snakeviz.
+@contextlib.contextmanager
+def profile(path=None, sort="cumulative", limit=25):
+    import cProfile
+    import io
+    import pstats
+
+    was_enabled = _state["enabled"]
+    enable()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        _state["enabled"] = was_enabled
+        if path is not None:
+            profiler.dump_stats(path)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats(sort).print_stats(limit)
+        _extras["profile"] = text.getvalue()
+
+
+# tracemalloc around a block: report()["memory"] gets the peak traced bytes
+# and the `limit` source lines holding the most memory at the end
+@contextlib.contextmanager
+def traceMemory(limit=10, frames=1):
+    import tracemalloc
+
+    was_enabled = _state["enabled"]
+    enable()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(frames)
+    tracemalloc.reset_peak()
+    _state["peak"] = 0
+    try:
+        yield
+    finally:
+        _collectPeak()
+        peak = _state["peak"]
+        top = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+        if started:
+            tracemalloc.stop()
+        _state["enabled"] = was_enabled
+        _extras["memory"] = {"peak_bytes": peak,
+                             "top": [(str(stat.traceback), stat.size, stat.count) for stat in top]}
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Report ---------------------------------
+# Everything recorded so far as plain dicts
+def report():
+    result = {"counters": {solver: dict(counts) for solver, counts in _counters.items()},
+              "phases": {name: dict(entry) for name, entry in _phases.items()}}
+    result.update(_extras)
+    return result
+
+
+# report() as readable text
+def formatReport(data=None):
+    data = report() if data is None else data
+    lines = []
+    for solver, counts in sorted(data["counters"].items()):
+        lines.append(f"{solver}: " + ", ".join(f"{name} = {value}" for name, value in sorted(counts.items())))
+    for name, entry in sorted(data["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        line = f"{name}: {entry['seconds']:.4f} s in {entry['calls']} call(s)"
+        if entry["peak_bytes"]:
+            line += f", peak {entry['peak_bytes'] / 2**20:.1f} MB"
+        lines.append(line)
+    if "memory" in data:
+        lines.append(f"traced memory peak: {data['memory']['peak_bytes'] / 2**20:.1f} MB")
+        for where, size, number in data["memory"]["top"]:
+            lines.append(f"  {size / 2**10:10.1f} KB in {number:7d} blocks  {where}")
+    if "profile" in data:
+        lines.append(data["profile"])
+    return "\n".join(lines)
+# -----------------------------------------------------------------------
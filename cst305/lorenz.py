@@ -0,0 +1,256 @@
+# CST 305 – Batched Lorenz Integrator
+# Advances many Lorenz trajectories (different r, s, b and initial states)
+# together as one NumPy array of shape (batch, 3) per time step, on the
+# shared solver core in cst305/ode.py.
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+from numpy.lib import format as npy_format
+
+from cst305 import instrument
+from cst305.ode import DEFAULT_ATOL, DEFAULT_CHUNK, DEFAULT_RTOL, solveChunks
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_S = 10
+DEFAULT_B = 2.667
+DEFAULT_INITIAL = (7.5, 22.5, 35)
+DEFAULT_DT = 0.01
+DEFAULT_STEPS = 10000
+
+# Solver methods for the Lorenz runs. The system is not stiff, and the
+# ROS2 "rosenbrock" mode of cst305/ode.py controls its step with a
+# first-order error estimate: at r = 28 and the default tolerances it
+# took ~300x the steps of rk45, so it is left to the stiff problems.
+METHODS = ("euler", "rk4", "rk45")
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Lorenz Function ------------------------------
+# Calculates the derivatives for the Lorenz system. Works on scalars or on
+# arrays of any (matching) shape.
+def lorenz(x, y, z, r, s=DEFAULT_S, b=DEFAULT_B):
+    x_dot = s * (y - x)
+    y_dot = r * x - y - x * z
+    z_dot = x * y - b * z
+    return x_dot, y_dot, z_dot
+
+
+# Same derivatives for a whole batch of states with shape (batch, 3).
+# r, s and b are arrays of shape (batch,) (or scalars).
+def lorenzBatch(states, r, s=DEFAULT_S, b=DEFAULT_B):
+    x = states[:, 0]
+    y = states[:, 1]
+    z = states[:, 2]
+    derivs = np.empty_like(states)
+    derivs[:, 0], derivs[:, 1], derivs[:, 2] = lorenz(x, y, z, r, s, b)
+    return derivs
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Batch Setup ----------------------------------
+# Broadcasts r, s, b and the initial states to a common batch size.
+# initial may be a single (x, y, z) triple or an array of shape (batch, 3).
+def makeBatch(r, s=DEFAULT_S, b=DEFAULT_B, initial=DEFAULT_INITIAL):
+    r = np.atleast_1d(np.asarray(r, dtype=float))
+    s = np.atleast_1d(np.asarray(s, dtype=float))
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    initial = np.atleast_2d(np.asarray(initial, dtype=float))
+    if initial.shape[-1] != 3:
+        raise ValueError("initial states must have shape (3,) or (batch, 3)")
+
+    batch = np.broadcast_shapes(r.shape, s.shape, b.shape, initial.shape[:1])
+    r, s, b = (np.broadcast_to(p, batch).copy() for p in (r, s, b))
+    initial = np.broadcast_to(initial, batch + (3,)).copy()
+    return r, s, b, initial
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Run Simulation -------------------------------
+# Yields (time, trajectories) chunks for every trajectory in the batch.
+#   method = "euler" (the original fixed-dt scheme), "rk4" (fixed dt) or
+#            "rk45" (adaptive Dormand-Prince, sampled every dt)
+# Memory use depends only on chunk_size and the batch size, never on
+# num_steps. The `stats` dict (if given) receives accepted/rejected step and
+# right-hand-side evaluation counts once the generator is exhausted.
+# `snapshot` and `resume` restart a run part way (see cst305/ode.py);
+# chunks then start at row resume["row"].
+def streamBatch(r, s=DEFAULT_S, b=DEFAULT_B, initial=DEFAULT_INITIAL,
+                dt=DEFAULT_DT, num_steps=DEFAULT_STEPS, method="euler",
+                rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL,
+                chunk_size=DEFAULT_CHUNK, stats=None, resume=None, snapshot=None):
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+    r, s, b, state = makeBatch(r, s, b, initial)
+    row = 0 if resume is None else resume["row"]
+
+    def f(states, t):
+        return lorenzBatch(states, r, s, b)
+
+    for chunk in solveChunks(f, state, dt, num_steps, method, 0.0, rtol=rtol, atol=atol,
+                             chunk_size=chunk_size, stats=stats, resume=resume, snapshot=snapshot):
+        yield np.arange(row, row + len(chunk)) * dt, chunk
+        row += len(chunk)
+
+
+# Integrates every trajectory in the batch in lockstep and keeps the whole
+# run in memory. Takes the same arguments as streamBatch.
+# Returns (time, trajectories, stats) where trajectories has shape
+# (num_steps + 1, batch, 3).
+@instrument.timed("lorenz.integrate")
+def runBatch(r, s=DEFAULT_S, b=DEFAULT_B, initial=DEFAULT_INITIAL,
+             dt=DEFAULT_DT, num_steps=DEFAULT_STEPS, method="euler",
+             rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL):
+    stats = {}
+    trajectories = None
+    row = 0
+    for _, chunk in streamBatch(r, s, b, initial, dt, num_steps, method, rtol, atol,
+                                chunk_size=num_steps + 1, stats=stats):
+        if trajectories is None:
+            trajectories = np.empty((num_steps + 1,) + chunk.shape[1:])
+        trajectories[row:row + len(chunk)] = chunk
+        row += len(chunk)
+
+    time = np.arange(0, num_steps + 1) * dt
+    return time, trajectories, stats
+# -----------------------------------------------------------------------
+
+
+# ---------------------- Streaming to Disk ------------------------------
+# Integrates chunk by chunk and appends each chunk to a .npy file, so runs
+# with 10^8+ steps never need the whole trajectory in RAM. The file holds an
+# array of shape (num_steps + 1, batch, 3); read it lazily with
+# loadTrajectory. Returns the stats dict.
+# With checkpoint set to a path, the solver state, step index, parameters
+# and settings are saved there (cst305/checkpoint.py) after every chunk is
+# written; resumeToFile continues the run from it.
+def runToFile(path, r, s=DEFAULT_S, b=DEFAULT_B, initial=DEFAULT_INITIAL,
+              dt=DEFAULT_DT, num_steps=DEFAULT_STEPS, method="euler",
+              rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, chunk_size=DEFAULT_CHUNK,
+              checkpoint=None):
+    r, s, b, initial = makeBatch(r, s, b, initial)
+    settings = {"r": r, "s": s, "b": b, "initial": initial, "dt": dt, "num_steps": num_steps,
+                "method": method, "rtol": rtol, "atol": atol, "chunk_size": chunk_size}
+
+    with open(path, "wb") as file:
+        npy_format.write_array_header_2_0(file, _npyHeader(num_steps, len(r)))
+        return _writeRows(file, file.tell(), settings, None, checkpoint)
+
+
+# Continues a run from the checkpoint saved by runToFile (after a crash, or
+# to extend it: num_steps larger than the original). Rows are written from
+# the checkpoint's row on, so the file ends up bit-identical to a single
+# uninterrupted run of num_steps. Returns the stats dict.
+def resumeToFile(path, checkpoint, num_steps=None, chunk_size=None):
+    from cst305.checkpoint import loadCheckpoint
+
+    saved = loadCheckpoint(checkpoint)
+    settings = {key: saved[key] for key in ("r", "s", "b", "initial", "dt", "num_steps",
+                                            "method", "rtol", "atol", "chunk_size")}
+    if num_steps is not None:
+        if num_steps < settings["num_steps"]:
+            raise ValueError("a checkpointed run can only be extended, not shortened")
+        settings["num_steps"] = num_steps
+    if chunk_size is not None:
+        settings["chunk_size"] = chunk_size
+    resume = {key[len("resume_"):]: value for key, value in saved.items() if key.startswith("resume_")}
+
+    with open(path, "r+b") as file:
+        npy_format.read_magic(file)
+        shape, _, _ = npy_format.read_array_header_2_0(file)
+        offset = file.tell()
+        if shape[1:] != settings["initial"].shape:
+            raise ValueError(f"{path} does not hold the checkpointed batch")
+        # The .npy header leaves room for a longer first axis
+        file.seek(0)
+        npy_format.write_array_header_2_0(file, _npyHeader(settings["num_steps"], len(settings["r"])))
+        if file.tell() != offset:
+            raise ValueError(f"cannot grow the header of {path}")
+        return _writeRows(file, offset, settings, resume, checkpoint)
+
+
+def _npyHeader(num_steps, batch):
+    return {"descr": npy_format.dtype_to_descr(np.dtype(float)),
+            "fortran_order": False,
+            "shape": (num_steps + 1, batch, 3)}
+
+
+@instrument.timed("lorenz.stream")
+def _writeRows(file, offset, settings, resume, checkpoint):
+    from cst305.checkpoint import saveCheckpoint
+
+    stats = {}
+    snapshot = {}
+    row_bytes = settings["initial"].nbytes
+    first_row = 0 if resume is None else resume["row"]
+    file.seek(offset + first_row * row_bytes)
+    for _, chunk in streamBatch(settings["r"], settings["s"], settings["b"], settings["initial"],
+                                settings["dt"], settings["num_steps"], settings["method"],
+                                settings["rtol"], settings["atol"], settings["chunk_size"],
+                                stats, resume, snapshot):
+        with instrument.phase("lorenz.write"):
+            file.write(np.ascontiguousarray(chunk).tobytes())
+        if checkpoint is not None:
+            file.flush()
+            saveCheckpoint(checkpoint, **settings,
+                           **{f"resume_{key}": value for key, value in snapshot.items()})
+    file.truncate()
+    return stats
+
+
+# Opens a trajectory written by runToFile without reading it into memory.
+# Returns (time, trajectories); trajectories is a read-only memory map and
+# time is computed on the fly from dt for whatever rows are sliced.
+def loadTrajectory(path, dt=DEFAULT_DT):
+    trajectories = np.load(path, mmap_mode="r")
+    return TimeAxis(len(trajectories), dt), trajectories
+
+
+# Lazily evaluated time axis (row index * dt) that behaves like the array
+# np.arange(length) * dt when indexed or sliced.
+class TimeAxis:
+
+    def __init__(self, length, dt):
+        self.length = length
+        self.dt = dt
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return np.arange(*index.indices(self.length)) * self.dt
+        index = np.asarray(index)
+        if np.any((index >= self.length) | (index < -self.length)):
+            raise IndexError("time index out of range")
+        return np.where(index < 0, index + self.length, index) * self.dt
+
+    def __array__(self, dtype=None, copy=None):
+        return np.arange(self.length) * self.dt
+
+
+# Mean, standard deviation, minimum and maximum of each variable of each
+# trajectory, computed chunk by chunk (works on memory maps of any length).
+# Returns a dict of arrays with shape (batch, 3).
+def trajectoryStats(trajectories, chunk_size=DEFAULT_CHUNK):
+    count = 0
+    mean = m2 = low = high = None
+    for start in range(0, len(trajectories), chunk_size):
+        chunk = np.asarray(trajectories[start:start + chunk_size])
+        n = len(chunk)
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = ((chunk - chunk_mean) ** 2).sum(axis=0)
+        if mean is None:
+            mean, m2 = chunk_mean, chunk_m2
+            low, high = chunk.min(axis=0), chunk.max(axis=0)
+        else:
+            # Chan et al. parallel update of the running mean and variance
+            delta = chunk_mean - mean
+            mean = mean + delta * n / (count + n)
+            m2 = m2 + chunk_m2 + delta ** 2 * count * n / (count + n)
+            low = np.minimum(low, chunk.min(axis=0))
+            high = np.maximum(high, chunk.max(axis=0))
+        count += n
+    return {"mean": mean, "std": np.sqrt(m2 / count), "min": low, "max": high}
+# -----------------------------------------------------------------------
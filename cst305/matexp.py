@@ -0,0 +1,131 @@
+# CST 305 – Batched Matrix Exponential Solutions x(t) = e^(At) C
+# Evaluates the solution of x' = Ax for a real n x n matrix A over a whole
+# time grid and many initial vectors at once. A is decomposed once, then
+# every time point is handled by batched array operations:
+#   eig    A = V diag(w) V^-1 when the eigenvector matrix V is well
+#          conditioned: x(t) = V (e^(w t) * (V^-1 C)), one exp per
+#          eigenvalue and time point
+#   schur  otherwise (defective or nearly defective A): A = Q T Q^T with Q
+#          orthogonal, and e^(tT) for all t together by scaling and
+#          squaring on a stack of matrices; x(t) = Q e^(tT) (Q^T C)
+# Both avoid calling scipy.linalg.expm once per time point. The Schur path
+# only uses orthogonal transforms, so it stays accurate where V^-1 would
+# amplify rounding errors by cond(V).
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+# Largest cond(V) for the eigendecomposition path. Its rounding error
+# grows like cond(V) * eps, so 1e3 keeps it near 1e-13; nearly defective
+# matrices (e.g. [[-1, 1], [1e-10, -1]], cond(V) ~ 1e5) go to Schur.
+EIG_COND_LIMIT = 1e3
+DEFAULT_CHUNK = 4096      # Time points per batch on the Schur path
+
+# Taylor polynomial of degree 19 and the 1-norm it is used up to: the
+# truncation error is below 1^20/20! * e < 1e-18, under double rounding
+TAYLOR_DEGREE = 19
+THETA = 1.0
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Batched Exponential ---------------------------
+# e^M for a stack of square matrices (shape (..., n, n)). Each matrix is
+# scaled by 2^-s so its 1-norm is at most THETA, the degree-19 Taylor
+# polynomial is evaluated Paterson-Stockmeyer style (A^2, A^3, A^4, then
+# Horner in A^4: 7 batched products), and the result is squared s times
+# (only the matrices that need it). A Padé approximant would need one
+# small linear solve per matrix, which for stacks of small matrices costs
+# several times more than all of the products together.
+def expmBatch(matrices):
+    matrices = np.asarray(matrices, dtype=float)
+    n = matrices.shape[-1]
+    stack = matrices.reshape(-1, n, n)
+    norms = np.abs(stack).sum(axis=-2).max(axis=-1)
+    squarings = np.maximum(0, np.ceil(np.log2(np.maximum(norms, 1e-300) / THETA))).astype(int)
+    A = stack / 2.0 ** squarings[:, None, None]
+
+    identity = np.eye(n)
+    powers = [identity, A, A @ A]
+    powers.append(powers[2] @ A)
+    A4 = powers[2] @ powers[2]
+    coefficients = 1 / np.cumprod(np.arange(1.0, TAYLOR_DEGREE + 1))
+    coefficients = np.concatenate(([1.0], coefficients))
+    result = None
+    for first in range(TAYLOR_DEGREE - TAYLOR_DEGREE % 4, -1, -4):
+        block = sum(coefficients[first + k] * powers[k] for k in range(4) if first + k <= TAYLOR_DEGREE)
+        result = block if result is None else result @ A4 + block
+
+    for level in range(squarings.max(initial=0)):
+        needed = squarings > level
+        result[needed] = result[needed] @ result[needed]
+    return result.reshape(matrices.shape)
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Matrix Exponential ---------------------------
+# e^(At) for one matrix A and any time grid. method is "auto" (eig when
+# cond(V) <= cond_limit, else schur), "eig" or "schur"; the choice is in
+# self.method after construction.
+class MatrixExponential:
+
+    def __init__(self, A, method="auto", cond_limit=EIG_COND_LIMIT):
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("A must be a square matrix")
+        if method not in ("auto", "eig", "schur"):
+            raise ValueError(f"method must be 'auto', 'eig' or 'schur', not {method!r}")
+        self.A = A
+        self.n = len(A)
+        self.condition = np.inf
+
+        if method in ("auto", "eig"):
+            self.eigenvalues, self.eigenvectors = np.linalg.eig(A)
+            self.condition = np.linalg.cond(self.eigenvectors)
+        if method == "eig" or (method == "auto" and self.condition <= cond_limit):
+            self.method = "eig"
+        else:
+            from scipy.linalg import schur
+
+            self.method = "schur"
+            self.T, self.Q = schur(A, output="real")
+
+    # x(t) = e^(At) C for every t. C is one vector (shape (n,)) giving an
+    # array (len(t), n), or n x m columns giving (len(t), n, m).
+    @instrument.timed("matexp.apply")
+    def apply(self, t, C, chunk_size=DEFAULT_CHUNK):
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        C = np.asarray(C, dtype=float)
+        columns = C.reshape(self.n, -1)
+
+        if self.method == "eig":
+            # Columns in eigenvector coordinates, advanced mode by mode
+            modes = np.linalg.solve(self.eigenvectors, columns)
+            growth = np.exp(np.multiply.outer(t, self.eigenvalues))
+            result = (self.eigenvectors @ (growth[:, :, None] * modes)).real
+        else:
+            rotated = self.Q.T @ columns
+            result = np.empty((len(t), self.n, columns.shape[1]))
+            for first in range(0, len(t), chunk_size):
+                chunk = t[first:first + chunk_size]
+                result[first:first + chunk_size] = self.Q @ (
+                    expmBatch(chunk[:, None, None] * self.T) @ rotated)
+
+        instrument.count("matexp", time_points=len(t), vectors=columns.shape[1])
+        return result.reshape((len(t),) + C.shape)
+
+    # e^(At) itself for every t, shape (len(t), n, n)
+    def matrices(self, t, chunk_size=DEFAULT_CHUNK):
+        return self.apply(t, np.eye(self.n), chunk_size)
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Convenience -------------------------------
+# x(t) = e^(At) C with a one-off decomposition of A
+def linearSolution(A, C, t, method="auto"):
+    return MatrixExponential(A, method).apply(t, C)
+# -----------------------------------------------------------------------
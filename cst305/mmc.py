@@ -0,0 +1,136 @@
+# CST 305 – M/M/c Queue Metrics (Erlang C)
+# Vectorized over arrays of arrival rate (lambda), service rate (mu) and
+# server count (c). The Erlang B/C probabilities are computed in log space
+# from the Poisson distribution, which stays accurate for c up to 10^5 and
+# beyond where the textbook a^c / c! formula overflows.
+
+# ---------------------- Import Required Libraries ----------------------
+from functools import lru_cache
+
+import numpy as np
+
+# Largest c * (number of values) evaluated with the NumPy-only recursion;
+# bigger inputs use the log-space formula, which needs scipy.special (its
+# import costs more than the whole recursion for small systems)
+RECURSION_LIMIT = 1 << 16
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Erlang Formulas ----------------------------
+# Erlang B (blocking probability) for offered load a = lambda / mu:
+#   B(c, a) = P(Poisson(a) = c) / P(Poisson(a) <= c)
+# with the numerator in log space and the denominator from the regularized
+# upper incomplete gamma function Q(c + 1, a). Small integer c use the
+# recursion below instead, vectorized over all values at once. Where
+# a >> c, Q underflows; there 1 / B is summed directly (_inverseErlangB).
+def erlangB(c, a):
+    c, a = np.broadcast_arrays(np.asarray(c, dtype=float), np.asarray(a, dtype=float))
+    if c.size and np.all(c == np.floor(c)) and c.min() >= 0 and c.max() * c.size <= RECURSION_LIMIT:
+        b = np.ones(c.shape)
+        for k in range(1, int(c.max()) + 1):
+            b = np.where(k <= c, a * b / (k + a * b), b)
+        return b
+
+    from scipy.special import gammaincc, gammaln
+
+    q = gammaincc(c + 1, a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pmf = c * np.log(a) - a - gammaln(c + 1)
+        log_pmf = np.where(a == 0, np.where(c == 0, 0.0, -np.inf), log_pmf)
+        b = np.array(np.exp(log_pmf - np.log(q)))
+    underflow = q < np.finfo(float).tiny
+    if np.any(underflow):
+        b[underflow] = 1 / _inverseErlangB(c[underflow], a[underflow])
+    return np.clip(b, 0.0, 1.0)
+
+
+# 1 / B(c, a) = sum over j = 0 .. c of c! / ((c - j)! a^j), the terms
+# multiplied out in blocks until they are negligible. Only used for a > c,
+# where every term is smaller than the one before.
+def _inverseErlangB(c, a, block=256):
+    total = np.ones(c.shape)
+    term = np.ones(c.shape)
+    first = 0
+    while True:
+        ratios = np.maximum(c[:, None] - np.arange(first, first + block), 0) / a[:, None]
+        terms = term[:, None] * np.cumprod(ratios, axis=1)
+        total += terms.sum(axis=1)
+        term = terms[:, -1]
+        first += block
+        if np.all(term <= np.finfo(float).eps * total):
+            return total
+
+
+# Same value from the classic recursion B(k) = a B(k-1) / (k + a B(k-1));
+# O(c) per value, kept as a scalar cross-check for erlangB
+def erlangBRecursive(c, a):
+    b = 1.0
+    for k in range(1, int(c) + 1):
+        b = a * b / (k + a * b)
+    return b
+
+
+# Erlang C: probability that an arriving customer has to wait,
+#   C = B / (1 - rho (1 - B)),  rho = a / c
+# Equal to 1 when the system is unstable (rho >= 1).
+def erlangC(c, a):
+    c, a = np.broadcast_arrays(np.asarray(c, dtype=float), np.asarray(a, dtype=float))
+    rho = a / c
+    b = erlangB(c, a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wait_probability = b / (1 - rho * (1 - b))
+    return np.where(rho < 1, wait_probability, 1.0)
+# -----------------------------------------------------------------------
+
+
+# --------------------------- M/M/c Metrics -----------------------------
+# Steady-state metrics for broadcast arrays of (lam, mu, c):
+#   utilization  rho = lam / (c mu)
+#   P_wait       Erlang C probability of waiting
+#   W_q          mean wait in queue  = P_wait / (c mu - lam)
+#   T            mean time in system = W_q + 1 / mu
+#   N_q, N       mean number in queue / in system (Little's law)
+#   throughput   lam when stable, otherwise the capacity c mu
+# Unstable entries (rho >= 1) have infinite W_q, T, N_q and N.
+# Repeated evaluations of the same arrays are served from a cache; the
+# returned arrays are read-only because they may be shared.
+def mmcMetrics(lam, mu, c):
+    # Key on the inputs before broadcasting so grids given as a row and a
+    # column are hashed cheaply
+    key = tuple((p.shape, p.tobytes()) for p in
+                (np.asarray(p, dtype=float) for p in (lam, mu, c)))
+    return dict(_cachedMetrics(key))
+
+
+@lru_cache(maxsize=256)
+def _cachedMetrics(key):
+    lam, mu, c = np.broadcast_arrays(*(np.frombuffer(data).reshape(shape) for shape, data in key))
+    metrics = _computeMetrics(lam, mu, c)
+    for value in metrics.values():
+        value.setflags(write=False)
+    return tuple(metrics.items())
+
+
+def _computeMetrics(lam, mu, c):
+    capacity = c * mu
+    rho = lam / capacity
+    stable = rho < 1
+    p_wait = erlangC(c, lam / mu)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w_q = np.where(stable, p_wait / (capacity - lam), np.inf)
+    t = w_q + 1 / mu
+    return {
+        "utilization": rho,
+        "P_wait": p_wait,
+        "W_q": w_q,
+        "T": t,
+        "N_q": np.where(stable, lam * w_q, np.inf),
+        "N": np.where(stable, lam * t, np.inf),
+        "throughput": np.where(stable, lam, capacity),
+    }
+
+
+# Clears the memoized results (e.g. before timing)
+def clearCache():
+    _cachedMetrics.cache_clear()
+# -----------------------------------------------------------------------
@@ -0,0 +1,468 @@
+# CST 305 – Shared ODE Solver Core
+# One set of integrators for every script: the Lorenz system, dy/dx =
+# -y + ln(x) and Newton cooling all run on the steppers below.
+#
+# Right-hand sides are vectorized callables f(y, t) (odeint's argument
+# order) returning an array shaped like y; y may hold a whole batch of
+# independent systems, e.g. (batch, 3) for Lorenz. Methods:
+#   "euler"       forward Euler, fixed step
+#   "rk4"         classical Runge-Kutta, fixed step
+#   "rk45"        adaptive Dormand-Prince 5(4) with dense output
+#   "rosenbrock"  adaptive linearly implicit ROS2 (L-stable) for stiff
+#                 problems, e.g. cooling with very large k; uses the
+#                 Jacobian jac(y, t) and the time derivative dfdt(y, t),
+#                 or finite-difference ones when they are not given
+# Output is always the uniform grid t0 + k dt, k = 0 .. num_steps; the
+# adaptive methods choose their own steps and sample that grid from the
+# continuous solution. Runs are produced in chunks of rows so memory does
+# not depend on num_steps.
+#
+# Jacobians: jac(y, t) may return an array shaped like y (a diagonal, for
+# element-wise systems), or shaped y.shape + (n,) with n = y.shape[-1] (one
+# n x n block per row of a batch; for a 1-D y that is the full matrix).
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_RTOL = 1e-6
+DEFAULT_ATOL = 1e-9
+DEFAULT_CHUNK = 65536  # Output rows held in memory at once when streaming
+
+METHODS = ("euler", "rk4", "rk45", "rosenbrock")
+# -----------------------------------------------------------------------
+
+
+# ---------------------- Fixed-Step Integrators ------------------------
+# One forward Euler step
+def eulerStep(f, t, y, h):
+    return y + f(y, t) * h
+
+
+# One classical RK4 step, with the same arithmetic as Runge.rungeKutta
+# (y + h * (1/6)(k1 + 2 k2 + 2 k3 + k4)), so scalar and batched runs agree
+def rk4Step(f, t, y, h):
+    k1 = f(y, t)
+    k2 = f(y + (h / 2) * k1, t + (h / 2))
+    k3 = f(y + (h / 2) * k2, t + (h / 2))
+    k4 = f(y + h * k3, t + h)
+    return y + h * ((1 / 6) * (k1 + 2 * k2 + 2 * k3 + k4))
+
+
+STEPPERS = {"euler": eulerStep, "rk4": rk4Step}
+RHS_PER_STEP = {"euler": 1, "rk4": 4}
+
+
+# Advances y num_steps times with a fixed step dt (t advances by repeated
+# addition of dt). Yields the output rows (initial state first) in arrays
+# of at most chunk_size rows, so only one chunk is ever held in memory.
+# Restarting: with start_row > 0, (y, t0) is output row start_row - 1 and
+# only rows start_row .. num_steps are produced. Before each yield,
+# `snapshot` (if given) is set to the point to restart from:
+# {"row", "state", "t"}.
+def fixedChunks(f, y, dt, num_steps, step=eulerStep, chunk_size=DEFAULT_CHUNK,
+                start_row=0, snapshot=None, t0=0.0):
+    total = num_steps + 1
+    done = start_row
+    t = t0
+    while done < total:
+        chunk = np.empty((min(chunk_size, total - done),) + y.shape)
+        start = 0
+        if done == 0:
+            chunk[0] = y
+            start = 1
+        for j in range(start, len(chunk)):
+            y = step(f, t, y, dt)
+            t = t + dt
+            chunk[j] = y
+        done += len(chunk)
+        if snapshot is not None:
+            snapshot.update(row=done, state=y, t=t)
+        yield chunk
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Grid Sampling -----------------------------
+# Collects the rows of the output grid t0 + k dt for the adaptive methods.
+# After every accepted step from t to t_new, sample(t_new, interpolate)
+# fills the grid points in (t, t_new] from interpolate(times) and yields
+# each chunk as soon as it is full.
+class _GridOutput:
+
+    def __init__(self, t0, dt, num_steps, next_out, chunk_size, shape):
+        self.t0 = t0
+        self.dt = dt
+        self.total = num_steps + 1
+        self.next_out = next_out
+        self.chunk_size = chunk_size
+        self.shape = shape
+        self.newChunk()
+
+    def newChunk(self):
+        self.chunk = np.empty((min(self.chunk_size, self.total - self.next_out),) + self.shape)
+        self.filled = 0
+
+    def done(self):
+        return self.next_out >= self.total
+
+    def time(self, k):
+        return self.t0 + k * self.dt
+
+    # Adds one row directly (the initial state); returns True when the
+    # chunk is full and should be yielded
+    def add(self, row):
+        self.chunk[self.filled] = row
+        self.filled += 1
+        self.next_out += 1
+        return self.filled == len(self.chunk)
+
+    def sample(self, t_new, interpolate, before_yield=None):
+        while self.next_out < self.total and self.time(self.next_out) <= t_new:
+            stop = self.next_out + 1
+            while (stop < self.total and self.time(stop) <= t_new
+                   and stop - self.next_out < len(self.chunk) - self.filled):
+                stop += 1
+            n = stop - self.next_out
+            self.chunk[self.filled:self.filled + n] = interpolate(self.time(np.arange(self.next_out, stop)))
+            self.filled += n
+            self.next_out = stop
+            if self.filled == len(self.chunk):
+                if before_yield is not None:
+                    before_yield()
+                yield self.chunk
+                if self.next_out < self.total:
+                    self.newChunk()
+
+
+# Per-system scaled RMS error over the last axis; the worst system decides
+def _errorNorm(error, y, y_new, rtol, atol):
+    scale = atol + np.maximum(np.abs(y), np.abs(y_new)) * rtol
+    return np.sqrt(np.mean((error / scale) ** 2, axis=-1)).max()
+
+
+SAFETY = 0.9       # Step size safety factor
+MIN_FACTOR = 0.2   # Largest allowed step shrink
+MAX_FACTOR = 10    # Largest allowed step growth
+# -----------------------------------------------------------------------
+
+
+# ------------------ Adaptive Dormand-Prince (RK45) ---------------------
+# Butcher tableau of the embedded 5(4) pair
+DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+]
+DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+
+# Difference between the 5th and 4th order solutions (uses all 7 stages)
+DP_E = np.array([-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+
+# Continuous extension: y(t + theta*h) = y + h * sum_i K_i * (P_i . [theta, theta^2, theta^3, theta^4])
+DP_P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+
+# Integrates with adaptive steps and samples the solution every dt (up to
+# t0 + num_steps * dt) using the dense-output polynomial. All systems in the
+# batch share one step size, chosen from the worst error in the batch.
+# Yields output rows in chunks like fixedChunks; accepted and rejected step
+# counts are written into the `stats` dict as the run progresses.
+# Restarting: before each yield `snapshot` (if given) is set to the start of
+# the step being sampled, {"row", "state", "t", "h", "accepted",
+# "rejected"}, with h taken before it is cut to end exactly at the last
+# grid point. Passing that dict back as `resume` (y = snapshot["state"])
+# redoes the step and continues with bit-identical rows from
+# snapshot["row"] on, also when num_steps has been raised to extend a
+# finished run.
+def adaptiveChunks(f, y, dt, num_steps, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL,
+                   chunk_size=DEFAULT_CHUNK, stats=None, resume=None, snapshot=None, t0=0.0):
+    if stats is None:
+        stats = {}
+    if resume is None:
+        stats["accepted"] = stats["rejected"] = 0
+        t, h, next_out = t0, dt, 0
+    else:
+        stats["accepted"], stats["rejected"] = resume["accepted"], resume["rejected"]
+        t, h, next_out = resume["t"], resume["h"], resume["row"]
+
+    def stepStart():
+        return {"row": output.next_out, "state": y, "t": t, "h": h,
+                "accepted": stats["accepted"], "rejected": stats["rejected"]}
+
+    def saveSnapshot():
+        if snapshot is not None:
+            snapshot.update(step_start)
+
+    output = _GridOutput(t0, dt, num_steps, next_out, chunk_size, y.shape)
+    if resume is None and output.add(y) and not output.done():
+        step_start = stepStart()
+        saveSnapshot()
+        yield output.chunk
+        output.newChunk()
+
+    t_end = output.time(num_steps)
+    K = np.empty((7,) + y.shape)
+    K[0] = f(y, t)
+    step_rejected = False
+
+    while not output.done():
+        if not step_rejected:
+            step_start = stepStart()
+        h = min(h, t_end - t)
+
+        # Stages of the embedded pair
+        for i in range(1, 6):
+            dy = np.tensordot(DP_A[i], K[:i], axes=1)
+            K[i] = f(y + h * dy, t + DP_C[i] * h)
+        y_new = y + h * np.tensordot(DP_B, K[:6], axes=1)
+        t_new = t + h if t + h < t_end else t_end
+        K[6] = f(y_new, t_new)
+
+        error_norm = _errorNorm(h * np.tensordot(DP_E, K, axes=1), y, y_new, rtol, atol)
+        if not error_norm < 1:
+            # Reject and retry with a smaller step
+            stats["rejected"] += 1
+            h *= max(MIN_FACTOR, SAFETY * error_norm ** (-1 / 5))
+            step_rejected = True
+            continue
+
+        # Accept: sample the output grid points that fall inside this step
+        stats["accepted"] += 1
+        Q = np.tensordot(DP_P, K, axes=([0], [0]))
+
+        def interpolate(times):
+            theta = (times - t) / h
+            powers = np.cumprod(np.repeat(theta[:, None], 4, axis=1), axis=1)
+            # Explicit sum over the 4 powers keeps each row independent of
+            # how many rows are sampled at once (no BLAS blocking effects)
+            interp = powers[:, 0, None, None] * Q[0]
+            for p in range(1, 4):
+                interp += powers[:, p, None, None] * Q[p]
+            return y + h * interp.reshape((len(times),) + y.shape)
+
+        yield from output.sample(t_new, interpolate, saveSnapshot)
+
+        if error_norm == 0:
+            factor = MAX_FACTOR
+        else:
+            factor = min(MAX_FACTOR, SAFETY * error_norm ** (-1 / 5))
+        if step_rejected:
+            factor = min(1, factor)
+        step_rejected = False
+
+        t = t_new
+        y = y_new
+        K[0] = K[6]  # First-same-as-last
+        h *= factor
+# -----------------------------------------------------------------------
+
+
+# -------------------- Linearly Implicit (Rosenbrock) -------------------
+# ROS2 (Verwer et al.), L-stable and second order with any Jacobian
+# approximation, so large steps stay stable on stiff problems:
+#   (I - gamma h J) k1 = f(y, t) + gamma h df/dt
+#   (I - gamma h J) k2 = f(y + h k1, t + h) - 2 k1 - gamma h df/dt
+#   y_new = y + (3/2) h k1 + (1/2) h k2,   gamma = 1 + 1/sqrt(2)
+# The df/dt terms keep the method second order for time-dependent f (the
+# steps collapse to O(tol) on stiff forced problems without them). The
+# local error is estimated against the first-order y + h k1. The grid is
+# sampled with the second-order continuous extension
+#   y(t + theta h) = y + h (b1 k1 + b2 k2),
+#   b2 = (theta^2 / 2 - gamma theta) / (1 - 2 gamma),   b1 = theta + b2
+# built from the stages only: interpolating with f(y) instead would
+# amplify rounding by the stiffness h |J|.
+ROS2_GAMMA = 1 + 1 / np.sqrt(2)
+
+
+# Finite-difference Jacobian in the y.shape + (n,) block form
+def numericJacobian(f, y, t, f0=None):
+    f0 = f(y, t) if f0 is None else f0
+    J = np.empty(y.shape + y.shape[-1:])
+    for j in range(y.shape[-1]):
+        delta = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(y[..., j]))
+        shifted = y.copy()
+        shifted[..., j] += delta
+        J[..., j] = (f(shifted, t) - f0) / delta[..., None]
+    return J
+
+
+# Finite-difference df/dt, shaped like y
+def numericTimeDerivative(f, y, t, f0=None):
+    f0 = f(y, t) if f0 is None else f0
+    delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(t))
+    return (f(y, t + delta) - f0) / delta
+
+
+# Returns solve(rhs) for the matrix I - c J, with J in either Jacobian form
+def _linearSolver(J, c, y):
+    if J.shape == y.shape:
+        W = 1 - c * J
+        return lambda rhs: rhs / W
+    n = y.shape[-1]
+    W = np.eye(n) - c * J
+    if W.ndim == 2:
+        from scipy.linalg import lu_factor, lu_solve
+
+        lu = lu_factor(W)
+        return lambda rhs: lu_solve(lu, rhs)
+    return lambda rhs: np.linalg.solve(W, rhs[..., None])[..., 0]
+
+
+# Integrates with adaptive ROS2 steps and samples every dt like
+# adaptiveChunks. jac(y, t) gives the Jacobian and dfdt(y, t) the partial
+# time derivative of f (finite differences when None; pass
+# dfdt=lambda y, t: 0 for autonomous systems to save an evaluation per step).
+# `stats` receives accepted/rejected steps and rhs/Jacobian counts.
+# `snapshot` and `resume` work as in adaptiveChunks; the snapshot also
+# carries the rhs/Jacobian counts so a resumed run reports the same totals.
+def rosenbrockChunks(f, y, dt, num_steps, jac=None, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL,
+                     chunk_size=DEFAULT_CHUNK, stats=None, t0=0.0, dfdt=None,
+                     resume=None, snapshot=None):
+    if stats is None:
+        stats = {}
+    counts = ("accepted", "rejected", "rhs_evals", "jac_evals")
+    if resume is None:
+        stats.update(accepted=0, rejected=0, rhs_evals=1, jac_evals=0)
+        t, h, next_out = t0, dt, 0
+    else:
+        stats.update({name: resume[name] for name in counts})
+        t, h, next_out = resume["t"], resume["h"], resume["row"]
+
+    def stepStart():
+        return {"row": output.next_out, "state": y, "t": t, "h": h,
+                **{name: stats[name] for name in counts}}
+
+    def saveSnapshot():
+        if snapshot is not None:
+            snapshot.update(step_start)
+
+    output = _GridOutput(t0, dt, num_steps, next_out, chunk_size, y.shape)
+    if resume is None and output.add(y) and not output.done():
+        step_start = stepStart()
+        saveSnapshot()
+        yield output.chunk
+        output.newChunk()
+
+    t_end = output.time(num_steps)
+    f0 = f(y, t)
+    J = None
+    step_rejected = False
+
+    while not output.done():
+        if not step_rejected:
+            step_start = stepStart()
+        h = min(h, t_end - t)
+        if J is None:
+            J = jac(y, t) if jac is not None else numericJacobian(f, y, t, f0)
+            stats["jac_evals"] += 1
+            stats["rhs_evals"] += 0 if jac is not None else y.shape[-1]
+            if dfdt is not None:
+                f_t = dfdt(y, t)
+            else:
+                f_t = numericTimeDerivative(f, y, t, f0)
+                stats["rhs_evals"] += 1
+
+        solve = _linearSolver(J, ROS2_GAMMA * h, y)
+        shift = (ROS2_GAMMA * h) * f_t
+        k1 = solve(f0 + shift)
+        t_new = t + h if t + h < t_end else t_end
+        k2 = solve(f(y + h * k1, t_new) - 2 * k1 - shift)
+        y_new = y + (1.5 * h) * k1 + (0.5 * h) * k2
+        stats["rhs_evals"] += 1
+
+        error_norm = _errorNorm((0.5 * h) * (k1 + k2), y, y_new, rtol, atol)
+        if not error_norm < 1:
+            stats["rejected"] += 1
+            h *= max(MIN_FACTOR, SAFETY * error_norm ** (-1 / 2))
+            step_rejected = True
+            continue
+
+        stats["accepted"] += 1
+        f1 = f(y_new, t_new)
+        stats["rhs_evals"] += 1
+
+        def interpolate(times):
+            theta = ((times - t) / h).reshape((-1,) + (1,) * y.ndim)
+            b2 = (theta ** 2 / 2 - ROS2_GAMMA * theta) / (1 - 2 * ROS2_GAMMA)
+            return y + h * ((theta + b2) * k1 + b2 * k2)
+
+        yield from output.sample(t_new, interpolate, saveSnapshot)
+
+        factor = MAX_FACTOR if error_norm == 0 else min(MAX_FACTOR, SAFETY * error_norm ** (-1 / 2))
+        if step_rejected:
+            factor = min(1, factor)
+        step_rejected = False
+
+        t, y, f0 = t_new, y_new, f1
+        J = None
+        h *= factor
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Solve ----------------------------------
+# Chunks of the solution on the grid t0 + k dt with any method (see the
+# chunk generators above for resume/snapshot). `stats` gets accepted/rejected steps, the number of
+# right-hand-side evaluations and the method once the run is complete; the
+# same counts are reported to cst305/instrument.py as solver "ode.<method>".
+def solveChunks(f, y0, dt, num_steps, method="rk45", t0=0.0, jac=None,
+                rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, chunk_size=DEFAULT_CHUNK,
+                stats=None, resume=None, snapshot=None, dfdt=None):
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+    if stats is None:
+        stats = {}
+    y = np.array(y0, dtype=float)
+
+    if method in STEPPERS:
+        row = 0
+        if resume is not None:
+            y = np.array(resume["state"], dtype=float).reshape(y.shape)
+            row = resume["row"]
+            t0 = resume.get("t", t0 + (row - 1) * dt)
+        yield from fixedChunks(f, y, dt, num_steps, STEPPERS[method], chunk_size, row, snapshot, t0)
+        stats["accepted"] = num_steps
+        stats["rejected"] = 0
+        stats["rhs_evals"] = num_steps * RHS_PER_STEP[method]
+    else:
+        if resume is not None:
+            y = np.array(resume["state"], dtype=float).reshape(y.shape)
+        if method == "rk45":
+            yield from adaptiveChunks(f, y, dt, num_steps, rtol, atol, chunk_size, stats,
+                                      resume, snapshot, t0)
+            stats["rhs_evals"] = 1 + 6 * (stats["accepted"] + stats["rejected"])
+        else:
+            yield from rosenbrockChunks(f, y, dt, num_steps, jac, rtol, atol, chunk_size, stats,
+                                        t0, dfdt, resume, snapshot)
+    stats["method"] = method
+    instrument.countStats(f"ode.{method}", stats)
+
+
+# Whole solution in memory: returns (t, y) with y of shape
+# (num_steps + 1,) + y0.shape. Same arguments as solveChunks.
+def solve(f, y0, dt, num_steps, method="rk45", t0=0.0, jac=None,
+          rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, stats=None, dfdt=None):
+    y0 = np.asarray(y0, dtype=float)
+    y = np.empty((num_steps + 1,) + y0.shape)
+    row = 0
+    for chunk in solveChunks(f, y0, dt, num_steps, method, t0, jac, rtol, atol,
+                             num_steps + 1, stats, dfdt=dfdt):
+        y[row:row + len(chunk)] = chunk
+        row += len(chunk)
+    return t0 + np.arange(num_steps + 1) * dt, y
+# -----------------------------------------------------------------------
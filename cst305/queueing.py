@@ -0,0 +1,190 @@
+# CST 305 – FIFO Queue Simulator (Lindley Recursion)
+# Computes service start, exit and waiting times for millions of customers
+# with vectorized max-plus prefix operations instead of a per-customer loop
+# (one server), or a heap of server free times (c servers), and derives the
+# number-in-system / number-in-queue step functions from the arrival, start
+# and exit events. Independent replications with confidence intervals are
+# in cst305/replications.py.
+
+# ---------------------- Import Required Libraries ----------------------
+import heapq
+
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Distributions -------------------------------
+# Each sampler draws n values with the given mean; cv is the coefficient of
+# variation (standard deviation / mean) where the distribution allows it.
+
+def _exponential(rng, mean, n, cv=None):
+    return rng.exponential(mean, n)
+
+
+def _deterministic(rng, mean, n, cv=None):
+    return np.full(n, float(mean))
+
+
+def _uniform(rng, mean, n, cv=None):
+    # Uniform on [0, 2 * mean] unless a smaller spread is requested
+    half_width = mean if cv is None else min(mean, cv * mean * np.sqrt(3))
+    return rng.uniform(mean - half_width, mean + half_width, n)
+
+
+def _gamma(rng, mean, n, cv=1.0):
+    shape = 1 / cv ** 2
+    return rng.gamma(shape, mean / shape, n)
+
+
+def _lognormal(rng, mean, n, cv=1.0):
+    sigma2 = np.log1p(cv ** 2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), n)
+
+
+DISTRIBUTIONS = {
+    "exponential": _exponential,
+    "deterministic": _deterministic,
+    "uniform": _uniform,
+    "gamma": _gamma,
+    "lognormal": _lognormal,
+}
+
+
+# Draws n customers: arrival times (cumulative inter-arrival gaps, starting
+# from time 0) and service durations. Rates are per unit time.
+def generateCustomers(n, arrival_rate, service_rate, arrival="exponential",
+                      service="exponential", arrival_cv=None, service_cv=None, seed=None):
+    rng = np.random.default_rng(seed)
+    gaps = _sample(rng, arrival, 1 / arrival_rate, n, arrival_cv)
+    durations = _sample(rng, service, 1 / service_rate, n, service_cv)
+    return np.cumsum(gaps), durations
+
+
+def _sample(rng, name, mean, n, cv):
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f"unknown distribution {name!r}, choose from {sorted(DISTRIBUTIONS)}")
+    if cv is None:
+        return DISTRIBUTIONS[name](rng, mean, n)
+    return DISTRIBUTIONS[name](rng, mean, n, cv)
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Queue Simulation ---------------------------
+# FIFO queue with `servers` identical servers. With one server and C the
+# running total of service durations, the recursion
+# exit[n] = max(arrival[n], exit[n-1]) + service[n] unrolls to
+#   exit[n] = C[n] + max over k <= n of (arrival[k] - C[k-1])
+# which is one cumulative sum and one cumulative maximum. With c > 1 each
+# customer, in arrival order, takes the server that frees up first.
+# Returns a dict of arrays: arrival, service, start, exit, wait (and the
+# number of servers). Exits are in arrival order, so with c > 1 they are
+# not necessarily sorted.
+@instrument.timed("queueing.simulate")
+def simulateQueue(arrival_times, service_durations, servers=1):
+    arrival = np.asarray(arrival_times, dtype=float)
+    service = np.asarray(service_durations, dtype=float)
+    if arrival.shape != service.shape or arrival.ndim != 1:
+        raise ValueError("arrival_times and service_durations must be 1-D arrays of equal length")
+    if np.any(np.diff(arrival) < 0):
+        raise ValueError("arrival_times must be sorted")
+    if servers < 1 or servers != int(servers):
+        raise ValueError("servers must be a positive integer")
+
+    if servers == 1:
+        served_before = np.cumsum(service) - service  # C[n-1]
+        exit_time = np.maximum.accumulate(arrival - served_before) + served_before + service
+
+        # Rounding in the prefix sums can leave start a hair before the arrival
+        start = np.maximum(exit_time - service, arrival)
+    else:
+        start = _multiServerStarts(arrival, service, int(servers))
+    return {"arrival": arrival, "service": service, "start": start,
+            "exit": start + service, "wait": start - arrival, "servers": int(servers)}
+
+
+# Service start times for c FIFO servers: a min-heap holds the time each
+# server becomes free; the next customer starts at max(arrival, earliest)
+def _multiServerStarts(arrival, service, servers):
+    free = [0.0] * servers
+    start = []
+    for a, s in zip(arrival.tolist(), service.tolist()):
+        begin = max(a, free[0])
+        heapq.heapreplace(free, begin + s)
+        start.append(begin)
+    return np.array(start)
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Customer Counts ---------------------------
+# Number in system and number in queue as step functions of time. Each
+# event time appears once; counts hold from that time until the next.
+# Returns (times, in_system, in_queue).
+def customerCounts(result):
+    arrival, start, exit_time = result["arrival"], result["start"], result["exit"]
+    n = len(arrival)
+
+    times = np.concatenate([arrival, start, exit_time])
+    system_delta = np.concatenate([np.ones(n, np.int64), np.zeros(n, np.int64), -np.ones(n, np.int64)])
+    queue_delta = np.concatenate([np.ones(n, np.int64), -np.ones(n, np.int64), np.zeros(n, np.int64)])
+
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    in_system = np.cumsum(system_delta[order])
+    in_queue = np.cumsum(queue_delta[order])
+
+    # Keep only the state after the last event at each distinct time
+    last = np.append(times[1:] != times[:-1], True)
+    return times[last], in_system[last], in_queue[last]
+
+
+# Number in system and in queue found by each arriving customer (not
+# counting the customer itself); customers leaving exactly at the arrival
+# instant have already gone. Customers arriving at the same instant come
+# in index order, so the customer itself and later ones that pass
+# straight through (no wait, no service) are not counted as gone.
+def seenAtArrival(result):
+    arrival, start, exit_time = result["arrival"], result["start"], result["exit"]
+    ahead = np.arange(len(arrival))
+    # With several servers later arrivals can leave first
+    departures = np.sort(exit_time) if result.get("servers", 1) > 1 else exit_time
+    passing = exit_time == arrival
+    through = np.cumsum(passing)
+    last = np.searchsorted(arrival, arrival, side="right") - 1
+    gone = np.searchsorted(departures, arrival, side="right") - (through[last] - through + passing)
+    in_system = ahead - np.minimum(gone, ahead)
+    in_queue = ahead - np.minimum(np.searchsorted(start, arrival, side="right"), ahead)
+    return in_system, in_queue
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Summary Metrics ----------------------------
+# Time-averaged queue length and number in system over [0, last exit],
+# the same averages as seen by arrivals, mean wait, utilization per server
+# and throughput (customers served per unit time). With warmup > 0 the
+# first `warmup` customers are dropped and the averages run from the
+# arrival of the next one, to cut the bias of starting empty.
+def queueMetrics(result, warmup=0):
+    servers = result.get("servers", 1)
+    seen_system, seen_queue = seenAtArrival(result)
+    kept = slice(warmup, None)
+    arrival, exit_time = result["arrival"][kept], result["exit"][kept]
+    wait, service = result["wait"][kept], result["service"][kept]
+    if not len(arrival):
+        raise ValueError("warmup leaves no customers")
+
+    horizon = exit_time.max() - (arrival[0] if warmup else 0.0)
+    return {
+        "customers": len(arrival),
+        "horizon": float(horizon),
+        "L_q": float(wait.sum() / horizon),
+        "L": float((exit_time - arrival).sum() / horizon),
+        "L_q_arrivals": float(seen_queue[kept].mean()),
+        "L_arrivals": float(seen_system[kept].mean()),
+        "W_q": float(wait.mean()),
+        "W": float((exit_time - arrival).mean()),
+        "utilization": float(service.sum() / (horizon * servers)),
+        "throughput": float(len(arrival) / horizon),
+    }
+# -----------------------------------------------------------------------
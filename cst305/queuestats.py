@@ -0,0 +1,261 @@
+# CST 305 – Streaming Queue Statistics
+# One-pass estimators over a stream of queue events (arrival, service start,
+# departure), for event logs far larger than memory. Each chunk of events is
+# folded into running totals in one vectorized pass:
+#   time-weighted averages  area under the number-in-queue / number-in-system
+#                           step functions divided by the elapsed time
+#   arrival averages        the same counts as found by each arrival (L^(A))
+#   utilization             area under the number of busy servers
+#   wait time               mean, maximum and a log-bucket quantile sketch
+# Areas are kept in compensated sums and the sketch has a fixed number of
+# buckets, so memory does not grow with the length of the log.
+#
+# Waits are matched first-in first-out: the k-th service start belongs to
+# the k-th arrival. Only the arrival times of customers still waiting are
+# held between chunks, i.e. memory bounded by the longest queue, not by the
+# number of customers.
+
+# ---------------------- Import Required Libraries ----------------------
+from itertools import islice
+
+import numpy as np
+
+from cst305 import instrument
+from cst305.riemann import CompensatedSum
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+ARRIVAL, START, DEPARTURE = 0, 1, 2
+KINDS = {"arrival": ARRIVAL, "start": START, "departure": DEPARTURE}
+QUEUE_DELTA = np.array([1, -1, 0])     # Change of the number in queue per kind
+SYSTEM_DELTA = np.array([1, 0, -1])    # Change of the number in system per kind
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+RELATIVE_ACCURACY = 0.01               # Relative error of the wait quantiles
+MIN_VALUE = 1e-9                       # Smaller waits count as 0
+DEFAULT_CHUNK = 1 << 20                # Events read from a file at once
+EVENT_DTYPE = np.dtype([("t", "<f8"), ("kind", "u1")])   # Binary layout
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Quantile Sketch ---------------------------
+# Log-bucket histogram of non-negative values (the DDSketch layout): bucket
+# i counts values in (gamma^(i-1), gamma^i] with gamma = (1+a)/(1-a), so
+# every quantile is returned within relative error a. Values below
+# min_value share one bucket and are reported as 0 (customers served on
+# arrival). Memory is the number of buckets spanned by the data, about
+# ln(max/min) / 2a (~2000 for a = 0.01 over 18 decades), independent of
+# the number of values, and a chunk is added with one np.bincount.
+class QuantileSketch:
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY, min_value=MIN_VALUE):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = np.log(self.gamma)
+        self.min_value = min_value
+        self.count = 0
+        self.zeros = 0
+        self.offset = 0                       # Bucket index of counts[0]
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if np.any(values < 0):
+            raise ValueError("QuantileSketch only takes non-negative values")
+        positive = values[values >= self.min_value]
+        self.count += len(values)
+        self.zeros += len(values) - len(positive)
+        if not len(positive):
+            return self
+
+        index = np.ceil(np.log(positive) / self.log_gamma).astype(np.int64)
+        low, high = int(index.min()), int(index.max())
+        if not len(self.counts):
+            self.offset = low
+        if low < self.offset or high >= self.offset + len(self.counts):
+            first = min(low, self.offset)
+            counts = np.zeros(max(high, self.offset + len(self.counts) - 1) - first + 1, dtype=np.int64)
+            counts[self.offset - first:self.offset - first + len(self.counts)] = self.counts
+            self.counts, self.offset = counts, first
+        self.counts += np.bincount(index - self.offset, minlength=len(self.counts))
+        return self
+
+    # Estimated p-quantile (p in [0, 1], scalar or array)
+    def quantile(self, p):
+        if not self.count:
+            return np.full(np.shape(p), np.nan)[()]
+        rank = np.asarray(p, dtype=float) * (self.count - 1)
+        cumulative = self.zeros + np.cumsum(self.counts)
+        bucket = np.minimum(np.searchsorted(cumulative, rank, side="right"), len(self.counts) - 1)
+        estimate = 2 * self.gamma ** (bucket + self.offset) / (self.gamma + 1)
+        return np.where(rank < self.zeros, 0.0, estimate)[()]
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Streaming Statistics -------------------------
+# Feed events with update(times, kinds) in time order (across chunks too);
+# kinds are ARRIVAL / START / DEPARTURE codes. Counts start empty at time
+# `start` (0 by default, the first event when None). summary() gives the
+# averages over [start, latest event] with the names queueMetrics uses,
+# plus the largest wait and the wait `quantiles`.
+class QueueStatistics:
+
+    def __init__(self, servers=1, quantiles=DEFAULT_QUANTILES, start=0.0,
+                 relative_accuracy=RELATIVE_ACCURACY):
+        self.servers = servers
+        self.start = start
+        self.time = start              # Latest event time
+        self.in_queue = 0
+        self.in_system = 0
+        self.arrivals = self.starts = self.departures = 0
+        self.queue_area = CompensatedSum()
+        self.system_area = CompensatedSum()
+        self.busy_area = CompensatedSum()
+        self.seen_queue = 0            # Sums of the counts found by arrivals
+        self.seen_system = 0
+        self.wait_total = CompensatedSum()
+        self.max_wait = 0.0
+        self.quantiles = quantiles
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.waiting = np.empty(0)     # Arrival times of customers not yet started
+
+    def update(self, times, kinds):
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        kinds = np.atleast_1d(np.asarray(kinds, dtype=np.intp))
+        if times.ndim != 1 or times.shape != kinds.shape:
+            raise ValueError("times and kinds must be 1-D arrays of equal length")
+        if not len(times):
+            return self
+        if np.any((kinds < ARRIVAL) | (kinds > DEPARTURE)):
+            raise ValueError("kinds must be ARRIVAL, START or DEPARTURE codes")
+        if self.time is None:
+            self.start = self.time = times[0]
+        widths = np.diff(times, prepend=self.time)
+        if np.any(widths < 0):
+            raise ValueError("event times must be non-decreasing")
+
+        # Counts holding just before each event
+        in_queue = np.cumsum(QUEUE_DELTA[kinds]) + self.in_queue
+        in_system = np.cumsum(SYSTEM_DELTA[kinds]) + self.in_system
+        queue_before = np.concatenate(([self.in_queue], in_queue[:-1]))
+        system_before = np.concatenate(([self.in_system], in_system[:-1]))
+        if in_queue.min() < 0 or (in_system - in_queue).min() < 0:
+            raise ValueError("event stream starts or departs customers that never arrived")
+
+        self.queue_area.add(np.dot(queue_before, widths))
+        self.system_area.add(np.dot(system_before, widths))
+        self.busy_area.add(np.dot(system_before - queue_before, widths))
+
+        arriving = kinds == ARRIVAL
+        starting = times[kinds == START]
+        self.seen_queue += int(queue_before[arriving].sum())
+        self.seen_system += int(system_before[arriving].sum())
+
+        # FIFO: starts take the waiting arrivals in order
+        waiting = np.concatenate((self.waiting, times[arriving]))
+        waits = starting - waiting[:len(starting)]
+        self.waiting = waiting[len(starting):].copy()
+        if len(waits):
+            self.wait_total.add(waits.sum())
+            self.max_wait = max(self.max_wait, float(waits.max()))
+            self.sketch.update(waits)
+
+        self.arrivals += int(arriving.sum())
+        self.starts += len(starting)
+        self.departures += int((kinds == DEPARTURE).sum())
+        self.in_queue, self.in_system = int(in_queue[-1]), int(in_system[-1])
+        self.time = times[-1]
+        return self
+
+    def summary(self):
+        horizon = (self.time - self.start) if self.time is not None else 0.0
+        per_time = 1 / horizon if horizon > 0 else float("nan")
+        per_arrival = 1 / self.arrivals if self.arrivals else float("nan")
+        return {
+            "customers": self.departures,
+            "horizon": float(horizon),
+            "L_q": self.queue_area.value() * per_time,
+            "L": self.system_area.value() * per_time,
+            "L_q_arrivals": self.seen_queue * per_arrival,
+            "L_arrivals": self.seen_system * per_arrival,
+            "W_q": self.wait_total.value() / self.starts if self.starts else float("nan"),
+            "W_q_max": self.max_wait,
+            "W_q_quantiles": {p: float(self.sketch.quantile(p)) for p in self.quantiles},
+            "utilization": self.busy_area.value() * per_time / self.servers,
+            "throughput": self.departures * per_time,
+        }
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Event Sources ----------------------------
+# Time-ordered events of a simulateQueue result in chunks. Equal times are
+# ordered by customer, and each customer's own events go arrival, start,
+# departure. So a customer with no wait and no service arrives, starts and
+# leaves in that order. FIFO service means the customers leaving when
+# another arrives or starts have lower indices, so they leave first: an
+# arrival does not find them, and a freed server is taken after it frees.
+def queueEvents(result, chunk_size=DEFAULT_CHUNK):
+    n = len(result["arrival"])
+    times = np.concatenate([result["arrival"], result["start"], result["exit"]])
+    kinds = np.repeat(np.array([ARRIVAL, START, DEPARTURE], dtype=np.uint8), n)
+    customers = np.tile(np.arange(n), 3)
+    order = np.lexsort((kinds, customers, times))
+    for first in range(0, len(order), chunk_size):
+        chunk = order[first:first + chunk_size]
+        yield times[chunk], kinds[chunk]
+
+
+# CSV: one event per line, a time column and a kind column holding
+# "arrival" / "start" / "departure" or the 0 / 1 / 2 codes
+def readEventCsvChunks(path, chunk_size=DEFAULT_CHUNK, time_column=0, kind_column=1,
+                       delimiter=",", skiprows=0):
+    def kind(text):
+        text = text.strip().lower()
+        return KINDS[text] if text in KINDS else int(text)
+
+    with open(path) as file:
+        for _ in range(skiprows):
+            next(file, None)
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            fields = [line.split(delimiter) for line in lines if line.strip()]
+            yield (np.array([float(row[time_column]) for row in fields]),
+                   np.array([kind(row[kind_column]) for row in fields], dtype=np.uint8))
+
+
+# Binary: consecutive (float64 time, uint8 kind) records, as written by
+# writeEvents
+def readEventBinaryChunks(path, chunk_size=DEFAULT_CHUNK):
+    with open(path, "rb") as file:
+        while True:
+            data = np.fromfile(file, dtype=EVENT_DTYPE, count=chunk_size)
+            if not len(data):
+                return
+            yield data["t"], data["kind"]
+
+
+# Appends events to a binary file in the layout readEventBinaryChunks expects
+def writeEvents(path, times, kinds, append=True):
+    data = np.empty(len(times), dtype=EVENT_DTYPE)
+    data["t"] = times
+    data["kind"] = kinds
+    with open(path, "ab" if append else "wb") as file:
+        data.tofile(file)
+
+
+# Statistics of a whole event log, read chunk by chunk. fmt is "csv" or
+# "binary"; other keyword arguments go to the reader.
+@instrument.timed("queuestats.analyzeFile")
+def analyzeFile(path, fmt="binary", servers=1, quantiles=DEFAULT_QUANTILES, start=0.0,
+                chunk_size=DEFAULT_CHUNK, **kwargs):
+    readers = {"csv": readEventCsvChunks, "binary": readEventBinaryChunks}
+    if fmt not in readers:
+        raise ValueError(f"fmt must be one of {tuple(readers)}, not {fmt!r}")
+    statistics = QueueStatistics(servers, quantiles, start)
+    for times, kinds in readers[fmt](path, chunk_size, **kwargs):
+        statistics.update(times, kinds)
+    return statistics
+# -----------------------------------------------------------------------
@@ -0,0 +1,268 @@
+# CST 305 – Headless Figure Rendering
+# Lets every script run without a display: when an output directory is
+# configured (CST305_SAVE_DIR or configureOutput) figures are drawn with the
+# Agg backend and written straight to PNG/SVG files instead of plt.show().
+# Independent figures can be rendered in parallel worker processes.
+# Long series are decimated to a point budget before they reach matplotlib
+# (cst305/decimate.py), so draw time and memory no longer grow with the
+# length of a run.
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+from cst305 import instrument
+from cst305.decimate import DEFAULT_POINTS, decimate, minMaxIndices, streamMinMax
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Output Settings ---------------------------
+# Directory and file format used by showOrSave; None means show on screen
+_settings = {
+    "directory": os.environ.get("CST305_SAVE_DIR") or None,
+    "format": os.environ.get("CST305_SAVE_FORMAT", "png"),
+}
+
+
+# Switches matplotlib to the non-interactive Agg backend
+def useHeadless():
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+
+
+# Sends every later showOrSave call to files in `directory` (format "png"
+# or "svg"); directory=None goes back to showing figures on screen
+def configureOutput(directory, fmt="png"):
+    _settings["directory"] = directory
+    _settings["format"] = fmt
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+        useHeadless()
+
+
+def outputDirectory():
+    return _settings["directory"]
+
+
+# File path for a figure called `name` in the output directory
+def outputPath(name):
+    return os.path.join(_settings["directory"] or ".", f"{name}.{_settings['format']}")
+
+
+# Drop-in replacement for plt.show(): on screen normally, otherwise every
+# open figure is saved as <name>.<format> (<name>_2, <name>_3, ... when a
+# call has several figures) and closed.
+@instrument.timed("render.showOrSave")
+def showOrSave(name):
+    import matplotlib.pyplot as plt
+
+    directory = _settings["directory"]
+    if directory is None:
+        plt.show()
+        return []
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for count, number in enumerate(plt.get_fignums(), start=1):
+        suffix = "" if count == 1 else f"_{count}"
+        path = outputPath(name + suffix)
+        plt.figure(number).savefig(path)
+        paths.append(path)
+    plt.close("all")
+    return paths
+
+
+if _settings["directory"] is not None:
+    useHeadless()
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Decimated Plots ----------------------------
+# ax.plot of x against y (or a 3D line x, y, z) cut to about target points.
+# 2D lines keep the min and max of y per bin ("minmax") or the LTTB
+# selection ("lttb"); 3D lines keep the min and max of each coordinate.
+def plotDecimated(ax, x, y, z=None, target=DEFAULT_POINTS, method="minmax", **kwargs):
+    if z is None:
+        return ax.plot(*decimate(x, y, target, method), **kwargs)
+    indices = minMaxIndices(np.column_stack([x, y, z]), target)
+    return ax.plot(np.asarray(x)[indices], np.asarray(y)[indices], np.asarray(z)[indices], **kwargs)
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Riemann Rectangles --------------------------
+# Draws all n rectangles of a left/mid/right Riemann sum as one
+# PolyCollection (a single artist instead of n fill_between calls). Past
+# target / 2 rectangles the envelope of their tops is filled instead.
+def drawRiemannRectangles(ax, f, a, b, n, rule="left", alpha=0.2, color='purple',
+                          target=DEFAULT_POINTS, chunk_size=1 << 20):
+    from matplotlib.collections import PolyCollection
+
+    offsets = {"left": 0.0, "mid": 0.5, "right": 1.0}
+    if rule not in offsets:
+        raise ValueError(f"rule must be one of {tuple(offsets)}, not {rule!r}")
+
+    width = (b - a) / n
+    if n > target // 2:
+        # More rectangles than pixels: fill the min/max envelope of the
+        # rectangle tops instead, evaluating f chunk by chunk
+        def heights():
+            for start in range(0, n, chunk_size):
+                lefts = a + np.arange(start, min(start + chunk_size, n)) * width
+                yield f(lefts + offsets[rule] * width)
+
+        indices, tops = streamMinMax(heights(), n, target)
+        lefts = a + indices * width
+        collection = ax.fill_between(np.append(lefts, b), np.append(tops, tops[-1]), step="post",
+                                     alpha=alpha, facecolor=color, edgecolor='none')
+        ax.autoscale_view()
+        return collection
+
+    lefts = a + np.arange(n) * width
+    heights = f(lefts + offsets[rule] * width)
+
+    vertices = np.empty((n, 4, 2))
+    vertices[:, :, 0] = np.stack([lefts, lefts, lefts + width, lefts + width], axis=1)
+    vertices[:, :, 1] = np.stack([np.zeros(n), heights, heights, np.zeros(n)], axis=1)
+
+    collection = PolyCollection(vertices, alpha=alpha, facecolors=color, edgecolors='none')
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Parallel Rendering -------------------------
+# Each task is (function, args, path): the worker switches to Agg, calls
+# function(*args), which must draw a figure and return it, then saves the
+# figure to path. Functions and arguments are sent to the workers, so they
+# must be defined at module level. Workers are forked where the platform
+# allows it, so functions defined in a running script can be used too.
+def renderParallel(tasks, processes=None):
+    tasks = list(tasks)
+    processes = processes or min(len(tasks), os.cpu_count() or 1)
+    if processes <= 1:
+        return [_renderTask(task) for task in tasks]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        return list(pool.map(_renderTask, tasks))
+
+
+def _renderTask(task):
+    function, args, path = task
+    useHeadless()
+    import matplotlib.pyplot as plt
+
+    fig = function(*args)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(path)
+    plt.close(fig)
+    return path
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Lorenz Figures ----------------------------
+# One figure per r for the sweep: the 3D attractor beside the x, y, z time
+# series (same content as LorenzAttractor.runCode). Rows are decimated once
+# with min/max bins over all three coordinates, which keeps every peak of
+# each time series as well as the lobe switches of the attractor.
+def lorenzFigure(r, dt=0.01, num_steps=10000, method="euler", target=DEFAULT_POINTS,
+                 rtol=1e-6, atol=1e-9):
+    from cst305.cache import cachedCall
+    from cst305.lorenz import runBatch
+
+    time, trajectories, _ = cachedCall(runBatch, [r], dt=dt, num_steps=num_steps, method=method,
+                                       rtol=rtol, atol=atol, depends=("cst305.ode",))
+    return stateFigure(time, trajectories[:, 0], f"r = {r}", target)
+
+
+# Same figure for a trajectory already in memory: time (n,) and states
+# (n, 3), e.g. one batch member of runBatch
+def stateFigure(time, states, label, target=DEFAULT_POINTS):
+    indices = minMaxIndices(states, target)
+    return _lorenzPanels(np.asarray(time)[indices], states[indices], label)
+
+
+# Same figure for a trajectory file written by runToFile (batch member
+# index), read chunk by chunk so it never has to fit in memory
+def trajectoryFigure(path, dt=0.01, index=0, target=DEFAULT_POINTS, chunk_size=1 << 20):
+    from cst305.lorenz import loadTrajectory
+
+    _, trajectories = loadTrajectory(path, dt)
+    chunks = (trajectories[start:start + chunk_size, index]
+              for start in range(0, len(trajectories), chunk_size))
+    indices, rows = streamMinMax(chunks, len(trajectories), target)
+    return _lorenzPanels(indices * dt, rows, os.path.basename(path))
+
+
+def _lorenzPanels(time, states, label):
+    import matplotlib.pyplot as plt
+
+    xs, ys, zs = states.T
+    fig = plt.figure(figsize=(14, 8))
+    ax = fig.add_subplot(1, 2, 1, projection='3d')
+    ax.plot(xs, ys, zs, lw=0.5)
+    ax.set_title(f"Lorenz Attractor: {label}")
+    ax.set_xlabel("X Axis")
+    ax.set_ylabel("Y Axis")
+    ax.set_zlabel("Z Axis")
+
+    for row, (values, name, color) in enumerate(zip((xs, ys, zs), ("X", "Y", "Z"),
+                                                    ('blue', 'orange', 'green'))):
+        ax_t = fig.add_subplot(3, 2, 2 * row + 2)
+        ax_t.plot(time, values, color=color, lw=0.5)
+        ax_t.set_ylabel(name)
+    ax_t.set_xlabel("t - Time")
+    fig.tight_layout()
+    return fig
+
+
+# The two figures of the Lorenz projects (Project 5 and Project 7 Part 1):
+# the 3D attractor and a figure of the x, y, z time series, each line
+# decimated to about 4000 points. Integrates from (7.5, 22.5, 35) for 100 s
+# with any cst305/ode.py method, prints the solver statistics and returns
+# them; the caller shows or saves the figures. Runs come from the result
+# cache (cst305/cache.py) when the same r and settings were run before.
+def lorenzRunFigures(r, method="euler", rtol=1e-6, atol=1e-9, title="Lorenz Time Series",
+                     colors=(None, None, None)):
+    import matplotlib.pyplot as plt
+    from cst305.cache import cachedCall
+    from cst305.lorenz import runBatch
+
+    num_steps = 10000
+    time, trajectories, stats = cachedCall(runBatch, [r], initial=(7.5, 22.5, 35), dt=0.01,
+                                           num_steps=num_steps, method=method, rtol=rtol, atol=atol,
+                                           depends=("cst305.ode",))
+    xs, ys, zs = trajectories[:, 0].T
+    print(f"{method}: {stats['accepted']} accepted steps, {stats['rejected']} rejected, "
+          f"{stats['rhs_evals']} derivative evaluations")
+    if method != "euler":
+        # Euler on the same grid: one step and one evaluation per output row
+        print(f"euler baseline: {num_steps} steps, {num_steps} derivative evaluations "
+              f"({method} uses {stats['accepted'] / num_steps:.3g}x the steps, "
+              f"{stats['rhs_evals'] / num_steps:.3g}x the evaluations)")
+
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    plotDecimated(ax, xs, ys, zs, lw=0.5)  # ~4000 points, keeps every peak
+    ax.set_title(f"Lorenz Attractor: r = {r}")
+    ax.set_xlabel("X Axis")
+    ax.set_ylabel("Y Axis")
+    ax.set_zlabel("Z Axis")
+
+    fig, axes = plt.subplots(3, 1, figsize=(8, 12))
+    for ax_t, values, label, color in zip(axes, (xs, ys, zs), ("X: txt", "Y: rtf", "Z: docx"), colors):
+        plotDecimated(ax_t, time, values, color=color)
+        ax_t.set_ylabel(label)
+        ax_t.set_xlim(-1, 100)
+    axes[0].set_title(f"{title}: r = {r}")
+    axes[-1].set_xlabel("t - Time")
+    plt.tight_layout()
+    return stats
+# -----------------------------------------------------------------------
@@ -0,0 +1,138 @@
+# CST 305 – Independent Replications of a G/G/c Queue
+# One long run gives a point estimate with no error bar, and successive
+# customers are too correlated for a naive standard error. Instead the
+# queue is simulated as R independent replications, each with its own
+# random stream, and the R per-replication averages (L_q, W_q, utilization,
+# throughput, ...) are independent samples of each metric, so a Student-t
+# interval around their mean is a valid confidence interval.
+#
+# Streams come from np.random.SeedSequence(seed).spawn(...): replication i
+# always gets the i-th child stream, so results depend on the seed only,
+# not on the number of worker processes or the order they finish in.
+# Replications run in rounds on a process pool; after each round the
+# intervals are checked and the run stops as soon as every tracked metric
+# is estimated to within the requested relative precision.
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+
+from cst305 import instrument
+from cst305.queueing import generateCustomers, queueMetrics, simulateQueue
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+MIN_REPLICATIONS = 10
+MAX_REPLICATIONS = 200
+PRECISION = 0.05       # Target half-width relative to the mean
+CONFIDENCE = 0.95
+TRACKED = ("L_q", "W_q", "utilization", "throughput")
+# -----------------------------------------------------------------------
+
+
+# ------------------------- One Replication -----------------------------
+# Metrics of one replication; stream is a SeedSequence child. Runs in a
+# worker process, so it only takes and returns plain values.
+def _replicate(task):
+    stream, settings = task
+    warmup = settings.pop("warmup")
+    servers = settings.pop("servers")
+    arrivals, services = generateCustomers(seed=stream, **settings)
+    return queueMetrics(simulateQueue(arrivals, services, servers=servers), warmup=warmup)
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Confidence Intervals --------------------------
+# Student-t interval for the mean of independent samples
+def confidenceInterval(samples, confidence=CONFIDENCE):
+    from scipy import stats
+
+    samples = np.asarray(samples, dtype=float)
+    n = len(samples)
+    mean = samples.mean()
+    std = samples.std(ddof=1) if n > 1 else np.inf
+    half_width = stats.t.ppf(0.5 + confidence / 2, n - 1) * std / np.sqrt(n) if n > 1 else np.inf
+    return {"mean": float(mean), "half_width": float(half_width), "std": float(std),
+            "low": float(mean - half_width), "high": float(mean + half_width)}
+
+
+def _precise(intervals, precision, tracked):
+    return all(intervals[name]["half_width"] <= precision * abs(intervals[name]["mean"])
+               for name in tracked)
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Replicated Run -----------------------------
+# Simulates independent replications of a FIFO queue with `servers`
+# servers, `customers` customers each (the first `warmup` dropped from the
+# averages). Runs rounds of `processes` replications (at least
+# min_replications in the first) until the confidence intervals of all
+# `tracked` metrics have half-width <= precision * |mean|, or
+# max_replications is reached. precision=None always runs max_replications.
+# Arrival/service distributions and cvs are as for generateCustomers.
+# Returns {"replications", "converged", "metrics": {name: interval},
+# "samples": {name: array of per-replication values}}.
+def replicateQueue(arrival_rate, service_rate, servers=1, customers=100000, warmup=1000,
+                   arrival="exponential", service="exponential", arrival_cv=None, service_cv=None,
+                   seed=None, min_replications=MIN_REPLICATIONS, max_replications=MAX_REPLICATIONS,
+                   precision=PRECISION, confidence=CONFIDENCE, tracked=TRACKED, processes=None):
+    if warmup >= customers:
+        raise ValueError("warmup must be smaller than customers")
+    if max_replications < 2:
+        raise ValueError("max_replications must be at least 2")
+    settings = {"n": customers, "arrival_rate": arrival_rate, "service_rate": service_rate,
+                "arrival": arrival, "service": service, "arrival_cv": arrival_cv,
+                "service_cv": service_cv, "warmup": warmup, "servers": servers}
+    streams = np.random.SeedSequence(seed).spawn(max_replications)
+    processes = max(1, min(processes or os.cpu_count() or 1, max_replications))
+    min_replications = max(2, min(min_replications, max_replications))
+
+    results = []
+    with instrument.phase("replications.run"), _pool(processes) as pool:
+        while len(results) < max_replications:
+            size = max(processes, min_replications - len(results))
+            batch = streams[len(results):len(results) + size]
+            tasks = [(stream, dict(settings)) for stream in batch]
+            results.extend(pool.map(_replicate, tasks) if pool else map(_replicate, tasks))
+
+            intervals = {name: confidenceInterval([res[name] for res in results], confidence)
+                         for name in results[0] if name != "customers"}
+            converged = precision is not None and _precise(intervals, precision, tracked)
+            if converged:
+                break
+
+    instrument.count("replications", replications=len(results),
+                     customers=len(results) * customers)
+    return {"replications": len(results), "converged": converged, "metrics": intervals,
+            "samples": {name: np.array([res[name] for res in results]) for name in intervals}}
+
+
+# Process pool for the replications (fork where available, like
+# render.renderParallel), or None to run them in this process
+def _pool(processes):
+    import contextlib
+
+    if processes <= 1:
+        return contextlib.nullcontext()
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    return ProcessPoolExecutor(max_workers=processes, mp_context=context)
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Summary ---------------------------------
+# Result of replicateQueue as readable lines, e.g. "L_q: 3.21 ± 0.08"
+def formatReplications(result, names=TRACKED):
+    status = "converged" if result["converged"] else "not converged"
+    lines = [f"{result['replications']} replications ({status})"]
+    for name in names:
+        interval = result["metrics"][name]
+        lines.append(f"{name:>13}: {interval['mean']:.6g} ± {interval['half_width']:.3g}"
+                     f"  [{interval['low']:.6g}, {interval['high']:.6g}]")
+    return "\n".join(lines)
+# -----------------------------------------------------------------------
@@ -0,0 +1,117 @@
+# CST 305 – Numeric Riemann Sums and Quadrature Rules
+# Left, midpoint, right, trapezoid and Simpson sums of any vectorized f over
+# [a, b] with n subintervals. The domain is processed in fixed-size chunks of
+# sample points, so memory stays bounded for n up to 10^9, and the chunk
+# totals are added with compensated (Neumaier) summation.
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_CHUNK = 1 << 20   # Sample points evaluated at once
+RULES = ("left", "mid", "right", "trapezoid", "simpson")
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Compensated Sum ----------------------------
+# Running sum that carries the rounding error of each addition (Neumaier's
+# variant of Kahan summation)
+class CompensatedSum:
+
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value):
+        value = float(value)
+        t = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - t) + value
+        else:
+            self.compensation += (value - t) + self.total
+        self.total = t
+
+    def value(self):
+        return self.total + self.compensation
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Rule Layouts ------------------------------
+# For each rule: sample indices [first, last), offset of the sample inside
+# its subinterval, the weight of each sample and the overall scale factor.
+# Sample i sits at x = a + (i + offset) * h.
+def _layout(rule, n):
+    if rule == "left":
+        return 0, n, 0.0, None, 1.0
+    if rule == "right":
+        return 1, n + 1, 0.0, None, 1.0
+    if rule == "mid":
+        return 0, n, 0.5, None, 1.0
+    if rule == "trapezoid":
+        def weights(i):
+            return np.where((i == 0) | (i == n), 0.5, 1.0)
+        return 0, n + 1, 0.0, weights, 1.0
+    if rule == "simpson":
+        if n % 2:
+            raise ValueError("Simpson's rule needs an even number of subintervals")
+
+        def weights(i):
+            return np.where((i == 0) | (i == n), 1.0, np.where(i % 2, 4.0, 2.0))
+        return 0, n + 1, 0.0, weights, 1 / 3
+    raise ValueError(f"rule must be one of {RULES}, not {rule!r}")
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Riemann Sum ------------------------------
+# Approximates the integral of f over [a, b] with n subintervals.
+#   reference  exact value of the integral; when None and with_error=True it
+#              is computed once with scipy's quad
+# Returns (value, error) where error = value - reference (None when
+# with_error=False).
+def riemannSum(f, a, b, n, rule="left", reference=None, with_error=True,
+               chunk_size=DEFAULT_CHUNK):
+    first, last, offset, weights, scale = _layout(rule, n)
+    h = (b - a) / n
+
+    total = CompensatedSum()
+    for start in range(first, last, chunk_size):
+        i = np.arange(start, min(start + chunk_size, last), dtype=np.int64)
+        values = f(a + (i + offset) * h)
+        if weights is not None:
+            values = values * weights(i)
+        total.add(np.sum(values))
+
+    value = total.value() * h * scale
+    if not with_error:
+        return value, None
+    if reference is None:
+        reference = referenceIntegral(f, a, b)
+    return value, value - reference
+
+
+# Accurate reference integral from adaptive quadrature
+def referenceIntegral(f, a, b):
+    from scipy.integrate import quad
+
+    return quad(lambda x: float(f(np.float64(x))), a, b, epsabs=1e-13, epsrel=1e-12, limit=500)[0]
+
+
+# Error of every rule for every n in n_values (reference computed once).
+# Returns {rule: array of errors}.
+def convergenceTable(f, a, b, n_values, rules=RULES, reference=None,
+                     chunk_size=DEFAULT_CHUNK):
+    if reference is None:
+        reference = referenceIntegral(f, a, b)
+    table = {}
+    for rule in rules:
+        errors = []
+        for n in n_values:
+            if rule == "simpson" and n % 2:
+                errors.append(np.nan)
+                continue
+            errors.append(riemannSum(f, a, b, n, rule, reference, chunk_size=chunk_size)[1])
+        table[rule] = np.array(errors)
+    return table
+# -----------------------------------------------------------------------
@@ -0,0 +1,165 @@
+# CST 305 – Vectorized Runge-Kutta (RK4) Engine
+# Advances a whole vector of initial values y0 through the same x grid with
+# one set of array operations per stage, writing into preallocated arrays.
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+DEFAULT_CHECKPOINT_EVERY = 1000000   # Steps between checkpoint saves
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Default Equation ----------------------------
+# dy/dx = -y + ln(x), vectorized over y (same argument order as odeint)
+def diffEq(y, x):
+    return -y + np.log(x)
+
+
+# e^(-x) * Ei(x) without overflowing for large x (asymptotic series there)
+def _scaledEi(x):
+    from scipy.special import expi
+
+    x = np.asarray(x, dtype=float)
+    result = np.empty_like(x)
+    small = x <= 500
+    result[small] = np.exp(-x[small]) * expi(x[small])
+
+    big = x[~small]
+    term = 1 / big
+    total = term.copy()
+    for k in range(1, 20):
+        term = term * k / big
+        total += term
+    result[~small] = total
+    return result
+
+
+# Closed-form solution of dy/dx = -y + ln(x) with y(x0) = y0:
+#   y = ln(x) - e^(-x) Ei(x) + (y0 - ln(x0) + e^(-x0) Ei(x0)) e^(x0 - x)
+def exactSolution(x, x0, y0):
+    x = np.asarray(x, dtype=float)
+    c = y0 - np.log(x0) + _scaledEi(np.array([x0]))[0]
+    return np.log(x) - _scaledEi(x) + c * np.exp(x0 - x)
+# -----------------------------------------------------------------------
+
+
+# ------------------------ Vectorized RK4 -------------------------------
+# Runs `runs` RK4 steps of size h for every value in y0 at once.
+#   f(y, x)      vectorized right-hand side; y is an array of shape (batch,)
+#   record_every store every n-th step (1 = all steps); None stores only the
+#                final values, so memory does not depend on `runs`
+#   checkpoint   path of a checkpoint file (cst305/checkpoint.py) rewritten
+#                every checkpoint_every steps and at the end with x, y, the
+#                step index and the settings; the values recorded since the
+#                last save are appended to its history stream as rows of
+#                (x, y...). resumeRungeKutta continues from it
+# Returns (x_values, y_values) with y_values of shape (stored points, batch).
+# x advances by repeated addition of h, like Runge.rungeKutta, so a batch of
+# one reproduces the scalar RK4 loop.
+def rungeKuttaBatch(x0, y0, h, runs, f=diffEq, record_every=1, checkpoint=None,
+                    checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+    y = np.array(y0, dtype=float).ravel()
+    x_values, y_values = _outputArrays(runs, record_every, y.size)
+    if record_every is not None:
+        x_values[0] = x0
+        y_values[0] = y
+    settings = {"x0": x0, "h": h, "record_every": record_every or 0}
+    return _advance(x0, y, h, 0, runs, f, record_every, x_values, y_values,
+                    checkpoint, checkpoint_every, settings, 0)
+
+
+# Continues a run from a rungeKuttaBatch checkpoint, after a crash or to
+# extend a finished run (runs larger than the original). The results are
+# bit-identical to one uninterrupted call with the same runs. f must be the
+# right-hand side of the original run.
+def resumeRungeKutta(checkpoint, runs=None, f=diffEq, checkpoint_every=DEFAULT_CHECKPOINT_EVERY):
+    from cst305.checkpoint import loadCheckpoint, loadHistory
+
+    saved = loadCheckpoint(checkpoint)
+    runs = saved["runs"] if runs is None else runs
+    if runs < saved["step"]:
+        raise ValueError(f"runs must be at least {saved['step']}, the step the checkpoint is at")
+    record_every = saved["record_every"] or None
+
+    y = np.array(saved["y"], dtype=float)
+    x_values, y_values = _outputArrays(runs, record_every, y.size)
+    stored = saved["stored"]
+    history = loadHistory(checkpoint, stored, y.size + 1)
+    x_values[:stored] = history[:, 0]
+    y_values[:stored] = history[:, 1:]
+    settings = {key: saved[key] for key in ("x0", "h", "record_every")}
+    return _advance(saved["x"], y, saved["h"], saved["step"], runs, f, record_every,
+                    x_values, y_values, checkpoint, checkpoint_every, settings, stored)
+
+
+def _outputArrays(runs, record_every, batch):
+    stored = 1 if record_every is None else runs // record_every + 1
+    return np.empty(stored), np.empty((stored, batch))
+
+
+# Steps done + 1 .. runs from (x, y) at step done; the first `flushed`
+# recorded values are already in the checkpoint history. Same arithmetic as
+# cst305/ode.rk4Step, written with reused work buffers for long batches.
+# Reported to cst305/instrument.py as solver "rk4.batch".
+@instrument.timed("rk4.batch")
+def _advance(x, y, h, done, runs, f, record_every, x_values, y_values,
+             checkpoint, checkpoint_every, settings, flushed):
+    # Work buffers reused on every step
+    stage = np.empty_like(y)
+    total = np.empty_like(y)
+
+    for i in range(done + 1, runs + 1):
+        k1 = f(y, x)
+        np.multiply(k1, h / 2, out=stage)
+        stage += y
+        k2 = f(stage, x + (h / 2))
+        np.multiply(k2, h / 2, out=stage)
+        stage += y
+        k3 = f(stage, x + (h / 2))
+        np.multiply(k3, h, out=stage)
+        stage += y
+        k4 = f(stage, x + h)
+
+        # total = (1/6) * (k1 + 2*k2 + 2*k3 + k4), y = y + h * total
+        np.multiply(k2, 2, out=total)
+        total += k1
+        np.multiply(k3, 2, out=stage)
+        total += stage
+        total += k4
+        total *= 1 / 6
+        total *= h
+        y += total
+        x = x + h
+
+        if record_every is not None and i % record_every == 0:
+            x_values[i // record_every] = x
+            y_values[i // record_every] = y
+        if checkpoint is not None and i % checkpoint_every == 0 and i < runs:
+            flushed = _saveRungeKutta(checkpoint, settings, runs, i, x, y, record_every,
+                                      x_values, y_values, flushed)
+
+    if checkpoint is not None:
+        _saveRungeKutta(checkpoint, settings, runs, runs, x, y, record_every, x_values, y_values, flushed)
+    if record_every is None:
+        x_values[0] = x
+        y_values[0] = y
+    instrument.count("rk4.batch", rhs_evals=4 * (runs - done), accepted=runs - done)
+    return x_values, y_values
+
+
+# Appends the values recorded since the last save to the history, then saves
+# the state. Returns the number of values now in the history.
+def _saveRungeKutta(path, settings, runs, step, x, y, record_every, x_values, y_values, flushed):
+    from cst305.checkpoint import appendHistory, saveCheckpoint
+
+    stored = 0 if record_every is None else step // record_every + 1
+    appendHistory(path, np.column_stack((x_values[flushed:stored], y_values[flushed:stored])),
+                  start=flushed == 0)
+    saveCheckpoint(path, **settings, runs=runs, step=step, x=x, y=y, stored=stored)
+    return stored
+# -----------------------------------------------------------------------
@@ -0,0 +1,116 @@
+# CST 305 – Project 2 Solvers: Runge-Kutta (RK4) vs SciPy's odeint
+# The Runge and ODE classes from RungeVsODE.py, importable without running
+# the comparison or drawing any plots. Both solve dy/dx = -y + ln(x), with
+# the RK4 step from the shared solver core (cst305/ode.py).
+
+# Import required libraries
+import math
+import numpy as np
+from scipy.integrate import odeint  # At import time, so ODE.runCode timings exclude it
+from cst305 import instrument, rk4
+from cst305.ode import rk4Step
+from cst305.rk4 import rungeKuttaBatch
+
+
+# Define the differential equation: dy/dx = -y + ln(x) (shared by both solvers)
+def diffEq(y, x):
+    return -y + math.log(x)
+
+
+# ---------------------- Runge-Kutta Method Implementation ----------------------
+class Runge:
+
+    diffEq = diffEq
+
+    # Implement the Runge-Kutta 4th-order method
+    def rungeKutta(x0, y0, h):
+        y1 = rk4Step(Runge.diffEq, x0, y0, h)
+        x1 = x0 + h
+        return (x1, y1)
+
+    # Runs the RK4 method for 'runs' more steps from the last values in the
+    # lists. With a checkpoint path, the last x and y, h and the step count
+    # are saved there every checkpoint_every steps and at the end, and the
+    # list entries added since the previous save are appended to its history
+    # stream (see Runge.resume); `saved` is how many leading entries the
+    # history already holds. The work is reported to cst305/instrument.py as
+    # solver "runge.rk4".
+    @instrument.timed("runge.rk4")
+    def runCode(x_values, y_values, h, runs, checkpoint=None, checkpoint_every=100000, saved=0):
+        if runs < 0:
+            raise ValueError(f"runs must be non-negative, not {runs}")
+        start = len(x_values) - 1
+        for i in range(start, start + runs):
+            x1, y1 = Runge.rungeKutta(x_values[i], y_values[i], h)
+            x_values.append(x1)
+            y_values.append(y1)
+            if checkpoint is not None and (i + 1 - start) % checkpoint_every == 0:
+                saved = Runge.saveCheckpoint(checkpoint, x_values, y_values, h, start + runs, saved)
+        if checkpoint is not None:
+            Runge.saveCheckpoint(checkpoint, x_values, y_values, h, start + runs, saved)
+        instrument.count("runge.rk4", rhs_evals=4 * runs, accepted=runs)
+
+    # Appends the entries after the first `saved` to the history, then saves
+    # the state. Returns the number of entries now in the history.
+    def saveCheckpoint(path, x_values, y_values, h, runs, saved=0):
+        from cst305.checkpoint import appendHistory, saveCheckpoint
+
+        appendHistory(path, np.column_stack((x_values[saved:], y_values[saved:])), start=saved == 0)
+        saveCheckpoint(path, x=x_values[-1], y=y_values[-1], h=h, runs=runs, stored=len(x_values))
+        return len(x_values)
+
+    # Continues a checkpointed runCode to `runs` total steps (the original
+    # count after a crash, or more to extend a finished run). The values
+    # are identical to one uninterrupted run. Returns (x_values, y_values).
+    def resume(checkpoint, runs=None, checkpoint_every=100000):
+        from cst305.checkpoint import loadCheckpoint, loadHistory
+
+        saved = loadCheckpoint(checkpoint)
+        history = loadHistory(checkpoint, saved["stored"], 2)
+        x_values = history[:, 0].tolist()
+        y_values = history[:, 1].tolist()
+        runs = saved["runs"] if runs is None else runs
+        done = len(x_values) - 1
+        if runs < done:
+            raise ValueError(f"runs must be at least {done}, the step the checkpoint is at")
+        Runge.runCode(x_values, y_values, saved["h"], runs - done, checkpoint, checkpoint_every,
+                      len(x_values))
+        return x_values, y_values
+
+    # Vectorized form of the same equation for NumPy arrays of y
+    diffEqVec = rk4.diffEq
+
+    # Vectorized RK4: advances every value in y0 (a scalar or an array of
+    # initial conditions) at once into preallocated NumPy arrays. f can be
+    # any vectorized right-hand side f(y, x); record_every=None keeps only
+    # the final values. Returns (x_values, y_values[step, batch]).
+    def runVectorized(x0, y0, h, runs, f=None, record_every=1):
+        return rungeKuttaBatch(x0, y0, h, runs, f or Runge.diffEqVec, record_every)
+
+    # Prints the computed x and y values (optional)
+    def printResults(x_values, y_values, runs):
+        for i in range(runs + 1):
+            print(f"x{i} = {round(x_values[i], 4)}, \ty{i} = {round(y_values[i], 4)}")
+
+
+# -------------------------- SciPy's ODE Method --------------------------------
+class ODE:
+
+    # The same differential equation
+    diffEq = diffEq
+
+    # Use odeint to solve the equation. LSODA's own counts of derivative
+    # evaluations, internal steps and Jacobian builds are reported to
+    # cst305/instrument.py as solver "odeint".
+    @instrument.timed("odeint")
+    def runCode(x0, y0, h, runs):
+        x_values = np.linspace(x0, x0 + h * runs, runs + 1)
+        y_values, info = odeint(ODE.diffEq, y0, x_values, full_output=True)
+        instrument.count("odeint", rhs_evals=info["nfe"][-1], accepted=info["nst"][-1],
+                         jac_evals=info["nje"][-1])
+        return x_values, y_values
+
+    # Print results (optional)
+    def printResults(x_values, y_values):
+        for i, (x, y) in enumerate(zip(x_values, y_values)):
+            print(f"x{i} = {round(x, 4)}, \ty{i} = {round(y[0], 4)}")
@@ -0,0 +1,168 @@
+# CST 305 – Power Series Coefficients for Project 6 Part 2
+# The recurrence
+#   a[i] = -((i - 2)(i - 3) + 1) / (4 i (i - 1)) * a[i - 2]
+# is computed in one of three modes:
+#   "exact" running integer numerator/denominator products, reduced to a
+#           Fraction only when a coefficient is read (ExactSeries)
+#   "float" float64 cumulative products (underflows to 0 after ~1000 terms)
+#   "log"   sign and log|a[i]|, which never under- or overflows
+# evaluateSeries then sums the series at many x points with Horner's scheme.
+
+# ---------------------- Import Required Libraries ----------------------
+import math
+from fractions import Fraction
+from itertools import islice
+
+import numpy as np
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Recurrence Factors -------------------------
+# Integer numerator and denominator of the factor a[i] / a[i - 2] for
+# i = 2 .. n + 1 (the numerator is never zero)
+def recurrenceFactors(n):
+    i = np.arange(2, n + 2, dtype=np.int64)
+    return -((i - 2) * (i - 3) + 1), 4 * i * (i - 1)
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Coefficient Engine -------------------------
+# Coefficients a[0] .. a[n + 1] (a[0] = a0, a[1] = a1).
+#   mode "float" -> float64 array
+#   mode "log"   -> (signs, log_magnitudes) arrays; a[i] = sign * e^log
+#   mode "exact" -> ExactSeries (indexable and iterable, yields Fractions)
+def seriesCoefficients(n, mode="float", a0=1, a1=1):
+    if mode == "exact":
+        return ExactSeries(n, a0, a1)
+
+    num, den = recurrenceFactors(n)
+    if mode == "float":
+        coefficients = np.empty(n + 2)
+        coefficients[0], coefficients[1] = a0, a1
+        factors = num / den
+        coefficients[2::2] = a0 * np.cumprod(factors[0::2])  # even chain from a0
+        coefficients[3::2] = a1 * np.cumprod(factors[1::2])  # odd chain from a1
+        return coefficients
+
+    if mode == "log":
+        signs = np.empty(n + 2)
+        logs = np.empty(n + 2)
+        with np.errstate(divide="ignore"):
+            signs[:2] = np.sign([a0, a1])
+            logs[:2] = np.log(np.abs([a0, a1], dtype=float))
+        steps = np.log(-num.astype(float)) - np.log(den.astype(float))
+        for start in (0, 1):
+            chain = slice(start + 2, None, 2)
+            logs[chain] = logs[start] + np.cumsum(steps[start::2])
+            # every factor is negative, so the sign flips at each step
+            signs[chain] = signs[start] * (-1.0) ** np.arange(1, len(steps[start::2]) + 1)
+        return signs, logs
+
+    raise ValueError(f"mode must be 'exact', 'float' or 'log', not {mode!r}")
+
+
+# Exact coefficients a[first] .. a[n + 1] without a gcd per step. Each
+# chain (even from a0, odd from a1) is kept as a running, unreduced integer
+# numerator and denominator, advanced by multiplying with the small integer
+# factors; a Fraction (one big-integer gcd) is only built for a coefficient
+# that is read. rawTerms() gives the unreduced pairs with no reduction at
+# all. Indexing resumes from the last coefficient read on the same chain,
+# so reading in increasing order costs one step per coefficient, and jumps
+# multiply the skipped factors as a balanced product tree. A slice gives a
+# list of Fractions, like slicing the list the original part 2 returned.
+class ExactSeries:
+
+    def __init__(self, n, a0=1, a1=1, first=0):
+        self.n = n
+        self.first = first
+        self.start = (Fraction(a0), Fraction(a1))
+        self._cursors = {}   # chain -> (index, numerator, denominator) last read
+
+    def __len__(self):
+        return self.n + 2 - self.first
+
+    # Unreduced numerator and denominator of coefficient k (a[first + k])
+    def numeratorDenominator(self, k):
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("coefficient index out of range")
+        i = self.first + k
+        chain = i % 2
+        index, num, den = self._cursors.get(chain, (chain, 0, 0))
+        if index > i or not den:
+            index, num, den = chain, self.start[chain].numerator, self.start[chain].denominator
+        steps = range(index + 2, i + 1, 2)
+        num *= _productTree([-((j - 2) * (j - 3) + 1) for j in steps])
+        den *= _productTree([4 * j * (j - 1) for j in steps])
+        self._cursors[chain] = (i, num, den)
+        return num, den
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            start, stop, step = k.indices(len(self))
+            if step > 0:
+                return [Fraction(num, den) for num, den in islice(self.rawTerms(), start, stop, step)]
+            return [self[i] for i in range(start, stop, step)]
+        return Fraction(*self.numeratorDenominator(k))
+
+    # Unreduced (numerator, denominator) of every coefficient in order
+    def rawTerms(self):
+        num = [value.numerator for value in self.start]
+        den = [value.denominator for value in self.start]
+        for i in range(self.n + 2):
+            if i >= 2:
+                num[i % 2] *= -((i - 2) * (i - 3) + 1)
+                den[i % 2] *= 4 * i * (i - 1)
+            if i >= self.first:
+                yield num[i % 2], den[i % 2]
+
+    # Fractions in order; each one is reduced as it is yielded
+    def __iter__(self):
+        for num, den in self.rawTerms():
+            yield Fraction(num, den)
+
+
+# Product of a list of integers, splitting in halves so the big-integer
+# multiplications stay balanced
+def _productTree(values):
+    if len(values) <= 8:
+        return math.prod(values)
+    middle = len(values) // 2
+    return _productTree(values[:middle]) * _productTree(values[middle:])
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Series Evaluation ---------------------------
+# Evaluates y(x) = sum a[i] x^i for an array of x (any shape).
+# The coefficients are taken in log form and rescaled by R = max|x|, so the
+# Horner loop runs on u = x / R with |u| <= 1 and b[i] = a[i] R^i, which
+# neither underflows nor overflows. Terms whose bound |b[i]| falls below
+# tol times the largest term are dropped from the tail (for |x| < 2, where
+# the series converges, that leaves a short loop even for n = 10^5).
+# x is processed in chunks of chunk_size points to bound memory.
+def evaluateSeries(x, n, a0=1, a1=1, tol=1e-17, chunk_size=1 << 20):
+    x = np.asarray(x, dtype=float)
+    signs, logs = seriesCoefficients(n, "log", a0, a1)
+
+    radius = np.max(np.abs(x)) if x.size else 0.0
+    if radius == 0:
+        return np.full(x.shape, signs[0] * np.exp(logs[0]))
+
+    scaled_logs = logs + np.arange(n + 2) * np.log(radius)
+    keep = np.flatnonzero(scaled_logs >= scaled_logs.max() + np.log(tol))
+    last = keep[-1] if len(keep) else 0
+    with np.errstate(over="ignore"):
+        b = signs[:last + 1] * np.exp(scaled_logs[:last + 1])
+
+    flat = x.ravel()
+    result = np.empty_like(flat)
+    for start in range(0, len(flat), chunk_size):
+        u = flat[start:start + chunk_size] / radius
+        y = np.full_like(u, b[last])
+        for coefficient in b[last - 1::-1]:
+            y *= u
+            y += coefficient
+        result[start:start + chunk_size] = y
+    return result.reshape(x.shape)
+# -----------------------------------------------------------------------
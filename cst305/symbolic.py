@@ -0,0 +1,193 @@
+# CST 305 – Cached Symbolic Riemann Sums
+# sp.summation and sp.limit are slow and their inputs rarely change, so the
+# results are kept in a disk cache keyed by a canonical form of (f, a, b).
+# Closed forms are compiled with lambdify so the Riemann sum can be
+# evaluated for large arrays of n without touching sympy again.
+
+# ---------------------- Import Required Libraries ----------------------
+import ast
+import hashlib
+import json
+import os
+
+import numpy as np
+import sympy as sp
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+# Under the CST305_CACHE_DIR root shared with cst305/cache.py, which keeps
+# its results in a sibling "results" directory
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("CST305_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "cst305"),
+    "symbolic")
+MAX_ENTRIES = 256              # Files kept before the least recently used go
+MAX_BYTES = 16 * 1024 * 1024   # Total size kept before the least recently used go
+
+# Symbols used in every formula (equal to sp.symbols('n k') elsewhere)
+n, k = sp.symbols('n k')
+_x = sp.Symbol('x')
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Disk Cache ------------------------------
+# One JSON file per entry holding sympy srepr strings. Reading an entry
+# touches its modification time, so eviction removes the least recently
+# used files once either limit is exceeded. Entries are read back with
+# parseSrepr, never eval/sympify, so a file planted in the cache directory
+# cannot run code; anything else is a cache miss.
+class SymbolicCache:
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+            values = {name: parseSrepr(text) for name, text in entry.items()}
+            os.utime(path)
+        except (OSError, ValueError, TypeError, AttributeError, RecursionError):
+            return None
+        return values
+
+    def put(self, key, values):
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {name: sp.srepr(value) for name, value in values.items()}
+        temporary = self._path(key) + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(entry, file)
+        os.replace(temporary, self._path(key))
+        self.evict()
+
+    def evict(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                stat = os.stat(os.path.join(self.directory, name))
+                files.append((stat.st_mtime, stat.st_size, name))
+        files.sort(reverse=True)  # Most recently used first
+
+        total = 0
+        for count, (_, size, name) in enumerate(files, start=1):
+            total += size
+            if count > self.max_entries or total > self.max_bytes:
+                os.remove(os.path.join(self.directory, name))
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+
+_default_cache = SymbolicCache()
+
+# sympy classes srepr can name that are not exported from the top level
+_SREPR_NAMES = {"ExprCondPair": sp.functions.elementary.piecewise.ExprCondPair}
+
+
+# Rebuilds an expression from its srepr text without evaluating it as
+# Python: the text is parsed with ast and only calls of sympy classes
+# (Add, Symbol('n'), Integer(2), Function('f')(...)), sympy singletons
+# (pi, oo, true) and literal numbers, strings and tuples are allowed.
+def parseSrepr(text):
+    return _buildNode(ast.parse(text, mode="eval").body)
+
+
+def _buildNode(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool, type(None))):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _buildNode(node.operand)
+        if isinstance(value, (int, float, sp.Basic)):
+            return -value
+    elif isinstance(node, (ast.Tuple, ast.List)):
+        return tuple(_buildNode(item) for item in node.elts)
+    elif isinstance(node, ast.Name):
+        value = getattr(sp, node.id, None) or _SREPR_NAMES.get(node.id)
+        if isinstance(value, sp.Basic) or _isSympyClass(value):
+            return value
+    elif isinstance(node, ast.Call):
+        function = _buildNode(node.func)
+        if _isSympyClass(function) and all(keyword.arg is not None for keyword in node.keywords):
+            return function(*(_buildNode(arg) for arg in node.args),
+                            **{keyword.arg: _buildNode(keyword.value) for keyword in node.keywords})
+    raise ValueError(f"not a sympy srepr expression: {ast.dump(node)[:80]}")
+
+
+def _isSympyClass(value):
+    return isinstance(value, type) and issubclass(value, sp.Basic)
+
+
+# Canonical key: f rewritten in a standard variable x, with a and b sympified,
+# so the same problem written with a different variable name hits the cache
+def canonicalKey(kind, f, x, a, b):
+    f = sp.sympify(f).subs(x, _x)
+    text = kind + "|" + sp.srepr(sp.Tuple(f, sp.sympify(a), sp.sympify(b)))
+    return hashlib.sha256(text.encode()).hexdigest()
+# -----------------------------------------------------------------------
+
+
+# -------------------------- Riemann Formulas ---------------------------
+# Right-endpoint Riemann sum of f over [a, b] as a formula in n, and its
+# limit as n -> infinity (None when the sum has no closed form or
+# with_limit=False). Results come from the cache when available.
+def symbolicRiemann(f, x, a, b, with_limit=True, cache=None):
+    cache = cache or _default_cache
+    key = canonicalKey("riemann", f, x, a, b)
+    entry = cache.get(key)
+
+    if entry is None:
+        delta_x = (sp.sympify(b) - a) / n
+        c_k = a + (k * delta_x)
+        riemann_sum = sp.summation(sp.sympify(f).subs(x, c_k) * delta_x, (k, 1, n))
+        entry = {"sum": riemann_sum}
+        cache.put(key, entry)
+
+    if with_limit and "limit" not in entry and not entry["sum"].has(sp.Sum):
+        entry["limit"] = sp.limit(entry["sum"], n, sp.oo)
+        cache.put(key, entry)
+
+    return entry["sum"], entry.get("limit") if with_limit else None
+
+
+# Compiled closed forms, kept for the life of the process
+_compiled = {}
+
+
+# NumPy function g(n_values) giving the right-endpoint Riemann sum for each
+# n in an array. Closed forms are lambdified once; sums sympy cannot close
+# fall back to the numeric engine in cst305/riemann.py.
+def riemannSumFunction(f, x, a, b, cache=None):
+    key = canonicalKey("riemann", f, x, a, b)
+    if key in _compiled:
+        return _compiled[key]
+
+    riemann_sum, _ = symbolicRiemann(f, x, a, b, with_limit=False, cache=cache)
+    if riemann_sum.has(sp.Sum):
+        from cst305.riemann import riemannSum
+
+        numeric_f = sp.lambdify(x, f, "numpy")
+        a_value, b_value = float(a), float(b)
+
+        def function(n_values):
+            n_values = np.asarray(n_values)
+            sums = [riemannSum(numeric_f, a_value, b_value, int(count), "right", with_error=False)[0]
+                    for count in n_values.ravel()]
+            return np.array(sums).reshape(n_values.shape)
+    else:
+        compiled = sp.lambdify(n, riemann_sum, "numpy")
+
+        def function(n_values):
+            return compiled(np.asarray(n_values, dtype=float))
+
+    _compiled[key] = function
+    return function
+# -----------------------------------------------------------------------
@@ -0,0 +1,259 @@
+# CST 305 – Work-Precision Benchmark: Euler, RK4, RK45 and odeint
+# Runs every method on every test problem across a ladder of step sizes
+# (Euler, RK4) or tolerances (RK45, odeint), and records the error against
+# the exact (or a tight reference) solution, the wall time and the number
+# of right-hand-side evaluations of each run. The results are written as
+# JSON and plotted as error against time and against RHS evaluations, and
+# cheapest() picks the fastest run that meets an accuracy target.
+#
+#   lorenz      Lorenz system, r = 28, t in [0, 2] (reference: RK45 at 1e-13)
+#   log-forced  dy/dx = -y + ln(x), y(2) = 1, x in [2, 12] (closed form)
+#   cooling     Newton cooling for five surroundings, t in [0, 10] (closed form)
+#   greens      y'' + 4y = t and y'' + y = 4 from rest, t in [0, 10] (closed form)
+#
+# Usage: python -m cst305.workprecision --problems lorenz cooling
+#            --out wp.json --plot wp.png --target 1e-6
+
+# ---------------------- Import Required Libraries ----------------------
+import argparse
+import json
+
+import numpy as np
+
+from cst305 import instrument
+from cst305.bench import environment, summarize, timeRepeated
+# -----------------------------------------------------------------------
+
+
+# ----------------------- Default Parameters ----------------------------
+OUTPUTS = 10                 # Output intervals the error is measured on
+STEP_LADDER = (50, 100, 200, 400, 800, 1600, 3200, 6400, 12800)  # Steps over the interval
+TOL_LADDER = (1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9, 1e-10)
+REFERENCE_TOL = 1e-13
+DIVERGED = 100               # Errors above this times max(1, max |y|) count as diverged
+REPEATS = 3
+WARMUP = 1
+FIXED_METHODS = ("euler", "rk4")
+ADAPTIVE_METHODS = ("rk45", "odeint")
+METHODS = FIXED_METHODS + ADAPTIVE_METHODS
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Problems ---------------------------------
+# Each problem: f(y, t) (odeint argument order), y0, [t0, t_end] and
+# exact(t) giving the solution on an array of times, shape (len(t), n).
+# Without a closed form, exact is None and a reference run is used.
+def _lorenzProblem():
+    from cst305.lorenz import DEFAULT_B, DEFAULT_INITIAL, DEFAULT_S, lorenz
+
+    def f(y, t):
+        return np.array(lorenz(y[0], y[1], y[2], 28.0, DEFAULT_S, DEFAULT_B))
+
+    return {"f": f, "y0": np.array(DEFAULT_INITIAL, dtype=float), "t0": 0.0, "t_end": 2.0,
+            "exact": None}
+
+
+def _logForcedProblem():
+    from cst305.rk4 import diffEq, exactSolution
+
+    return {"f": diffEq, "y0": np.array([1.0]), "t0": 2.0, "t_end": 12.0,
+            "exact": lambda t: exactSolution(t, 2.0, 1.0)[:, None]}
+
+
+def _coolingProblem():
+    from cst305.cooling import coolingCurves, model
+
+    k, T0 = 0.5, 80.0
+    s = np.array([50.0, 60.0, 70.0, 80.0, 90.0])
+    return {"f": lambda T, t: model(T, t, k, s), "y0": np.full(len(s), T0), "t0": 0.0,
+            "t_end": 10.0, "exact": lambda t: coolingCurves(t[:, None], k, s, T0)}
+
+
+# State (y1, y1', y2, y2') of the two Green's-function test ODEs
+def _greensProblem():
+    def f(y, t):
+        return np.array([y[1], t - 4 * y[0], y[3], 4 - y[2]])
+
+    def exact(t):
+        return np.stack([t / 4 - np.sin(2 * t) / 8, (1 - np.cos(2 * t)) / 4,
+                         4 * (1 - np.cos(t)), 4 * np.sin(t)], axis=-1)
+
+    return {"f": f, "y0": np.zeros(4), "t0": 0.0, "t_end": 10.0, "exact": exact}
+
+
+PROBLEMS = {"lorenz": _lorenzProblem, "log-forced": _logForcedProblem,
+            "cooling": _coolingProblem, "greens": _greensProblem}
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Single Run ------------------------------
+# Solution of `problem` on its OUTPUTS + 1 output times. `setting` is the
+# number of steps for Euler/RK4 and rtol = atol for RK45/odeint.
+# Returns (y on the output times, rhs_evals).
+def runMethod(problem, method, setting, outputs=OUTPUTS):
+    f, y0, t0, t_end = problem["f"], problem["y0"], problem["t0"], problem["t_end"]
+    if method == "odeint":
+        from scipy.integrate import odeint
+
+        t = np.linspace(t0, t_end, outputs + 1)
+        y, info = odeint(f, y0, t, rtol=setting, atol=setting, full_output=True)
+        instrument.count("odeint", rhs_evals=info["nfe"][-1], accepted=info["nst"][-1],
+                         jac_evals=info["nje"][-1])
+        return y, int(info["nfe"][-1])
+
+    from cst305.ode import solve
+
+    stats = {}
+    if method in FIXED_METHODS:
+        if setting % outputs:
+            raise ValueError(f"the number of steps must be a multiple of {outputs}")
+        _, y = solve(f, y0, (t_end - t0) / setting, setting, method, t0, stats=stats)
+        return y[::setting // outputs], stats["rhs_evals"]
+    _, y = solve(f, y0, (t_end - t0) / outputs, outputs, method, t0,
+                 rtol=setting, atol=setting, stats=stats)
+    return y, stats["rhs_evals"]
+
+
+# Exact solution on the output times, or a tight RK45 run without one
+def referenceSolution(problem, outputs=OUTPUTS):
+    if problem["exact"] is not None:
+        return problem["exact"](np.linspace(problem["t0"], problem["t_end"], outputs + 1))
+    return runMethod(problem, "rk45", REFERENCE_TOL, outputs)[0]
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Benchmark --------------------------------
+# Every method on every problem over the step and tolerance ladders. The
+# error is the largest absolute difference from the reference over the
+# output times (None when it overflowed); runs whose error is larger than
+# DIVERGED times the solution are flagged "diverged" and left out of the
+# plots. Returns a list of result dicts (one per problem, method and
+# ladder setting).
+def runWorkPrecision(problems=tuple(PROBLEMS), methods=METHODS, steps=STEP_LADDER,
+                     tolerances=TOL_LADDER, repeats=REPEATS, warmup=WARMUP, outputs=OUTPUTS):
+    results = []
+    for name in problems:
+        problem = PROBLEMS[name]()
+        reference = referenceSolution(problem, outputs)
+        scale = DIVERGED * max(1.0, float(np.max(np.abs(reference))))
+        for method in methods:
+            fixed = method in FIXED_METHODS
+            for setting in (steps if fixed else tolerances):
+                with np.errstate(all="ignore"):  # Euler may diverge on coarse steps
+                    durations, (y, rhs_evals) = timeRepeated(
+                        lambda: runMethod(problem, method, setting, outputs), repeats, warmup)
+                    error = float(np.max(np.abs(y - reference)))
+                results.append({
+                    "problem": name,
+                    "method": method,
+                    "parameter": "steps" if fixed else "tol",
+                    "value": setting,
+                    "h": (problem["t_end"] - problem["t0"]) / setting if fixed else None,
+                    "repeats": repeats,
+                    **summarize(durations),
+                    "rhs_evals": rhs_evals,
+                    "error": error if np.isfinite(error) else None,
+                    "diverged": not error <= scale,
+                })
+    return results
+
+
+# Fastest run (by median time) of each problem with error <= target.
+# Returns {problem: result dict or None when no run is accurate enough}.
+def cheapest(results, target):
+    best = {}
+    for res in results:
+        best.setdefault(res["problem"], None)
+        if res["diverged"] or res["error"] > target:
+            continue
+        current = best[res["problem"]]
+        if current is None or res["median_s"] < current["median_s"]:
+            best[res["problem"]] = res
+    return best
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Output ---------------------------------
+# Prints one line per result
+def printResults(results):
+    print(f"{'problem':>10} {'method':>7} {'setting':>9} {'median s':>11} {'IQR s':>10} "
+          f"{'RHS evals':>10} {'max error':>10}")
+    for res in results:
+        error = "overflow" if res["error"] is None else f"{res['error']:.2e}"
+        error += " (diverged)" if res["diverged"] else ""
+        print(f"{res['problem']:>10} {res['method']:>7} {res['value']:>9g} {res['median_s']:>11.3e} "
+              f"{res['iqr_s']:>10.2e} {res['rhs_evals']:>10} {error}")
+
+
+# Error against median wall time (left) and against RHS evaluations
+# (right), one row per problem and one line per method, log-log. Saves to
+# `path` when given, else shows the figure.
+def plotWorkPrecision(results, path=None):
+    import matplotlib.pyplot as plt
+
+    problems = list(dict.fromkeys(res["problem"] for res in results))
+    fig, axes = plt.subplots(len(problems), 2, figsize=(11, 3.2 * len(problems)), squeeze=False)
+    for row, problem in zip(axes, problems):
+        for method in dict.fromkeys(res["method"] for res in results):
+            runs = [res for res in results if res["problem"] == problem
+                    and res["method"] == method and not res["diverged"]]
+            if not runs:
+                continue
+            error = [max(res["error"], 1e-17) for res in runs]  # Exact results on a log axis
+            row[0].loglog([res["median_s"] for res in runs], error, 'o-', ms=3, label=method)
+            row[1].loglog([res["rhs_evals"] for res in runs], error, 'o-', ms=3, label=method)
+        row[0].set_ylabel(f"{problem}\nmax error")
+        row[0].legend(fontsize=8)
+        for ax in row:
+            ax.grid(True, which="both", alpha=0.3)
+    axes[0, 0].set_title("Error vs wall time")
+    axes[0, 1].set_title("Error vs RHS evaluations")
+    axes[-1, 0].set_xlabel("median wall time (s)")
+    axes[-1, 1].set_xlabel("RHS evaluations")
+
+    plt.tight_layout()
+    if path:
+        fig.savefig(path)
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Work-precision benchmark: Euler, RK4, RK45, odeint")
+    parser.add_argument("--problems", nargs="+", choices=tuple(PROBLEMS), default=list(PROBLEMS))
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--steps", nargs="+", type=int, default=list(STEP_LADDER),
+                        help=f"fixed-step ladder: steps over the interval (multiples of {OUTPUTS})")
+    parser.add_argument("--tol", nargs="+", type=float, default=list(TOL_LADDER),
+                        help="tolerance ladder (rtol = atol) for rk45 and odeint")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--warmup", type=int, default=WARMUP)
+    parser.add_argument("--target", type=float, default=None,
+                        help="print the cheapest run of each problem with error <= TARGET")
+    parser.add_argument("--out", default=None, help="write results to this JSON file")
+    parser.add_argument("--plot", default=None, help="save the work-precision figure to this file")
+    args = parser.parse_args(argv)
+
+    results = runWorkPrecision(args.problems, args.methods, args.steps, args.tol,
+                               args.repeats, args.warmup)
+    printResults(results)
+    best = cheapest(results, args.target) if args.target is not None else None
+    if best is not None:
+        print(f"\nCheapest run with error <= {args.target:g}:")
+        for problem, res in best.items():
+            choice = "none" if res is None else (f"{res['method']} {res['parameter']}={res['value']:g}"
+                                                 f" ({res['median_s']:.3e} s, error {res['error']:.2e})")
+            print(f"{problem:>10}: {choice}")
+    if args.out:
+        with open(args.out, "w") as file:
+            json.dump({"environment": environment(), "outputs": OUTPUTS, "target": args.target,
+                       "cheapest": best, "results": results}, file, indent=2)
+        print(f"\nResults written to {args.out}")
+    if args.plot:
+        plotWorkPrecision(results, args.plot)
+
+
+if __name__ == "__main__":
+    main()
+# -----------------------------------------------------------------------
@@ -0,0 +1,64 @@
+# Tests for the RK4 vs odeint benchmark suite (cst305/bench.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import json
+
+import numpy as np
+import pytest
+
+from cst305 import bench
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Timing Helpers ---------------------------
+def test_time_repeated_counts_calls():
+    calls = []
+    durations, result = bench.timeRepeated(lambda: calls.append(1) or len(calls), repeats=4, warmup=2)
+    assert len(durations) == 4 and all(d >= 0 for d in durations)
+    assert result == len(calls) == 6
+
+
+def test_summarize():
+    summary = bench.summarize([1.0, 2.0, 3.0, 4.0, 100.0])
+    assert summary == {"median_s": 3.0, "iqr_s": 2.0, "min_s": 1.0, "max_s": 100.0}
+# -----------------------------------------------------------------------
+
+
+# ------------------------------- Solvers -------------------------------
+@pytest.mark.parametrize("name", sorted(bench.SOLVERS))
+def test_solvers_are_accurate(name):
+    x_values, y_values, rhs_evals = bench.SOLVERS[name](bench.X0, bench.Y0, 0.01, 500)
+    assert len(x_values) == len(y_values) == 501
+    assert rhs_evals > 0
+    np.testing.assert_allclose(y_values, bench.exactSolution(x_values, bench.X0, bench.Y0), atol=1e-6)
+
+
+def test_loop_and_vectorized_rk4_agree():
+    loop = bench.solveRK4Loop(bench.X0, bench.Y0, 0.03, 300)
+    vectorized = bench.solveRK4(bench.X0, bench.Y0, 0.03, 300)
+    np.testing.assert_array_equal(loop[0], vectorized[0])
+    np.testing.assert_allclose(loop[1], vectorized[1], rtol=1e-14)
+    assert loop[2] == vectorized[2] == 1200
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Benchmark ------------------------------
+def test_run_benchmarks_grid():
+    results = bench.runBenchmarks(h_values=(0.3, 0.03), runs_values=(20, 40), repeats=2, warmup=0)
+    assert [(res["h"], res["runs"], res["solver"]) for res in results] == [
+        (h, runs, name) for h in (0.3, 0.03) for runs in (20, 40) for name in bench.SOLVERS]
+    for res in results:
+        assert res["repeats"] == 2
+        assert res["min_s"] <= res["median_s"] <= res["max_s"]
+        assert res["steps_per_s"] == pytest.approx(res["runs"] / res["median_s"])
+        assert res["max_error"] < 1e-2
+
+
+def test_main_writes_json(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    bench.main(["--h", "0.1", "--runs", "50", "--repeats", "1", "--warmup", "0", "--out", str(out)])
+    saved = json.loads(out.read_text())
+    assert {"python", "numpy", "scipy"} <= set(saved["environment"])
+    assert [res["solver"] for res in saved["results"]] == list(bench.SOLVERS)
+    assert "rk4_loop" in capsys.readouterr().out
+# -----------------------------------------------------------------------
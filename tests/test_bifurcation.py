@@ -0,0 +1,30 @@
+# Tests for the Lorenz r-sweep (cst305/bifurcation.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.bifurcation import lyapunovAndMaxima, sweep
+# -----------------------------------------------------------------------
+
+
+SHORT = {"num_steps": 3000, "transient_steps": 1000}
+R_VALUES = np.array([0.5, 10.0, 28.0, 160.0, 350.0])
+
+
+def test_exponent_sign_by_regime():
+    lyapunov, maxima = lyapunovAndMaxima(R_VALUES[[0, 2]], **SHORT)
+    assert lyapunov[0] < 0     # stable origin
+    assert lyapunov[1] > 0.5   # chaos (about 0.9 at r = 28)
+    assert len(maxima[1]) > 10
+
+
+@pytest.mark.parametrize("processes, chunks_per_process", [(2, 1), (2, 3)])
+def test_pool_matches_one_process(processes, chunks_per_process):
+    serial = sweep(R_VALUES, processes=1, **SHORT)
+    pooled = sweep(R_VALUES, processes=processes, chunks_per_process=chunks_per_process, **SHORT)
+    np.testing.assert_array_equal(pooled["r"], R_VALUES)
+    np.testing.assert_allclose(pooled["lyapunov"], serial["lyapunov"], rtol=1e-12)
+    assert len(pooled["maxima"]) == len(R_VALUES)
+    for pooled_maxima, serial_maxima in zip(pooled["maxima"], serial["maxima"]):
+        np.testing.assert_allclose(pooled_maxima, serial_maxima, rtol=1e-12)
@@ -0,0 +1,54 @@
+# Tests for the result cache (cst305/cache.py) and its directory layout
+# next to the symbolic cache (cst305/symbolic.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import importlib
+
+import numpy as np
+
+from cst305 import cache
+from cst305.cache import ResultCache
+# -----------------------------------------------------------------------
+
+
+calls = []
+
+
+def square(x):
+    calls.append(x)
+    return np.asarray(x) ** 2
+
+
+# -------------------------------- Tiers --------------------------------
+def test_memory_hit():
+    results = ResultCache()
+    first = results.call(square, np.arange(4))
+    second = results.call(square, np.arange(4))
+    np.testing.assert_array_equal(second, first)
+    assert len([x for x in calls if np.array_equal(x, np.arange(4))]) == 1
+    assert not second.flags.writeable
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    ResultCache(directory=str(tmp_path)).call(square, np.arange(5.0))
+    count = len(calls)
+    result = ResultCache(directory=str(tmp_path)).call(square, np.arange(5.0))
+    np.testing.assert_array_equal(result, np.arange(5.0) ** 2)
+    assert len(calls) == count
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Directories ----------------------------
+def test_caches_use_separate_directories(tmp_path, monkeypatch):
+    monkeypatch.setenv("CST305_CACHE_DIR", str(tmp_path))
+    monkeypatch.setitem(cache._shared, "cache", None)
+    cache.sharedCache().call(square, np.arange(3.0))
+    symbolic = importlib.reload(importlib.import_module("cst305.symbolic"))
+    try:
+        assert symbolic.DEFAULT_CACHE_DIR == str(tmp_path / "symbolic")
+        assert [path.name for path in tmp_path.iterdir()] == ["results"]
+        assert [path.suffix for path in (tmp_path / "results").iterdir()] == [".npz"]
+    finally:
+        monkeypatch.delenv("CST305_CACHE_DIR")
+        importlib.reload(symbolic)
+# -----------------------------------------------------------------------
@@ -0,0 +1,137 @@
+# Tests for the python -m cst305 command line (cst305/cli.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import json
+
+import numpy as np
+import pytest
+
+from cst305 import lorenz, render
+from cst305.cli import main
+# -----------------------------------------------------------------------
+
+
+# Stands in for a matplotlib figure and remembers what it was built from
+class FakeFigure:
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.saved = []
+
+    def savefig(self, path):
+        self.saved.append(path)
+
+
+@pytest.fixture
+def figures(monkeypatch):
+    made = []
+
+    def record(name):
+        def build(*args, **kwargs):
+            made.append((name, FakeFigure(*args, **kwargs)))
+            return made[-1][1]
+        return build
+
+    for name in ("lorenzFigure", "stateFigure", "trajectoryFigure"):
+        monkeypatch.setattr(render, name, record(name))
+    monkeypatch.setattr(render, "useHeadless", lambda: None)
+    return made
+
+
+# ------------------------------- Lorenz --------------------------------
+def test_lorenz_figure_reuses_the_run(monkeypatch, figures, capsys):
+    calls = []
+    run_batch = lorenz.runBatch
+
+    def counted(*args, **kwargs):
+        calls.append(kwargs)
+        return run_batch(*args, **kwargs)
+
+    monkeypatch.setattr(lorenz, "runBatch", counted)
+    main(["lorenz", "28", "10", "--method", "rk45", "--rtol", "1e-3", "--atol", "1e-6",
+          "--steps", "50", "--figure", "f_{r}.png"])
+    assert len(calls) == 1
+    assert calls[0]["rtol"] == 1e-3 and calls[0]["atol"] == 1e-6
+    assert [name for name, _ in figures] == ["stateFigure", "stateFigure"]
+    time, states, label = figures[1][1].args
+    assert len(time) == 51 and states.shape == (51, 3) and label == "r = 10"
+    assert "r = 28: final state" in capsys.readouterr().out
+
+
+def test_lorenz_resume_uses_the_checkpoint_dt(tmp_path, figures):
+    npy, checkpoint = str(tmp_path / "x.npy"), str(tmp_path / "x.ck")
+    main(["lorenz", "28", "--dt", "0.02", "--steps", "40", "--npy", npy, "--checkpoint", checkpoint])
+    main(["lorenz", "28", "--resume", "--steps", "80", "--npy", npy, "--checkpoint", checkpoint,
+          "--figure", str(tmp_path / "x.png")])
+    name, figure = figures[-1]
+    assert name == "trajectoryFigure" and figure.kwargs["dt"] == 0.02
+    assert np.load(npy).shape == (81, 1, 3)
+
+
+def test_lorenz_resume_needs_files():
+    with pytest.raises(SystemExit):
+        main(["lorenz", "28", "--resume"])
+
+
+def test_lorenz_rejects_rosenbrock():
+    with pytest.raises(SystemExit):
+        main(["lorenz", "28", "--method", "rosenbrock"])
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Other Commands ----------------------------
+def test_cooling(capsys):
+    main(["cooling", "--s", "20", "--points", "3", "--threshold", "50"])
+    out = capsys.readouterr().out
+    assert "s = 20" in out and "reaches 50 after" in out
+
+
+def test_mmc(capsys):
+    main(["mmc", "2", "3", "1"])
+    out = capsys.readouterr().out
+    assert "utilization: 0.666667" in out
+    assert "W_q: 0.666667" in out and "T: 1\n" in out
+
+
+def test_queue_and_queuelog(tmp_path, capsys):
+    events = str(tmp_path / "events.bin")
+    main(["queue", "--customers", "2000", "--seed", "1", "--events", events])
+    simulated = capsys.readouterr().out
+    main(["queuelog", events])
+    streamed = capsys.readouterr().out
+    line = next(row for row in simulated.splitlines() if row.strip().startswith("W_q:"))
+    assert line in streamed
+
+
+def test_series(capsys):
+    main(["series", "--n", "2", "--mode", "exact"])
+    assert capsys.readouterr().out.splitlines() == ["a_0 = 1", "a_1 = 1", "a_2 = -1/8", "a_3 = -1/24"]
+    main(["series", "--n", "50", "--x", "0"])
+    assert capsys.readouterr().out.strip() == "y(0) = 1"
+
+
+def test_riemann(capsys):
+    main(["riemann", "x**2", "0", "1", "--n", "10", "--rules", "simpson"])
+    assert "simpson sum with n = 10: 0.333333333333" in capsys.readouterr().out
+
+
+def test_rates(tmp_path, capsys):
+    path = tmp_path / "rates.csv"
+    path.write_text("".join(f"{t},{2.0}\n" for t in range(11)))
+    main(["rates", str(path), "--window", "2", "5"])
+    out = capsys.readouterr().out
+    assert "total = 20" in out and "total over [2, 5] = 6" in out
+
+
+def test_bench_passes_options_through(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    main(["bench", "--h", "0.3", "--runs", "100", "--repeats", "1", "--warmup", "0", "--out", str(out)])
+    results = json.loads(out.read_text())["results"]
+    assert {res["solver"] for res in results} == {"rk4_loop", "rk4_vec", "odeint"}
+
+
+def test_unknown_option():
+    with pytest.raises(SystemExit):
+        main(["mmc", "2", "3", "1", "--bogus"])
+# -----------------------------------------------------------------------
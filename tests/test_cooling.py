@@ -0,0 +1,75 @@
+# Tests for Newton cooling (cst305/cooling.py) and Project 6 parts 2 and 3
+
+# ---------------------- Import Required Libraries ----------------------
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import MixedDifferentialSystems
+from cst305.cooling import coolingCurves, crossCheck, model, timeToThreshold
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Time to Threshold ---------------------------
+def test_time_to_threshold():
+    assert timeToThreshold(0.5, 20.0, 80.0, 50.0) == pytest.approx(np.log(2) / 0.5)
+    assert timeToThreshold(0.5, 90.0, 60.0, 75.0) == pytest.approx(np.log(2) / 0.5)
+
+
+@pytest.mark.parametrize("k, s, T0, threshold, expected", [
+    (0.5, 20.0, 80.0, 80.0, 0.0),        # Already there
+    (0.5, 50.0, 50.0, 50.0, 0.0),        # T0 == s == threshold
+    (0.5, 20.0, 80.0, 20.0, np.inf),     # The surroundings are only reached in the limit
+    (0.5, 20.0, 80.0, 90.0, np.inf),     # Not between T0 and s
+    (0.5, 50.0, 50.0, 60.0, np.inf),     # Already at s, never moves
+    (0.0, 20.0, 80.0, 50.0, np.inf),     # k == 0, never moves
+    (0.0, 20.0, 80.0, 80.0, 0.0),
+])
+def test_time_to_threshold_edge_cases(k, s, T0, threshold, expected):
+    with np.errstate(all="raise"):
+        assert timeToThreshold(k, s, T0, threshold) == expected
+
+
+def test_time_to_threshold_reaches_threshold():
+    k, s = np.array([0.1, 0.5, 2.0]), np.array([10.0, 30.0, 70.0])
+    times = timeToThreshold(k, s, 90.0, 75.0)
+    np.testing.assert_allclose(coolingCurves(times, k, s, 90.0), 75.0)
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Solver Methods ---------------------------
+@pytest.mark.parametrize("method", ["rk4", "rk45", "rosenbrock"])
+def test_methods_match_exact(method):
+    t = np.linspace(0, 10, 101)
+    assert crossCheck(t, [0.1, 0.5, 1.0], [20.0, 60.0], 80.0, method=method) < 1e-3
+
+
+def test_rosenbrock_on_very_stiff_cooling():
+    t = np.linspace(0, 1, 11)
+    assert crossCheck(t, [1e6], [20.0], 80.0, method="rosenbrock") < 1e-6
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Project 6 ------------------------------
+def test_part3_keeps_the_ode_signature():
+    assert MixedDifferentialSystems.part3(80.0, 0.0, 0.5, 20.0) == pytest.approx(-30.0)
+    assert MixedDifferentialSystems.part3 is model
+
+
+def test_part3_exact_broadcasts_over_surroundings():
+    t = np.linspace(0, 5, 6)
+    curves = MixedDifferentialSystems.part3Exact(t, 0.5, [20.0, 60.0], 80.0)
+    assert curves.shape == (2, len(t))
+    np.testing.assert_allclose(curves[1], 60.0 + 20.0 * np.exp(-0.5 * t))
+
+
+def test_part2_coefficients():
+    assert list(MixedDifferentialSystems.part2(4)) == [Fraction(-1, 8), Fraction(-1, 24), Fraction(1, 128),
+                                                      Fraction(7, 1920)]
+
+
+def test_part2_slices_like_a_list():
+    assert MixedDifferentialSystems.part2(5)[1:] == list(MixedDifferentialSystems.part2(5))[1:]
+    assert MixedDifferentialSystems.part2(4)[::2] == [Fraction(-1, 8), Fraction(1, 128)]
+# -----------------------------------------------------------------------
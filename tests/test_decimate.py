@@ -0,0 +1,108 @@
+# Tests for downsampling series before plotting (cst305/decimate.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.decimate import decimate, lttbIndices, minMaxIndices, streamMinMax
+# -----------------------------------------------------------------------
+
+
+# Noisy oscillation with a one-sample spike and dip
+def series(n=100000, columns=None, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 50, n)
+    shape = (n,) if columns is None else (n, columns)
+    y = np.sin(x).reshape(n, *([1] * (columns is not None))) + 0.1 * rng.standard_normal(shape)
+    y[n // 3] += 10
+    y[2 * n // 3] -= 10
+    return x, y
+
+
+# Textbook LTTB, one bucket at a time, on the same bucket edges
+def referenceLttb(x, y, target):
+    n = len(y)
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    selected = [0]
+    for bucket in range(target - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < target - 1:
+            nxt = slice(edges[bucket + 1], edges[bucket + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        a = selected[-1]
+        areas = [abs((x[a] - cx) * (y[i] - y[a]) - (x[a] - x[i]) * (cy - y[a])) for i in range(lo, hi)]
+        selected.append(lo + int(np.argmax(areas)))
+    return np.array(selected + [n - 1])
+
+
+# -------------------------------- LTTB ---------------------------------
+@pytest.mark.parametrize("n, target", [(1000, 50), (5003, 97), (20000, 4000)])
+def test_lttb_matches_reference(n, target):
+    x, y = series(n)
+    np.testing.assert_array_equal(lttbIndices(x, y, target), referenceLttb(x, y, target))
+
+
+def test_lttb_keeps_ends_and_spikes():
+    x, y = series()
+    indices = lttbIndices(x, y, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert {len(y) // 3, 2 * len(y) // 3} <= set(indices)
+
+
+def test_lttb_short_series():
+    np.testing.assert_array_equal(lttbIndices(np.arange(10), np.arange(10), 20), np.arange(10))
+    np.testing.assert_array_equal(lttbIndices(np.arange(10), np.arange(10), 2), [0, 9])
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Min / Max ------------------------------
+@pytest.mark.parametrize("columns", [None, 3])
+def test_minmax_keeps_extremes_within_budget(columns):
+    x, y = series(columns=columns)
+    indices = minMaxIndices(y, 1000)
+    assert len(indices) <= 1000
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert np.all(np.diff(indices) > 0)
+    kept = y[indices].reshape(len(indices), -1)
+    np.testing.assert_array_equal(kept.max(axis=0), y.reshape(len(y), -1).max(axis=0))
+    np.testing.assert_array_equal(kept.min(axis=0), y.reshape(len(y), -1).min(axis=0))
+
+
+@pytest.mark.parametrize("chunk", [1, 999, 4096, 100000])
+def test_stream_matches_in_memory(chunk):
+    _, y = series(columns=3)
+    indices, rows = streamMinMax((y[i:i + chunk] for i in range(0, len(y), chunk)), len(y), 1000)
+    np.testing.assert_array_equal(indices, minMaxIndices(y, 1000))
+    np.testing.assert_array_equal(rows, y[indices])
+
+
+def test_stream_empty_and_short():
+    indices, rows = streamMinMax(iter([]), 0)
+    assert len(indices) == len(rows) == 0
+    y = np.arange(5.0)
+    indices, rows = streamMinMax([y[:2], y[2:]], 5, 100)
+    np.testing.assert_array_equal(indices, np.arange(5))
+    np.testing.assert_array_equal(rows, y)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Decimate -------------------------------
+def test_decimate_returns_matching_pairs():
+    x, y = series()
+    for method in ("minmax", "lttb"):
+        small_x, small_y = decimate(x, y, 800, method)
+        assert len(small_x) == len(small_y) <= 800
+        np.testing.assert_array_equal(small_y, np.interp(small_x, x, y))
+
+
+def test_decimate_errors():
+    x, y = series(1000, columns=2)
+    with pytest.raises(ValueError):
+        decimate(x, y, 100, "lttb")
+    with pytest.raises(ValueError):
+        decimate(x, y[:, 0], 100, "every-nth")
+# -----------------------------------------------------------------------
@@ -0,0 +1,78 @@
+# Tests for the Green's function solver (cst305/greens.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+from scipy.integrate import odeint
+
+from cst305.greens import GreensSolver, companion, solveLinear
+# -----------------------------------------------------------------------
+
+
+t = np.linspace(0, 10, 2001)
+
+
+# ------------------------------ Exact Cases ----------------------------
+def test_linear_forcing_is_exact():
+    # y'' + 4y = t and y'' + 4y = 4 from rest
+    np.testing.assert_allclose(solveLinear((1, 0, 4), t, t), t / 4 - np.sin(2 * t) / 8, atol=1e-12)
+    np.testing.assert_allclose(solveLinear((1, 0, 4), t, np.full_like(t, 4.0)), 1 - np.cos(2 * t),
+                               atol=1e-12)
+
+
+def test_impulse_response_and_initial_conditions():
+    solver = GreensSolver((1, 0, 4), t[1], len(t))
+    np.testing.assert_allclose(solver.impulseResponse(), np.sin(2 * t) / 2, atol=1e-12)
+    # y(0) = 1, y'(0) = 2 with no forcing
+    np.testing.assert_allclose(solver.homogeneous([1.0, 2.0]), np.cos(2 * t) + np.sin(2 * t), atol=1e-12)
+    forced = solver.solve(t, initial=[1.0, 2.0])
+    np.testing.assert_allclose(forced, t / 4 - np.sin(2 * t) / 8 + np.cos(2 * t) + np.sin(2 * t),
+                               atol=1e-12)
+
+
+def test_first_order_decay():
+    # 2y' + y = 0, y(0) = 3
+    np.testing.assert_allclose(solveLinear((2, 1), t, np.zeros_like(t), initial=[3.0]),
+                               3 * np.exp(-t / 2), rtol=1e-12)
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Smooth Forcing --------------------------
+def test_damped_oscillator_matches_odeint():
+    # y'' + 0.5y' + 9y = cos(2t) sin(t/3), y(0) = 1, y'(0) = 0
+    forcing = np.cos(2 * t) * np.sin(t / 3)
+    expected = odeint(lambda x, s: [x[1], np.cos(2 * s) * np.sin(s / 3) - 0.5 * x[1] - 9 * x[0]],
+                      [1.0, 0.0], t, rtol=1e-11, atol=1e-12)[:, 0]
+    # First-order hold: O(dt^2) error for curved forcing
+    np.testing.assert_allclose(solveLinear((1, 0.5, 9), t, forcing, [1.0, 0.0]), expected, atol=1e-5)
+
+
+def test_batch_matches_single_signals():
+    solver = GreensSolver((1, 0.2, 1, 3), t[1], len(t))
+    forcing = np.stack([np.sin(k * t) for k in (0.5, 1.0, 3.0)]).reshape(3, 1, len(t))
+    initial = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, -1.0]])      # broadcast to (3, 2)
+    batched = solver.solve(forcing, initial)
+    assert batched.shape == (3, 2, len(t))
+    for i in range(3):
+        for j in range(2):
+            np.testing.assert_allclose(batched[i, j], solver.solve(forcing[i, 0], initial[j]),
+                                       atol=1e-13)
+# -----------------------------------------------------------------------
+
+
+# -------------------------------- Errors -------------------------------
+@pytest.mark.parametrize("coefficients", [(0, 1, 2), (3,), [[1, 2]]])
+def test_bad_coefficients(coefficients):
+    with pytest.raises(ValueError):
+        companion(coefficients)
+
+
+def test_bad_grid_and_shapes():
+    with pytest.raises(ValueError):
+        solveLinear((1, 1), np.array([0.0, 1.0, 3.0]), np.zeros(3))
+    solver = GreensSolver((1, 0, 4), 0.1, 50)
+    with pytest.raises(ValueError):
+        solver.solve(np.zeros(49))
+    with pytest.raises(ValueError):
+        solver.homogeneous([1.0])
+# -----------------------------------------------------------------------
@@ -0,0 +1,118 @@
+# Tests for the solver instrumentation (cst305/instrument.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305 import instrument
+# -----------------------------------------------------------------------
+
+
+# Every test starts from empty, enabled instrumentation and leaves the
+# global switch as it found it
+@pytest.fixture(autouse=True)
+def clean():
+    was_enabled = instrument.enabled()
+    instrument.reset()
+    instrument.enable()
+    yield
+    instrument.reset()
+    (instrument.enable if was_enabled else instrument.disable)()
+
+
+# ------------------------------ Switch ---------------------------------
+def test_disabled_records_nothing():
+    instrument.disable()
+    assert not instrument.enabled()
+    instrument.count("rk4", rhs_evals=4)
+    instrument.countStats("ode.rk45", {"accepted": 3})
+    with instrument.phase("work"):
+        pass
+    assert instrument.report() == {"counters": {}, "phases": {}}
+
+
+def test_reset_clears_everything():
+    instrument.count("rk4", rhs_evals=4)
+    with instrument.phase("work"):
+        pass
+    instrument.reset()
+    assert instrument.report() == {"counters": {}, "phases": {}}
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Counters --------------------------------
+def test_counts_add_up():
+    instrument.count("rk4", rhs_evals=4, accepted=1)
+    instrument.count("rk4", rhs_evals=np.int64(8), accepted=2)
+    assert instrument.report()["counters"] == {"rk4": {"rhs_evals": 12, "accepted": 3}}
+
+
+def test_count_stats_takes_solver_counts_only():
+    instrument.countStats("ode.rk45", {"accepted": 5, "rejected": 1, "rhs_evals": 37, "method": "rk45"})
+    assert instrument.report()["counters"] == {"ode.rk45": {"accepted": 5, "rejected": 1, "rhs_evals": 37}}
+
+
+def test_solvers_report():
+    from cst305.bench import solveOdeint
+    from cst305.ode import solve
+
+    solve(lambda y, t: -y, np.ones(2), 0.1, 10, "rk4")
+    _, _, rhs_evals = solveOdeint(2.0, 1.0, 0.3, 100)
+    counters = instrument.report()["counters"]
+    assert counters["ode.rk4"] == {"accepted": 10, "rejected": 0, "rhs_evals": 40}
+    assert counters["odeint"]["rhs_evals"] == rhs_evals
+
+
+def test_workprecision_odeint_reports():
+    from cst305.workprecision import PROBLEMS, runMethod
+
+    _, rhs_evals = runMethod(PROBLEMS["cooling"](), "odeint", 1e-6)
+    assert instrument.report()["counters"]["odeint"]["rhs_evals"] == rhs_evals
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Phases ---------------------------------
+def test_phases_accumulate():
+    for _ in range(3):
+        with instrument.phase("work"):
+            pass
+    entry = instrument.report()["phases"]["work"]
+    assert entry["calls"] == 3
+    assert entry["seconds"] >= 0
+
+
+def test_timed_keeps_the_function():
+    @instrument.timed("double")
+    def double(x):
+        return 2 * x
+
+    assert double(21) == 42
+    assert double.__name__ == "double"
+    assert instrument.report()["phases"]["double"]["calls"] == 1
+
+
+def test_phase_records_exceptions_and_reraises():
+    with pytest.raises(RuntimeError):
+        with instrument.phase("failing"):
+            raise RuntimeError
+    assert instrument.report()["phases"]["failing"]["calls"] == 1
+
+
+def test_trace_memory_peaks():
+    with instrument.traceMemory():
+        with instrument.phase("allocate"):
+            block = np.ones(1 << 20)
+        del block
+    data = instrument.report()
+    assert data["memory"]["peak_bytes"] >= 8 << 20
+    assert data["phases"]["allocate"]["peak_bytes"] >= 8 << 20
+
+
+def test_format_report():
+    instrument.count("rk4", rhs_evals=4)
+    with instrument.phase("work"):
+        pass
+    text = instrument.formatReport()
+    assert "rk4: rhs_evals = 4" in text
+    assert "work: " in text and "1 call(s)" in text
+# -----------------------------------------------------------------------
@@ -0,0 +1,103 @@
+# Tests for the batched Lorenz integrator and its trajectory files
+# (cst305/lorenz.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305 import lorenz
+from cst305.lorenz import (TimeAxis, loadTrajectory, lorenzBatch, makeBatch, runBatch, runToFile,
+                           streamBatch, trajectoryStats)
+# -----------------------------------------------------------------------
+
+
+R_VALUES = [0.5, 14.0, 28.0, 45.0]
+
+
+# -------------------------------- Batch --------------------------------
+def test_batch_derivatives_match_scalar():
+    states = np.array([[1.0, 2.0, 3.0], [-4.0, 0.5, 20.0]])
+    derivs = lorenzBatch(states, np.array([28.0, 10.0]))
+    for state, r, deriv in zip(states, (28.0, 10.0), derivs):
+        np.testing.assert_array_equal(deriv, lorenz.lorenz(*state, r))
+
+
+def test_make_batch_broadcasts():
+    r, s, b, initial = makeBatch([10.0, 28.0], s=[9.0, 10.0], initial=(1.0, 1.0, 1.0))
+    assert initial.shape == (2, 3) and b.shape == (2,)
+    with pytest.raises(ValueError):
+        makeBatch(28.0, initial=(1.0, 2.0))
+    with pytest.raises(ValueError):
+        makeBatch([1.0, 2.0, 3.0], initial=np.ones((2, 3)))
+
+
+@pytest.mark.parametrize("method", lorenz.METHODS)
+def test_batch_matches_single_runs(method):
+    # rk45 takes one step size for the whole batch, so its members only
+    # agree to the tolerance (amplified by the chaos over t = 2)
+    settings = {"rtol": 1e-10, "atol": 1e-12} if method == "rk45" else {}
+    _, batch, _ = runBatch(R_VALUES, dt=0.01, num_steps=200, method=method, **settings)
+    assert batch.shape == (201, len(R_VALUES), 3)
+    for column, r in enumerate(R_VALUES):
+        _, single, _ = runBatch([r], dt=0.01, num_steps=200, method=method, **settings)
+        np.testing.assert_allclose(batch[:, column], single[:, 0], atol=1e-6 if settings else 0)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        next(streamBatch(28.0, method="rk23"))
+# -----------------------------------------------------------------------
+
+
+# ------------------------------- Accuracy ------------------------------
+def test_rk45_matches_fine_rk4():
+    _, reference, _ = runBatch(R_VALUES, dt=0.0005, num_steps=2000, method="rk4")
+    stats = {}
+    chunks = list(streamBatch(R_VALUES, dt=0.01, num_steps=100, method="rk45", rtol=1e-10,
+                              atol=1e-12, stats=stats))
+    adaptive = np.concatenate([chunk for _, chunk in chunks])
+    np.testing.assert_allclose(adaptive, reference[::20], atol=1e-7)
+    assert stats["accepted"] > 0 and stats["rhs_evals"] >= 6 * stats["accepted"]
+
+
+def test_methods_converge_at_their_order():
+    # Halving dt cuts the error at t = 0.5 by 2 (euler) and 16 (rk4)
+    _, reference, _ = runBatch(28.0, dt=1e-4, num_steps=5000, method="rk4")
+    for method, order in (("euler", 1), ("rk4", 4)):
+        errors = [np.abs(runBatch(28.0, dt=dt, num_steps=round(0.5 / dt), method=method)[1][-1]
+                         - reference[-1]).max() for dt in (0.005, 0.0025)]
+        assert np.log2(errors[0] / errors[1]) == pytest.approx(order, abs=0.3)
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Trajectory Files -------------------------
+@pytest.mark.parametrize("method", lorenz.METHODS)
+def test_file_matches_memory(tmp_path, method):
+    path = tmp_path / "run.npy"
+    in_memory = runBatch(R_VALUES, dt=0.01, num_steps=1000, method=method)
+    stats = runToFile(path, R_VALUES, dt=0.01, num_steps=1000, method=method, chunk_size=77)
+    time, trajectories = loadTrajectory(path, 0.01)
+    assert isinstance(trajectories, np.memmap) and not trajectories.flags.writeable
+    np.testing.assert_array_equal(trajectories, in_memory[1])
+    np.testing.assert_allclose(np.asarray(time), in_memory[0])
+    assert stats == in_memory[2]
+
+
+def test_time_axis_indexing():
+    time = TimeAxis(11, 0.5)
+    assert len(time) == 11
+    np.testing.assert_allclose(time[2:6], [1.0, 1.5, 2.0, 2.5])
+    assert time[-1] == 5.0
+    np.testing.assert_allclose(time[np.array([0, 10])], [0.0, 5.0])
+    with pytest.raises(IndexError):
+        time[11]
+
+
+def test_trajectory_stats_in_chunks():
+    _, trajectories, _ = runBatch(R_VALUES, dt=0.01, num_steps=3000, method="rk4")
+    stats = trajectoryStats(trajectories, chunk_size=256)
+    np.testing.assert_allclose(stats["mean"], trajectories.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats["std"], trajectories.std(axis=0), rtol=1e-10)
+    np.testing.assert_array_equal(stats["min"], trajectories.min(axis=0))
+    np.testing.assert_array_equal(stats["max"], trajectories.max(axis=0))
+# -----------------------------------------------------------------------
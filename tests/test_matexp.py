@@ -0,0 +1,71 @@
+# Tests for the batched matrix exponential (cst305/matexp.py) against
+# scipy.linalg.expm
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+from scipy.linalg import expm
+
+from cst305.matexp import MatrixExponential, expmBatch, linearSolution
+# -----------------------------------------------------------------------
+
+
+TIMES = np.linspace(0, 2, 21)
+
+
+def _reference(A, t=TIMES):
+    return np.array([expm(A * time) for time in t])
+
+
+# Largest error relative to the size of each e^(At)
+def _relativeError(result, reference):
+    scale = np.maximum(1, np.abs(reference).max(axis=(-2, -1)))
+    return float((np.abs(result - reference).max(axis=(-2, -1)) / scale).max())
+
+
+MATRICES = {
+    "oscillator": np.array([[0.0, 1.0], [-4.0, 0.0]]),
+    "defective": np.array([[-1.0, 1.0], [0.0, -1.0]]),
+    "near-defective": np.array([[-1.0, 1.0], [1e-10, -1.0]]),
+    "random": np.random.default_rng(0).standard_normal((8, 8)) * 20 / np.sqrt(8),
+}
+
+
+# ------------------------------ Accuracy -------------------------------
+@pytest.mark.parametrize("name", MATRICES)
+def test_matches_scipy(name):
+    A = MATRICES[name]
+    assert _relativeError(MatrixExponential(A).matrices(TIMES), _reference(A)) < 1e-12
+
+
+@pytest.mark.parametrize("method", ["eig", "schur"])
+def test_both_paths_on_a_well_conditioned_matrix(method):
+    A = MATRICES["oscillator"]
+    assert _relativeError(MatrixExponential(A, method).matrices(TIMES), _reference(A)) < 1e-13
+
+
+def test_near_defective_takes_the_schur_path():
+    exponential = MatrixExponential(MATRICES["near-defective"])
+    assert exponential.method == "schur"
+    assert _relativeError(exponential.matrices(TIMES), _reference(MATRICES["near-defective"])) < 1e-14
+    assert MatrixExponential(MATRICES["oscillator"]).method == "eig"
+
+
+def test_expm_batch_large_norms():
+    A = np.random.default_rng(1).standard_normal((5, 4, 4)) * np.array([0.01, 1, 10, 50, 200])[:, None, None]
+    reference = np.array([expm(matrix) for matrix in A])
+    np.testing.assert_allclose(expmBatch(A), reference, rtol=1e-9, atol=1e-12 * np.abs(reference).max())
+
+
+def test_columns_and_vectors():
+    A = MATRICES["random"]
+    C = np.random.default_rng(2).standard_normal((8, 3))
+    reference = _reference(A) @ C
+    np.testing.assert_allclose(linearSolution(A, C, TIMES), reference, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(linearSolution(A, C[:, 0], TIMES), reference[:, :, 0], rtol=1e-9, atol=1e-9)
+
+
+def test_rejects_non_square():
+    with pytest.raises(ValueError):
+        MatrixExponential(np.ones((2, 3)))
+# -----------------------------------------------------------------------
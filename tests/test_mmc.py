@@ -0,0 +1,83 @@
+# Tests for the M/M/c formulas (cst305/mmc.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.mmc import RECURSION_LIMIT, clearCache, erlangB, erlangBRecursive, erlangC, mmcMetrics
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Erlang Formulas ---------------------------
+def test_erlang_b_known_values():
+    assert erlangB(1, 1.0) == pytest.approx(0.5)
+    assert erlangB(2, 1.0) == pytest.approx(0.2)
+    assert erlangC(2, 1.0) == pytest.approx(1 / 3)
+
+
+def test_recursion_and_log_space_agree():
+    c = np.arange(1, 40)
+    expected = [erlangBRecursive(n, 12.5) for n in c]
+    np.testing.assert_allclose(erlangB(c, 12.5), expected, rtol=1e-12)
+    # Too many values for the recursion: the log-space formula
+    tiled = np.tile(c, RECURSION_LIMIT // 39 + 1)
+    np.testing.assert_allclose(erlangB(tiled, 12.5)[:39], expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("c, a", [
+    (100000, 1e7),        # a >> c: P(Poisson(a) <= c) underflows
+    (2000, 1e5),
+    (100000, 1.3e5),
+    (150000, 1.4e5),      # a < c
+    (100000, 1.01e5),
+])
+def test_large_systems_match_recursion(c, a):
+    assert erlangB(float(c), a) == pytest.approx(erlangBRecursive(c, a), rel=1e-9)
+
+
+def test_non_integer_servers_stay_finite():
+    b = erlangB(2000.5, 1e5)
+    assert np.isfinite(b)
+    # Between the integer neighbours
+    assert erlangBRecursive(2001, 1e5) <= b <= erlangBRecursive(2000, 1e5)
+
+
+def test_zero_load():
+    np.testing.assert_array_equal(erlangB(np.array([0.0, 5.0]), 0.0), [1.0, 0.0])
+
+
+def test_unstable_systems_always_wait():
+    assert erlangC(100000, 1e7) == 1.0
+    assert erlangC(3, 3.0) == 1.0
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- M/M/c Metrics ----------------------------
+def test_mm1_closed_forms():
+    lam, mu = 2.0, 3.0
+    metrics = mmcMetrics(lam, mu, 1)
+    assert metrics["utilization"] == pytest.approx(lam / mu)
+    assert metrics["W_q"] == pytest.approx(lam / (mu * (mu - lam)))
+    assert metrics["T"] == pytest.approx(1 / (mu - lam))
+    assert metrics["N"] == pytest.approx(lam / (mu - lam))
+
+
+def test_littles_law_on_a_grid():
+    lam = np.linspace(0.5, 9.5, 10)[:, None]
+    c = np.arange(1, 13)[None, :]
+    metrics = mmcMetrics(lam, 1.0, c)
+    assert metrics["W_q"].shape == (10, 12)
+    stable = lam / c < 1
+    np.testing.assert_allclose(metrics["N_q"][stable], (lam * metrics["W_q"])[stable])
+    assert np.all(np.isinf(metrics["W_q"][~stable]))
+    np.testing.assert_allclose(metrics["throughput"], np.where(stable, lam, c * 1.0))
+
+
+def test_cached_results_are_read_only():
+    clearCache()
+    first = mmcMetrics([1.0, 2.0], 3.0, 2)
+    second = mmcMetrics([1.0, 2.0], 3.0, 2)
+    assert first["W_q"] is second["W_q"]
+    with pytest.raises(ValueError):
+        first["W_q"][0] = 0
+# -----------------------------------------------------------------------
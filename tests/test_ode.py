@@ -0,0 +1,87 @@
+# Tests for the shared ODE core (cst305/ode.py) and the checkpointed
+# Lorenz runs (cst305/lorenz.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305 import lorenz
+from cst305.ode import METHODS, solve, solveChunks
+# -----------------------------------------------------------------------
+
+
+# A stiff, forced two-variable system with a batch of two initial states
+def stiffForced(y, t):
+    return np.stack([-50 * (y[..., 0] - np.cos(t)), -y[..., 1] + np.sin(3 * t)], axis=-1)
+
+
+Y0 = np.array([[0.0, 1.0], [1.0, 0.0]])
+SETTINGS = {"rtol": 1e-4, "atol": 1e-6, "chunk_size": 32}   # Loose enough for a quick ROS2 run
+
+
+# Runs `num_steps` until the second chunk, keeps the rows before the
+# snapshot and returns (those rows, a copy of the snapshot)
+def _interruptedRun(method, num_steps):
+    snapshot = {}
+    rows = []
+    for chunk in solveChunks(stiffForced, Y0, 0.05, num_steps, method, snapshot=snapshot,
+                             **SETTINGS):
+        rows.append(chunk)
+        if len(rows) == 2:
+            break
+    saved = {key: np.copy(value) if isinstance(value, np.ndarray) else value
+             for key, value in snapshot.items()}
+    return np.concatenate(rows)[:saved["row"]], saved
+
+
+# ------------------------- Checkpoint / Resume -------------------------
+@pytest.mark.parametrize("method", METHODS)
+def test_resume_is_bit_identical(method):
+    stats = {}
+    full = np.concatenate(list(solveChunks(stiffForced, Y0, 0.05, 100, method, stats=stats,
+                                           **SETTINGS)))
+    before, saved = _interruptedRun(method, 100)
+    resumed_stats = {}
+    after = np.concatenate(list(solveChunks(stiffForced, Y0, 0.05, 100, method,
+                                            stats=resumed_stats, resume=saved, **SETTINGS)))
+    np.testing.assert_array_equal(np.concatenate([before, after]), full)
+    assert resumed_stats == stats
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_resume_extends_a_run(method):
+    full = np.concatenate(list(solveChunks(stiffForced, Y0, 0.05, 150, method, **SETTINGS)))
+    before, saved = _interruptedRun(method, 100)
+    after = np.concatenate(list(solveChunks(stiffForced, Y0, 0.05, 150, method, resume=saved,
+                                            **SETTINGS)))
+    np.testing.assert_array_equal(np.concatenate([before, after]), full)
+
+
+@pytest.mark.parametrize("method", lorenz.METHODS)
+def test_lorenz_file_resume(tmp_path, method):
+    single, resumed, checkpoint = tmp_path / "single.npy", tmp_path / "x.npy", tmp_path / "x.ck"
+    lorenz.runToFile(single, [28, 10], num_steps=400, method=method, chunk_size=64)
+    lorenz.runToFile(resumed, [28, 10], num_steps=200, method=method, chunk_size=64,
+                     checkpoint=checkpoint)
+    lorenz.resumeToFile(resumed, checkpoint, num_steps=400)
+    np.testing.assert_array_equal(np.load(resumed), np.load(single))
+
+
+def test_lorenz_rejects_rosenbrock(tmp_path):
+    with pytest.raises(ValueError):
+        lorenz.runToFile(tmp_path / "x.npy", 28, num_steps=10, method="rosenbrock",
+                         checkpoint=tmp_path / "x.ck")
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Accuracy -------------------------------
+def test_methods_agree_on_a_stiff_problem():
+    _, reference = solve(stiffForced, Y0, 0.05, 100, "rk45", rtol=1e-10, atol=1e-12)
+    _, rosenbrock = solve(stiffForced, Y0, 0.05, 100, "rosenbrock", rtol=1e-5, atol=1e-7)
+    np.testing.assert_allclose(rosenbrock, reference, atol=1e-4)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        list(solveChunks(stiffForced, Y0, 0.05, 10, "bdf"))
+# -----------------------------------------------------------------------
@@ -0,0 +1,86 @@
+# Tests for the queue simulator (cst305/queueing.py) against the M/M/c
+# formulas (cst305/mmc.py), and the streaming statistics
+# (cst305/queuestats.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.mmc import mmcMetrics
+from cst305.queueing import generateCustomers, queueMetrics, seenAtArrival, simulateQueue
+from cst305.queuestats import QueueStatistics, queueEvents
+# -----------------------------------------------------------------------
+
+
+# Statistics of a whole simulateQueue result fed through queueEvents
+def _streamed(result, chunk_size=777):
+    statistics = QueueStatistics(servers=result.get("servers", 1))
+    for times, kinds in queueEvents(result, chunk_size):
+        statistics.update(times, kinds)
+    return statistics.summary()
+
+
+# Customers arriving two at a time on an integer grid with 0, 1 or 2 units
+# of service, so arrivals, starts and departures often coincide
+def _tiedCustomers(seed):
+    arrival = np.repeat(np.arange(0, 500, 1.0), 2)
+    service = np.random.default_rng(seed).integers(0, 3, len(arrival)).astype(float)
+    return arrival, service
+
+
+# ------------------------ Simulation vs Theory -------------------------
+# Long M/M/c runs against the closed forms: Lindley's recursion for one
+# server, the multi-server path for c > 1
+@pytest.mark.parametrize("servers, service_rate", [(1, 3.0), (2, 1.5), (3, 1.0)])
+def test_simulation_matches_mmc(servers, service_rate):
+    arrivals, services = generateCustomers(400000, 2.4, service_rate, seed=servers)
+    metrics = queueMetrics(simulateQueue(arrivals, services, servers=servers), warmup=10000)
+    theory = mmcMetrics(2.4, service_rate, servers)
+    assert metrics["W_q"] == pytest.approx(float(theory["W_q"]), rel=0.05)
+    assert metrics["L_q"] == pytest.approx(float(theory["N_q"]), rel=0.05)
+    assert metrics["utilization"] == pytest.approx(float(theory["utilization"]), rel=0.01)
+
+
+def test_single_server_is_lindley():
+    arrivals, services = generateCustomers(2000, 1.0, 1.2, seed=5)
+    exit_time = np.empty(len(arrivals))
+    previous = 0.0
+    for i, (arrival, service) in enumerate(zip(arrivals, services)):
+        previous = exit_time[i] = max(arrival, previous) + service
+    np.testing.assert_allclose(simulateQueue(arrivals, services)["exit"], exit_time, rtol=1e-12)
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Simultaneous Events -------------------------
+def test_zero_service_customers_stream():
+    summary = _streamed(simulateQueue([1, 2, 3], [0.5, 0, 0.5]))
+    assert summary["customers"] == 3
+    assert summary["L_arrivals"] == 0
+    assert summary["W_q"] == 0
+
+
+@pytest.mark.parametrize("servers", [1, 2, 3])
+def test_seen_at_arrival_counts_customers_ahead(servers):
+    result = simulateQueue(*_tiedCustomers(servers), servers=servers)
+    arrival = result["arrival"]
+    in_system, in_queue = seenAtArrival(result)
+    np.testing.assert_array_equal(in_system, [(result["exit"][:i] > t).sum() for i, t in enumerate(arrival)])
+    np.testing.assert_array_equal(in_queue, [(result["start"][:i] > t).sum() for i, t in enumerate(arrival)])
+
+
+@pytest.mark.parametrize("servers", [1, 2, 3])
+def test_streaming_matches_queue_metrics(servers):
+    for arrivals, services in (_tiedCustomers(servers), generateCustomers(20000, 2.0, 1.1, seed=servers)):
+        result = simulateQueue(arrivals, services, servers=servers)
+        metrics, summary = queueMetrics(result), _streamed(result)
+        for name in ("L_q", "L", "L_q_arrivals", "L_arrivals", "W_q", "utilization", "throughput"):
+            assert summary[name] == pytest.approx(metrics[name], rel=1e-9), name
+
+
+def test_wait_quantiles_within_accuracy():
+    arrivals, services = generateCustomers(50000, 0.9, 1.0, seed=3)
+    result = simulateQueue(arrivals, services)
+    summary = _streamed(result, chunk_size=4096)
+    for p, estimate in summary["W_q_quantiles"].items():
+        assert estimate == pytest.approx(np.quantile(result["wait"], p, method="lower"), rel=0.02)
+# -----------------------------------------------------------------------
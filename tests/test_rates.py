@@ -0,0 +1,108 @@
+# Tests for the streaming rate integrator (cst305/rates.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.rates import StreamIntegrator, integrateFile, writeBinarySamples
+# -----------------------------------------------------------------------
+
+
+# Piecewise-linear rate with uneven sample spacing
+def samples(count=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    times = np.cumsum(rng.uniform(0.01, 0.2, count))
+    rates = np.sin(times) + 2
+    return times, rates
+
+
+# Exact integral of the linear interpolant over [t1, t2], by refining the grid
+def referenceBetween(times, rates, t1, t2):
+    grid = np.union1d(times[(times > t1) & (times < t2)], [t1, t2])
+    return np.trapezoid(np.interp(grid, times, rates), grid)
+
+
+# ------------------------------- Totals --------------------------------
+def test_total_matches_trapezoid():
+    times, rates = samples()
+    integrator = StreamIntegrator(index=False).update(times, rates)
+    assert integrator.total() == pytest.approx(np.trapezoid(rates, times), rel=1e-14)
+    assert integrator.count == len(times)
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 333])
+def test_chunks_join_through_last_sample(chunk):
+    times, rates = samples()
+    whole = StreamIntegrator().update(times, rates)
+    chunked = StreamIntegrator()
+    for start in range(0, len(times), chunk):
+        chunked.update(times[start:start + chunk], rates[start:start + chunk])
+    assert chunked.total() == pytest.approx(whole.total(), rel=1e-14)
+    assert chunked.count == whole.count
+    np.testing.assert_allclose(chunked.cumulative.view(), whole.cumulative.view(), rtol=1e-13)
+
+
+@pytest.mark.parametrize("times, rates", [
+    ([0.0, 1.0, 1.0], [1.0, 1.0, 1.0]), ([0.0, 1.0], [1.0])])
+def test_bad_samples_raise(times, rates):
+    with pytest.raises(ValueError):
+        StreamIntegrator().update(times, rates)
+
+
+def test_times_must_increase_across_chunks():
+    integrator = StreamIntegrator().update([0.0, 1.0], [1.0, 1.0])
+    with pytest.raises(ValueError):
+        integrator.update([1.0, 2.0], [1.0, 1.0])
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Window Queries ---------------------------
+def test_between_matches_reference():
+    times, rates = samples()
+    integrator = StreamIntegrator().update(times, rates)
+    rng = np.random.default_rng(1)
+    t1 = rng.uniform(times[0], times[-1], 2000)
+    t2 = rng.uniform(t1, times[-1])
+    expected = [referenceBetween(times, rates, a, b) for a, b in zip(t1, t2)]
+    np.testing.assert_allclose(integrator.between(t1, t2), expected, rtol=1e-10, atol=1e-12)
+    assert integrator.between(times[0], times[-1]) == pytest.approx(integrator.total(), rel=1e-14)
+
+
+def test_outside_range_is_zero_or_extrapolated():
+    integrator = StreamIntegrator().update([0.0, 1.0, 2.0], [1.0, 2.0, 3.0])
+    assert integrator.between(-5.0, 0.0) == 0.0
+    assert integrator.between(2.0, 9.0) == 0.0
+    # rate = 1 + t continued linearly: integral over [2, 3] is 3.5
+    assert integrator.between(2.0, 3.0, extrapolate=True) == pytest.approx(3.5)
+    assert integrator.between(-1.0, 0.0, extrapolate=True) == pytest.approx(0.5)
+
+
+def test_queries_need_index():
+    integrator = StreamIntegrator(index=False).update([0.0, 1.0], [1.0, 1.0])
+    with pytest.raises(ValueError):
+        integrator.between(0.0, 1.0)
+    with pytest.raises(ValueError):
+        StreamIntegrator().update([0.0], [1.0]).between(0.0, 1.0)
+# -----------------------------------------------------------------------
+
+
+# -------------------------------- Files --------------------------------
+def test_csv_and_binary_files_agree(tmp_path):
+    times, rates = samples()
+    csv_path = tmp_path / "rates.csv"
+    np.savetxt(csv_path, np.column_stack([times, rates]), delimiter=",", header="t,rate", comments="")
+    binary_path = tmp_path / "rates.bin"
+    writeBinarySamples(binary_path, times[:400], rates[:400], append=False)
+    writeBinarySamples(binary_path, times[400:], rates[400:])
+
+    from_csv = integrateFile(csv_path, "csv", chunk_size=97, skiprows=1)
+    from_binary = integrateFile(binary_path, "binary", chunk_size=97)
+    assert from_csv.total() == pytest.approx(np.trapezoid(rates, times), rel=1e-12)
+    assert from_binary.total() == pytest.approx(np.trapezoid(rates, times), rel=1e-14)
+    assert from_binary.count == from_csv.count == len(times)
+
+
+def test_unknown_format_raises(tmp_path):
+    with pytest.raises(ValueError):
+        integrateFile(tmp_path / "missing", "parquet")
+# -----------------------------------------------------------------------
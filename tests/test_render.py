@@ -0,0 +1,98 @@
+# Tests for headless rendering and single-collection drawing (cst305/render.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+import pytest
+
+from cst305 import render
+from cst305.riemann import riemannSum
+# -----------------------------------------------------------------------
+
+
+@pytest.fixture
+def plt():
+    render.useHeadless()
+    import matplotlib.pyplot as plt
+
+    yield plt
+    plt.close("all")
+
+
+@pytest.fixture
+def saveTo(tmp_path):
+    saved = dict(render._settings)
+    render.configureOutput(str(tmp_path / "figures"), "svg")
+    yield tmp_path / "figures"
+    render._settings.update(saved)
+
+
+# Module-level so renderParallel workers can call it
+def lineFigure(slope):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, slope])
+    return fig
+
+
+# ------------------------------- Output --------------------------------
+def test_show_or_save_writes_every_open_figure(plt, saveTo):
+    plt.figure()
+    plt.figure()
+    paths = render.showOrSave("demo")
+    assert [os.path.basename(path) for path in paths] == ["demo.svg", "demo_2.svg"]
+    assert all(os.path.getsize(path) for path in paths)
+    assert plt.get_fignums() == []
+
+
+def test_render_parallel(tmp_path):
+    paths = [str(tmp_path / "out" / f"line{slope}.png") for slope in (1, 2, 3)]
+    assert render.renderParallel([(lineFigure, (slope,), path) for slope, path in zip((1, 2, 3), paths)],
+                                 processes=2) == paths
+    assert all(os.path.getsize(path) for path in paths)
+# -----------------------------------------------------------------------
+
+
+# ------------------------- Riemann Rectangles --------------------------
+@pytest.mark.parametrize("rule", ["left", "mid", "right"])
+def test_rectangles_are_one_collection(plt, rule):
+    fig, ax = plt.subplots()
+    collection = render.drawRiemannRectangles(ax, np.square, 0, 2, 40, rule)
+    assert list(ax.collections) == [collection]
+    paths = collection.get_paths()
+    assert len(paths) == 40
+    # Rectangle areas add up to the Riemann sum
+    area = sum(np.ptp(path.vertices[:, 0]) * np.ptp(path.vertices[:, 1]) for path in paths)
+    assert area == pytest.approx(riemannSum(np.square, 0, 2, 40, rule, with_error=False)[0])
+
+
+def test_many_rectangles_fill_the_envelope(plt):
+    fig, ax = plt.subplots()
+    collection = render.drawRiemannRectangles(ax, np.sin, 0, 10, 10**6, target=1000, chunk_size=4096)
+    assert list(ax.collections) == [collection]
+    vertices = collection.get_paths()[0].vertices
+    assert len(vertices) < 4000
+    assert vertices[:, 1].max() == pytest.approx(1, abs=1e-9)
+
+
+def test_unknown_rectangle_rule(plt):
+    fig, ax = plt.subplots()
+    with pytest.raises(ValueError):
+        render.drawRiemannRectangles(ax, np.sin, 0, 1, 10, "trapezoid")
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Decimated Plots --------------------------
+def test_plot_decimated_2d_and_3d(plt):
+    t = np.linspace(0, 100, 10**5)
+    fig, ax = plt.subplots()
+    (line,) = render.plotDecimated(ax, t, np.sin(t), target=500)
+    assert len(line.get_xdata()) <= 500
+    assert max(line.get_ydata()) == np.sin(t).max()
+
+    ax3 = fig.add_subplot(projection='3d')
+    (line3,) = render.plotDecimated(ax3, np.sin(t), np.cos(t), t, target=600)
+    assert len(line3.get_data_3d()[2]) <= 600
+# -----------------------------------------------------------------------
@@ -0,0 +1,69 @@
+# Tests for independent queue replications (cst305/replications.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import numpy as np
+import pytest
+
+from cst305.replications import confidenceInterval, formatReplications, replicateQueue
+# -----------------------------------------------------------------------
+
+
+SMALL = {"customers": 3000, "warmup": 300, "seed": 305}
+
+
+# ------------------------ Confidence Intervals -------------------------
+def test_student_t_interval():
+    interval = confidenceInterval([1.0, 2.0, 3.0, 4.0, 5.0])
+    # t(0.975, 4) = 2.7764, s = sqrt(2.5)
+    assert interval["mean"] == 3.0
+    assert interval["half_width"] == pytest.approx(2.7764451 * np.sqrt(2.5) / np.sqrt(5))
+    assert interval["low"] == pytest.approx(3.0 - interval["half_width"])
+    samples = [1.0, 2.0, 3.0]
+    assert confidenceInterval(samples, 0.99)["half_width"] > confidenceInterval(samples)["half_width"]
+    assert confidenceInterval([4.0])["half_width"] == np.inf
+# -----------------------------------------------------------------------
+
+
+# --------------------------- Replicated Run ----------------------------
+def test_results_do_not_depend_on_processes():
+    serial = replicateQueue(1.0, 1.5, precision=None, max_replications=6, processes=1, **SMALL)
+    pooled = replicateQueue(1.0, 1.5, precision=None, max_replications=6, processes=3, **SMALL)
+    assert serial["replications"] == pooled["replications"] == 6
+    assert not serial["converged"]
+    for name, values in serial["samples"].items():
+        np.testing.assert_array_equal(pooled["samples"][name], values)
+
+
+def test_intervals_cover_mm1_theory():
+    # M/M/1 with rho = 0.5: L_q = W_q = rho^2 / (1 - rho) / lambda = 0.5
+    result = replicateQueue(1.0, 2.0, customers=20000, warmup=1000, seed=7, precision=0.05,
+                            processes=1)
+    assert result["converged"]
+    assert result["replications"] < 200
+    for name, expected in (("L_q", 0.5), ("W_q", 0.5), ("utilization", 0.5), ("throughput", 1.0)):
+        interval = result["metrics"][name]
+        assert interval["half_width"] <= 0.05 * interval["mean"]
+        assert abs(interval["mean"] - expected) <= 2 * interval["half_width"]
+
+
+def test_multiple_servers():
+    result = replicateQueue(2.0, 1.5, servers=2, precision=None, max_replications=4, processes=1,
+                            **SMALL)
+    assert result["metrics"]["utilization"]["mean"] == pytest.approx(2 / 3, abs=0.05)
+
+
+@pytest.mark.parametrize("settings", [{"customers": 100, "warmup": 100}, {"max_replications": 1}])
+def test_bad_settings(settings):
+    with pytest.raises(ValueError):
+        replicateQueue(1.0, 2.0, **settings)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------- Summary -------------------------------
+def test_format_replications():
+    result = replicateQueue(1.0, 1.5, precision=None, max_replications=3, processes=1, **SMALL)
+    lines = formatReplications(result).splitlines()
+    assert lines[0] == "3 replications (not converged)"
+    assert [line.split(":")[0].strip() for line in lines[1:]] == ["L_q", "W_q", "utilization",
+                                                                    "throughput"]
+# -----------------------------------------------------------------------
@@ -0,0 +1,68 @@
+# Tests for the numeric Riemann sums (cst305/riemann.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import math
+
+import numpy as np
+import pytest
+
+from cst305.riemann import RULES, CompensatedSum, convergenceTable, referenceIntegral, riemannSum
+# -----------------------------------------------------------------------
+
+
+# ----------------------------- Exact Values ----------------------------
+def test_known_sums_of_x_squared():
+    # Integral of x^2 over [0, 3] is 9; with n = 3 the sums are exact sums
+    # of squares: left 0 + 1 + 4, right 1 + 4 + 9, mid 1/4 + 9/4 + 25/4
+    square = np.square
+    assert riemannSum(square, 0, 3, 3, "left", reference=9)[0] == pytest.approx(5)
+    assert riemannSum(square, 0, 3, 3, "right", reference=9)[0] == pytest.approx(14)
+    assert riemannSum(square, 0, 3, 3, "mid", reference=9)[0] == pytest.approx(8.75)
+    assert riemannSum(square, 0, 3, 3, "trapezoid", reference=9)[0] == pytest.approx(9.5)
+    # Simpson is exact for cubics
+    assert riemannSum(lambda x: x**3, 0, 2, 2, "simpson", reference=4)[1] == pytest.approx(0, abs=1e-15)
+
+
+@pytest.mark.parametrize("rule, order", [("left", 1), ("right", 1), ("mid", 2), ("trapezoid", 2),
+                                         ("simpson", 4)])
+def test_convergence_order(rule, order):
+    table = convergenceTable(np.exp, 0, 1, [16, 32], rules=(rule,), reference=math.e - 1)
+    assert np.log2(abs(table[rule][0] / table[rule][1])) == pytest.approx(order, abs=0.1)
+
+
+def test_reference_integral():
+    assert referenceIntegral(np.sin, 0, np.pi) == pytest.approx(2, rel=1e-13)
+    value, error = riemannSum(np.sin, 0, np.pi, 1000, "mid")
+    assert error == pytest.approx(value - 2, abs=1e-13)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------- Chunking ------------------------------
+@pytest.mark.parametrize("rule", RULES)
+def test_chunks_do_not_change_the_sum(rule):
+    whole = riemannSum(np.cos, -1, 2, 10000, rule, with_error=False)[0]
+    chunked = riemannSum(np.cos, -1, 2, 10000, rule, with_error=False, chunk_size=777)[0]
+    assert chunked == pytest.approx(whole, rel=1e-14)
+
+
+def test_compensated_sum_keeps_small_terms():
+    total = CompensatedSum()
+    for value in [1e16, 1.0, -1e16] * 1000:
+        total.add(value)
+    assert total.value() == 1000.0
+# -----------------------------------------------------------------------
+
+
+# -------------------------------- Errors -------------------------------
+def test_bad_rules():
+    with pytest.raises(ValueError):
+        riemannSum(np.sin, 0, 1, 5, "simpson")
+    with pytest.raises(ValueError):
+        riemannSum(np.sin, 0, 1, 4, "upper")
+
+
+def test_convergence_table_skips_odd_simpson():
+    table = convergenceTable(np.exp, 0, 1, [3, 4], rules=("simpson", "left"), reference=math.e - 1)
+    assert np.isnan(table["simpson"][0]) and not np.isnan(table["simpson"][1])
+    assert not np.any(np.isnan(table["left"]))
+# -----------------------------------------------------------------------
@@ -0,0 +1,126 @@
+# Tests for the RK4 engines (cst305/rk4.py, cst305/runge.py) and their
+# checkpoint / history files (cst305/checkpoint.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import os
+
+import numpy as np
+import pytest
+
+from cst305.checkpoint import appendHistory, historyPath
+from cst305.rk4 import diffEq, exactSolution, resumeRungeKutta, rungeKuttaBatch
+from cst305.runge import Runge
+# -----------------------------------------------------------------------
+
+
+Y0 = np.array([1.0, 0.0, -2.0])
+
+
+class Crash(Exception):
+    pass
+
+
+# diffEq that raises on its n-th call, to kill a run part way through
+def crashingAfter(calls):
+    count = [0]
+
+    def f(y, x):
+        count[0] += 1
+        if count[0] > calls:
+            raise Crash
+        return diffEq(y, x)
+    return f
+
+
+# ------------------------------- Accuracy ------------------------------
+def test_batch_matches_scalar_loop():
+    x_values, y_values = [1.0], [0.5]
+    Runge.runCode(x_values, y_values, 0.01, 200)
+    batch_x, batch_y = rungeKuttaBatch(1.0, 0.5, 0.01, 200)
+    np.testing.assert_array_equal(batch_x, x_values)
+    np.testing.assert_array_equal(batch_y[:, 0], y_values)
+
+
+def test_batch_matches_exact_solution():
+    x_values, y_values = rungeKuttaBatch(1.0, Y0, 0.01, 300, record_every=10)
+    assert y_values.shape == (31, 3)
+    for column, y0 in enumerate(Y0):
+        np.testing.assert_allclose(y_values[:, column], exactSolution(x_values, 1.0, y0), atol=1e-9)
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Batch Resume -----------------------------
+@pytest.mark.parametrize("record_every", [1, 7, None])
+def test_batch_resume_after_crash(tmp_path, record_every):
+    checkpoint = tmp_path / "rk4.ck"
+    expected = rungeKuttaBatch(1.0, Y0, 0.01, 500, record_every=record_every)
+    with pytest.raises(Crash):
+        rungeKuttaBatch(1.0, Y0, 0.01, 500, crashingAfter(4 * 330), record_every,
+                        checkpoint, checkpoint_every=100)
+    resumed = resumeRungeKutta(checkpoint, checkpoint_every=100)
+    np.testing.assert_array_equal(resumed[0], expected[0])
+    np.testing.assert_array_equal(resumed[1], expected[1])
+
+
+def test_batch_extend_and_rows_after_the_checkpoint(tmp_path):
+    checkpoint = tmp_path / "rk4.ck"
+    expected = rungeKuttaBatch(1.0, Y0, 0.01, 400, record_every=4)
+    rungeKuttaBatch(1.0, Y0, 0.01, 200, record_every=4, checkpoint=checkpoint)
+    # Rows from a run killed between the history append and the save
+    appendHistory(checkpoint, np.full((3, 4), np.nan))
+    resumed = resumeRungeKutta(checkpoint, runs=400)
+    np.testing.assert_array_equal(resumed[1], expected[1])
+    assert os.path.getsize(historyPath(checkpoint)) == 101 * 4 * 8
+
+
+def test_batch_checkpoint_size_is_fixed(tmp_path):
+    short, long = tmp_path / "short.ck", tmp_path / "long.ck"
+    rungeKuttaBatch(1.0, Y0, 0.01, 100, checkpoint=short, checkpoint_every=10)
+    rungeKuttaBatch(1.0, Y0, 0.01, 2000, checkpoint=long, checkpoint_every=10)
+    assert os.path.getsize(long) == os.path.getsize(short)
+
+
+def test_batch_resume_rejects_fewer_runs(tmp_path):
+    checkpoint = tmp_path / "rk4.ck"
+    rungeKuttaBatch(1.0, Y0, 0.01, 100, checkpoint=checkpoint)
+    for runs in (50, -1):
+        with pytest.raises(ValueError):
+            resumeRungeKutta(checkpoint, runs=runs)
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Runge Resume -----------------------------
+def test_runge_resume_after_crash(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "runge.ck"
+    x_values, y_values = [1.0], [0.5]
+    Runge.runCode(x_values, y_values, 0.01, 450)
+
+    monkeypatch.setattr(Runge, "diffEq", crashingAfter(4 * 300))
+    with pytest.raises(Crash):
+        Runge.runCode([1.0], [0.5], 0.01, 450, checkpoint, checkpoint_every=64)
+    monkeypatch.undo()
+
+    assert Runge.resume(checkpoint) == (x_values, y_values)
+    assert os.path.getsize(historyPath(checkpoint)) == 451 * 2 * 8
+
+
+def test_runge_extend_and_checkpoint_size(tmp_path):
+    checkpoint = tmp_path / "runge.ck"
+    x_values, y_values = [1.0], [0.5]
+    Runge.runCode(x_values, y_values, 0.01, 300)
+
+    Runge.runCode([1.0], [0.5], 0.01, 100, checkpoint)
+    size = os.path.getsize(checkpoint)
+    assert Runge.resume(checkpoint, runs=300) == (x_values, y_values)
+    assert os.path.getsize(checkpoint) == size
+
+
+def test_runge_rejects_negative_runs(tmp_path):
+    checkpoint = tmp_path / "runge.ck"
+    Runge.runCode([1.0], [0.5], 0.01, 100, checkpoint)
+    for runs in (50, -1):
+        with pytest.raises(ValueError):
+            Runge.resume(checkpoint, runs=runs)
+    with pytest.raises(ValueError):
+        Runge.runCode([1.0], [0.5], 0.01, -5)
+# -----------------------------------------------------------------------
@@ -0,0 +1,77 @@
+# Tests for the series coefficient engine (cst305/series.py)
+
+# ---------------------- Import Required Libraries ----------------------
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from cst305.series import ExactSeries, evaluateSeries, seriesCoefficients
+# -----------------------------------------------------------------------
+
+
+# The original part 2 recurrence, one Fraction at a time
+def _recurrence(n, a0=1, a1=1):
+    a = [Fraction(a0), Fraction(a1)]
+    for i in range(2, n + 2):
+        a.append(-((i - 2) * (i - 3) + 1) * Fraction(1, 4 * i * (i - 1)) * a[i - 2])
+    return a
+
+
+# ---------------------------- Exact Values -----------------------------
+def test_first_coefficients():
+    assert list(seriesCoefficients(4, mode="exact")) == [
+        1, 1, Fraction(-1, 8), Fraction(-1, 24), Fraction(1, 128), Fraction(7, 1920)]
+
+
+@pytest.mark.parametrize("a0, a1", [(1, 1), (Fraction(3, 7), -2), (0, 5)])
+def test_iteration_matches_recurrence(a0, a1):
+    assert list(ExactSeries(200, a0, a1)) == _recurrence(200, a0, a1)
+
+
+def test_indexing_in_any_order():
+    reference = _recurrence(300, Fraction(3, 7), -2)
+    series = ExactSeries(300, Fraction(3, 7), -2)
+    order = np.random.default_rng(0).permutation(len(series))
+    assert all(series[int(k)] == reference[k] for k in order)
+    assert [series[k] for k in range(len(series))] == reference
+    assert series[-1] == reference[-1]
+    with pytest.raises(IndexError):
+        series[len(series)]
+
+
+def test_raw_terms_are_unreduced_values():
+    reference = _recurrence(100)
+    assert [Fraction(num, den) for num, den in ExactSeries(100).rawTerms()] == reference
+
+
+def test_first_offset():
+    series = ExactSeries(50, first=2)
+    assert len(series) == 50
+    assert series[0] == Fraction(-1, 8)
+    assert list(series) == _recurrence(50)[2:]
+
+
+@pytest.mark.parametrize("index", [
+    slice(1, None), slice(None, 3), slice(2, 40, 3), slice(-5, None), slice(None, None, -1),
+    slice(30, 4, -7), slice(100, 200), slice(None)])
+def test_slicing_matches_list(index):
+    reference = _recurrence(50)[2:]
+    assert ExactSeries(50, first=2)[index] == reference[index]
+# -----------------------------------------------------------------------
+
+
+# ---------------------------- Other Modes ------------------------------
+def test_float_and_log_modes_match_exact():
+    exact = np.array([float(value) for value in ExactSeries(60, 2, -1)])
+    np.testing.assert_allclose(seriesCoefficients(60, "float", 2, -1), exact, rtol=1e-12)
+    signs, logs = seriesCoefficients(60, "log", 2, -1)
+    np.testing.assert_allclose(signs * np.exp(logs), exact, rtol=1e-12)
+
+
+def test_evaluate_series_matches_direct_sum():
+    x = np.linspace(-2, 2, 9)
+    coefficients = seriesCoefficients(40)
+    direct = sum(a * x ** i for i, a in enumerate(coefficients))
+    np.testing.assert_allclose(evaluateSeries(x, 40), direct, rtol=1e-12, atol=1e-15)
+# -----------------------------------------------------------------------
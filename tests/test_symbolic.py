@@ -0,0 +1,64 @@
+# Tests for the symbolic Riemann cache (cst305/symbolic.py): srepr text read
+# back from disk is parsed, never evaluated
+
+# ---------------------- Import Required Libraries ----------------------
+import json
+
+import pytest
+import sympy as sp
+
+from cst305.symbolic import SymbolicCache, canonicalKey, n, parseSrepr, symbolicRiemann
+# -----------------------------------------------------------------------
+
+
+x = sp.Symbol('x')
+
+
+# ---------------------------- Parse srepr ------------------------------
+@pytest.mark.parametrize("expression", [
+    sp.Integer(-3), sp.Rational(-1, 2), sp.Float("0.1"), sp.pi * x**2 + sp.E,
+    sp.oo, -sp.oo, sp.zoo, sp.sqrt(2) * sp.I, sp.log(x) * sp.sin(x) + sp.exp(-x),
+    sp.Sum(sp.Symbol('k', integer=True) ** 2, (sp.Symbol('k', integer=True), 1, n)),
+    sp.Piecewise((x, x > 0), (0, True)), sp.Function('f')(x) + 1, sp.Tuple(1, x),
+    sp.Eq(x, 1), sp.true, sp.Symbol('y', positive=True)])
+def test_round_trip(expression):
+    assert parseSrepr(sp.srepr(expression)) == expression
+
+
+@pytest.mark.parametrize("text", [
+    "__import__('os').system('true')", "open('cache.json')", "Integer(1).__class__",
+    "sympify('1')", "Add(*[Integer(1)])", "Symbol(**{'name': 'x'})", "(lambda: 1)()"])
+def test_rejects_code(text):
+    with pytest.raises(ValueError):
+        parseSrepr(text)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Disk Cache -----------------------------
+def test_cache_hit(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    first = symbolicRiemann(x**2, x, 0, 1, cache=cache)
+    key = canonicalKey("riemann", x**2, x, 0, 1)
+    assert cache.get(key) == {"sum": first[0], "limit": first[1]}
+    assert symbolicRiemann(x**2, x, 0, 1, cache=cache) == first
+    assert first[1] == sp.Rational(1, 3)
+
+
+def test_planted_entry_is_a_miss(tmp_path):
+    cache = SymbolicCache(str(tmp_path))
+    marker = tmp_path / "pwned"
+    key = canonicalKey("riemann", x, x, 0, 1)
+    with open(tmp_path / (key + ".json"), "w") as file:
+        json.dump({"sum": f"__import__('pathlib').Path({str(marker)!r}).touch()"}, file)
+
+    assert cache.get(key) is None
+    assert not marker.exists()
+    assert symbolicRiemann(x, x, 0, 1, cache=cache)[1] == sp.Rational(1, 2)
+
+
+@pytest.mark.parametrize("content", ["not json", "[1, 2]", '{"sum": 3}'])
+def test_corrupt_entry_is_a_miss(tmp_path, content):
+    cache = SymbolicCache(str(tmp_path))
+    (tmp_path / "entry.json").write_text(content)
+    assert cache.get("entry") is None
+# -----------------------------------------------------------------------
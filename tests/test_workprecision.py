@@ -0,0 +1,92 @@
+# Tests for the work-precision benchmark (cst305/workprecision.py)
+
+# ---------------------- Import Required Libraries ----------------------
+import json
+
+import numpy as np
+import pytest
+
+from cst305 import workprecision
+from cst305.workprecision import PROBLEMS, cheapest, referenceSolution, runMethod, runWorkPrecision
+# -----------------------------------------------------------------------
+
+
+# Synthetic result row for cheapest()
+def row(problem, method, error, median, diverged=False):
+    return {"problem": problem, "method": method, "error": error, "median_s": median,
+            "diverged": diverged}
+
+
+# ------------------------------ Single Run -----------------------------
+@pytest.mark.parametrize("name", sorted(PROBLEMS))
+def test_problem_references(name):
+    problem = PROBLEMS[name]()
+    reference = referenceSolution(problem)
+    assert reference.shape == (workprecision.OUTPUTS + 1, len(problem["y0"]))
+    np.testing.assert_allclose(reference[0], problem["y0"], atol=1e-12)
+
+
+@pytest.mark.parametrize("method, order", [("euler", 1), ("rk4", 4)])
+def test_fixed_step_convergence_order(method, order):
+    problem = PROBLEMS["greens"]()
+    reference = referenceSolution(problem)
+    coarse = np.max(np.abs(runMethod(problem, method, 400)[0] - reference))
+    fine = np.max(np.abs(runMethod(problem, method, 800)[0] - reference))
+    assert np.log2(coarse / fine) == pytest.approx(order, abs=0.3)
+
+
+@pytest.mark.parametrize("method", workprecision.ADAPTIVE_METHODS)
+def test_tolerance_controls_error(method):
+    problem = PROBLEMS["cooling"]()
+    reference = referenceSolution(problem)
+    loose, loose_evals = runMethod(problem, method, 1e-4)
+    tight, tight_evals = runMethod(problem, method, 1e-9)
+    assert np.max(np.abs(tight - reference)) < np.max(np.abs(loose - reference))
+    assert np.max(np.abs(tight - reference)) < 1e-6
+    assert tight_evals > loose_evals
+
+
+def test_steps_must_fit_the_outputs():
+    with pytest.raises(ValueError):
+        runMethod(PROBLEMS["log-forced"](), "rk4", 105)
+# -----------------------------------------------------------------------
+
+
+# ------------------------------ Selection ------------------------------
+def test_cheapest_picks_fastest_accurate_run():
+    results = [row("a", "euler", 1e-3, 0.001), row("a", "rk4", 1e-8, 0.004),
+               row("a", "rk45", 1e-7, 0.002), row("a", "odeint", 1e-9, 0.0005, diverged=True),
+               row("b", "euler", 1e-2, 0.001), row("b", "rk4", None, 0.0001, diverged=True)]
+    best = cheapest(results, 1e-6)
+    assert best["a"]["method"] == "rk45"
+    assert best["b"] is None
+    assert cheapest(results, 1e-2)["b"]["method"] == "euler"
+
+
+def test_run_work_precision_rows():
+    results = runWorkPrecision(("log-forced",), ("euler", "odeint"), steps=(10, 1000),
+                               tolerances=(1e-4, 1e-8), repeats=1, warmup=0)
+    assert [(res["method"], res["parameter"], res["value"]) for res in results] == [
+        ("euler", "steps", 10), ("euler", "steps", 1000), ("odeint", "tol", 1e-4), ("odeint", "tol", 1e-8)]
+    assert results[0]["h"] == pytest.approx(1.0) and results[2]["h"] is None
+    assert results[1]["error"] < results[0]["error"]
+    assert not any(res["diverged"] for res in results)
+
+
+def test_diverged_runs_are_flagged():
+    # Explicit Euler on Lorenz with 50 steps over [0, 2] blows up
+    results = runWorkPrecision(("lorenz",), ("euler",), steps=(50,), repeats=1, warmup=0)
+    assert results[0]["diverged"]
+
+
+def test_main_writes_cheapest(tmp_path, capsys):
+    out = tmp_path / "wp.json"
+    workprecision.main(["--problems", "cooling", "--methods", "rk4", "odeint", "--steps", "100", "1000",
+                        "--tol", "1e-6", "--repeats", "1", "--warmup", "0", "--target", "1e-5",
+                        "--out", str(out)])
+    saved = json.loads(out.read_text())
+    assert saved["target"] == 1e-5
+    assert saved["cheapest"]["cooling"]["error"] <= 1e-5
+    assert len(saved["results"]) == 3
+    assert "Cheapest run" in capsys.readouterr().out
+# -----------------------------------------------------------------------